@@ -0,0 +1,117 @@
+"""Per-frame collision cost at 10, 100 and 1000 active sprites.
+
+    python benchmarks/bench_collision.py
+
+Hazards (kucing / burung sized) sit on a track ahead of the player, 30 px
+apart on average, like a dense custom mode queueing spawns off-screen. Each
+frame does one player query plus one query per projectile (N / 10 of them).
+Compared:
+
+  spritecollide  pygame.sprite.spritecollide per query (the old code path)
+  linear         list comprehension of colliderect per query
+  sweep          limit_runner.collision.Collider (sorted-by-x broad phase)
+  sweep+mask     the same with mask narrow phase on the rect hits
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from limit_runner import collision
+from limit_runner.collision import Collider
+from limit_runner.simulation import OBSTACLE_MAX_WIDTH, OBSTACLE_SIZES, Obstacle, Player
+
+FRAMES = 200
+
+
+class Probe:
+    """A projectile-sized query box."""
+    kind = 'probe'
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 20, 10)
+
+
+def make_world(n, rng):
+    hazards = []
+    for _ in range(n):
+        collision.insert(hazards, Obstacle(rng.choice(['kucing', 'kucing', 'burung']), rng.randint(0, n * 30)))
+    probes = [Probe(rng.randint(0, n * 30), rng.randint(150, 390)) for _ in range(max(1, n // 10))]
+    return hazards, [Player()] + probes
+
+
+def as_sprites(hazards):
+    group = pygame.sprite.Group()
+    for h in hazards:
+        s = pygame.sprite.Sprite()
+        s.rect = h.rect
+        group.add(s)
+    return group
+
+
+def masks():
+    # elliptic hazards, solid player / projectiles
+    out = {}
+    for kind, size in OBSTACLE_SIZES.items():
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, 'white', surf.get_rect())
+        out[kind] = pygame.mask.from_surface(surf)
+    out['player'] = pygame.mask.Mask((120, 155), fill=True)
+    out['probe'] = pygame.mask.Mask((20, 10), fill=True)
+    return out
+
+
+def run(n):
+    rng = random.Random(n)
+    hazards, queries = make_world(n, rng)
+    group = as_sprites(hazards)
+    sprite_queries = []
+    for q in queries:
+        s = pygame.sprite.Sprite()
+        s.rect = q.rect
+        sprite_queries.append(s)
+    plain = Collider()
+    masked = Collider(masks())
+
+    def spritecollide():
+        for s in sprite_queries:
+            pygame.sprite.spritecollide(s, group, False)
+
+    def linear():
+        for q in queries:
+            r = q.rect
+            [h for h in hazards if r.colliderect(h.rect)]
+
+    def sweep():
+        for q in queries:
+            plain.collide(q, hazards, OBSTACLE_MAX_WIDTH)
+
+    def sweep_mask():
+        for q in queries:
+            masked.collide(q, hazards, OBSTACLE_MAX_WIDTH)
+
+    results = {}
+    for name, fn in (('spritecollide', spritecollide), ('linear', linear),
+                     ('sweep', sweep), ('sweep+mask', sweep_mask)):
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            fn()
+        results[name] = (time.perf_counter() - start) / FRAMES * 1000
+    return len(queries), results
+
+
+def main():
+    print(f'{"sprites":>8} {"queries":>8} ' + ' '.join(f'{n:>14}' for n in
+          ('spritecollide', 'linear', 'sweep', 'sweep+mask')) + '   (ms / frame)')
+    for n in (10, 100, 1000):
+        q, res = run(n)
+        print(f'{n:>8} {q:>8} ' + ' '.join(f'{v:>14.4f}' for v in res.values()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Leaderboard operations at 10k players: Leaderboard vs rebuilding a sorted list.
+
+    python benchmarks/bench_leaderboard.py [--players 10000]
+
+"rebuild" is what the menu used to do every frame: copy the entries, sort
+them and scan for the player's rank.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limit_runner.leaderboard import Leaderboard
+
+QUERIES = 2000
+
+
+def per_call_us(fn, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=10_000)
+    args = parser.parse_args(argv)
+    n = args.players
+
+    rng = random.Random(1)
+    names = [f'player{i}' for i in range(n)]
+    rows = [(name, rng.randint(0, 100), rng.randint(0, 50_000)) for name in names]
+    board = Leaderboard()
+
+    results = {}
+    results['insert'] = per_call_us(lambda i: board.record(*rows[i]), n)
+    # improve a random player's bests
+    results['update'] = per_call_us(
+        lambda i: board.record(names[i % n], 100 + i, 50_000 + i), QUERIES)
+    results['top 5'] = per_call_us(lambda i: board.top(5, 'score'), QUERIES)
+    results['rank'] = per_call_us(lambda i: board.rank(names[(i * 7919) % n], 'score'), QUERIES)
+
+    entries = [(name, board.best(name, 'score')) for name in names]
+
+    def rebuild(i):
+        you = names[(i * 7919) % n]
+        ranked = sorted(entries.copy(), key=lambda e: e[1], reverse=True)
+        ranked[:5]
+        for idx, e in enumerate(ranked, start=1):
+            if e[0] == you:
+                break
+
+    results['rebuild (old menu frame)'] = per_call_us(rebuild, 50)
+
+    print(f'{n} players')
+    for name, us in results.items():
+        print(f'{name:>26} {us:>12.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Per-step cost of geprek wave motion and shield orbiters, per-sprite vs NumPy.
+
+    python benchmarks/bench_motion.py
+"""
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limit_runner.motion import HAVE_NUMPY, BatchShield, WaveBatch
+from limit_runner.simulation import (GROUND_Y, SHIELD_DURATION_MS, SHIELD_ITEM_SIZE, SHIELD_RADIUS,
+                                     SHIELD_ROTATE_SPEED, TICK_MS, TICK_RATE, Geprek, Player, Shield)
+
+STEPS = 300
+
+
+def gepreks(n):
+    # spread along the x axis far enough that none leaves the screen during the run
+    out = []
+    for i in range(n):
+        g = Geprek(300 + (i % 4) * 30, phase=i * math.pi / 7)
+        g.rect.x += STEPS * 8 + i
+        g.start_x = g.rect.x
+        out.append(g)
+    return out
+
+
+def time_steps(fn):
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        fn()
+    return (time.perf_counter() - start) / STEPS * 1000
+
+
+def bench_waves(n):
+    per_sprite = gepreks(n)
+
+    def python_path():
+        for g in per_sprite:
+            g.update()
+
+    result = {'python': time_steps(python_path)}
+    if HAVE_NUMPY:
+        batched = gepreks(n)
+        batch = WaveBatch(GROUND_Y - 2)
+        result['numpy'] = time_steps(lambda: batch.step(batched))
+    return result
+
+
+def bench_shield(count):
+    player = Player()
+    shield = Shield(player, count=count, duration_ms=SHIELD_DURATION_MS * 1000)
+    result = {'python': time_steps(lambda: shield.update(TICK_MS))}
+    if HAVE_NUMPY:
+        batch = BatchShield(player, count, SHIELD_RADIUS, SHIELD_DURATION_MS * 1000,
+                            SHIELD_ROTATE_SPEED / TICK_RATE, SHIELD_ITEM_SIZE)
+        result['numpy'] = time_steps(lambda: batch.update(TICK_MS))
+    return result
+
+
+def main():
+    if not HAVE_NUMPY:
+        print('NumPy not installed: only the per-sprite path is measured')
+    print(f'{"":>22} {"python":>10} {"numpy":>10}   (ms / step)')
+    for n in (10, 100, 1000):
+        r = bench_waves(n)
+        print(f'{f"gepreks x{n}":>22} {r["python"]:>10.4f} {r.get("numpy", float("nan")):>10.4f}')
+    for n in (8, 32, 128):
+        r = bench_shield(n)
+        print(f'{f"shield orbiters x{n}":>22} {r["python"]:>10.4f} {r.get("numpy", float("nan")):>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
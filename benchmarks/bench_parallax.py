@@ -0,0 +1,61 @@
+"""Background draw cost per frame: full-size layer blits vs the parallax layers.
+
+    python benchmarks/bench_parallax.py
+
+"full" is the old draw_background(): the 800x490 lake, two 720x480 ground
+blits, the 950x635 tiang and two 720x480 clouds, all with per-pixel alpha.
+"parallax" is the game's own layer table (limit_runner.app.build_parallax),
+from the start of a run: tiang and the clouds cross the screen once.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from limit_runner.app import build_parallax
+from limit_runner.assets import AssetRegistry
+from limit_runner.atlas import PACK_FILE
+from limit_runner.simulation import TICK_MS
+
+FRAMES = 300
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((720, 480))
+    assets = AssetRegistry(pack=PACK_FILE)
+    danau = assets.image('assets/danau.png', (800, 490))
+    tanah = assets.image('assets/tanah.png')
+    tiang = assets.image('assets/tiang.png', (950, 635))
+    awan1 = assets.image('assets/awan1.png')
+    awan2 = assets.image('assets/awan2.png')
+
+    def full(i):
+        x = -(i * 8 % 720)
+        screen.blit(danau, (0, 0))
+        screen.blit(tanah, (x, 0))
+        screen.blit(tanah, (x + 720, 0))
+        screen.blit(tiang, (720 - i * 8 % 1670, -140))
+        screen.blit(awan1, (720 - i, 0))
+        screen.blit(awan2, (720 - i, 0))
+
+    parallax = build_parallax(assets)
+
+    def layers(i):
+        parallax.update(TICK_MS)
+        parallax.draw(screen, 0.5)
+
+    for name, fn in (('full', full), ('parallax', layers)):
+        start = time.perf_counter()
+        for i in range(FRAMES):
+            fn(i)
+        print(f'{name:>10} {(time.perf_counter() - start) / FRAMES * 1000:8.3f} ms / frame')
+    print(parallax.report())
+
+
+if __name__ == '__main__':
+    main()
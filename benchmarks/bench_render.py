@@ -0,0 +1,124 @@
+"""Sprite drawing per frame: one blit() call per sprite vs the render queue.
+
+    python benchmarks/bench_render.py
+
+Each scene is a world holding the given number of obstacles, gepreks and
+shield orbiters on screen, drawn with the game's sprites (optimized like in
+the game) at in-between positions. "direct" is the old draw path, one
+``screen.blit`` per sprite; "queued" submits them to a RenderQueue and
+flushes it (one ``blits`` call per layer). The last two columns repeat both
+with 1x1 sprites, which leaves mostly the cost of the calls themselves.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from limit_runner import collision
+from limit_runner import simulation as sim
+from limit_runner.assets import AssetRegistry
+from limit_runner.renderqueue import RenderQueue
+from limit_runner.simulation import Simulation
+from limit_runner.surfaces import optimize
+
+FRAMES = 300
+ALPHA = 0.5
+# (obstacles, gepreks, shield orbiters)
+SCENES = [(2, 1, 0), (8, 8, 8), (64, 64, 128), (256, 256, 512)]
+
+
+def scene(obstacles, gepreks, orbiters):
+    world = Simulation(shield_count=max(orbiters, 1))
+    world.reset(1)
+    for i in range(obstacles):
+        o = world.obstacle_pool.acquire('burung' if i % 2 else 'kucing', 200 + (i * 2) % 500)
+        collision.insert(world.obstacles, o)
+    for i in range(gepreks):
+        world.spawn_geprek()
+    if orbiters:
+        world.shield = world.new_shield()
+    # not stepped: everything stays where it was put, on screen
+    return world
+
+
+def lerp_pos(prev, rect, alpha):
+    return (prev[0] + (rect.x - prev[0]) * alpha, prev[1] + (rect.y - prev[1]) * alpha)
+
+
+def sprites(assets, tiny):
+    def load(path, size):
+        image = optimize(assets.image(path, size))
+        return pygame.Surface((1, 1)).convert() if tiny else image
+    return {
+        'player': load('assets/idle1.png', sim.PLAYER_SIZE),
+        'burung': load('assets/burung1.png', sim.OBSTACLE_SIZES['burung']),
+        'kucing': load('assets/kucing1.png', sim.OBSTACLE_SIZES['kucing']),
+        'geprek': load('assets/geprek.png', sim.GEPREK_SIZE),
+        'orbiter': load('assets/geprek.png', sim.SHIELD_ITEM_SIZE),
+        'heart': load('assets/heart.png', (40, 40)),
+    }
+
+
+def direct(screen, world, images):
+    p = world.player
+    screen.blit(images['player'], lerp_pos(p.prev, p.rect, ALPHA))
+    for o in world.obstacles:
+        screen.blit(images[o.type], lerp_pos(o.prev, o.rect, ALPHA))
+    for g in world.gepreks:
+        screen.blit(images['geprek'], lerp_pos(g.prev, g.rect, ALPHA))
+    if world.shield is not None:
+        for pos in world.shield.positions(ALPHA):
+            screen.blit(images['orbiter'], pos)
+    for x in (680, 635, 590):
+        screen.blit(images['heart'], (x, 10))
+    return 0
+
+
+def queued(screen, world, images, queue):
+    p = world.player
+    queue.sprites.blit(images['player'], lerp_pos(p.prev, p.rect, ALPHA))
+    queue.sprites.blits([(images[o.type], lerp_pos(o.prev, o.rect, ALPHA)) for o in world.obstacles])
+    geprek = images['geprek']
+    queue.sprites.blits([(geprek, lerp_pos(g.prev, g.rect, ALPHA)) for g in world.gepreks])
+    if world.shield is not None:
+        orbiter = images['orbiter']
+        queue.effects.blits([(orbiter, pos) for pos in world.shield.positions(ALPHA)])
+    queue.hud.blits([(images['heart'], (x, 10)) for x in (680, 635, 590)])
+    return queue.flush(screen)[1]
+
+
+def per_frame_ms(fn):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode((720, 480))
+    assets = AssetRegistry()
+    images = sprites(assets, tiny=False)
+    tiny = sprites(assets, tiny=True)
+    queue = RenderQueue()
+    print(f'{"obst/gep/orb":>14} {"blits":>6} {"calls":>6}   {"direct":>9} {"queued":>9}   '
+          f'{"1x1 direct":>10} {"1x1 queued":>10}')
+    for obstacles, gepreks, orbiters in SCENES:
+        world = scene(obstacles, gepreks, orbiters)
+        calls = queued(screen, world, images, queue)
+        blits = queue.submitted
+        results = [per_frame_ms(lambda: direct(screen, world, images)),
+                   per_frame_ms(lambda: queued(screen, world, images, queue)),
+                   per_frame_ms(lambda: direct(screen, world, tiny)),
+                   per_frame_ms(lambda: queued(screen, world, tiny, queue))]
+        print(f'{f"{obstacles}/{gepreks}/{orbiters}":>14} {blits:>6} {calls:>6}   '
+              f'{results[0]:>6.3f} ms {results[1]:>6.3f} ms   {results[2]:>7.3f} ms {results[3]:>7.3f} ms')
+    print('fblits' if hasattr(screen, 'fblits') else 'blits(doreturn=False) (no fblits: not pygame-ce)')
+
+
+if __name__ == '__main__':
+    main()
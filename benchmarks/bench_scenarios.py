@@ -0,0 +1,266 @@
+"""Scripted headless scenarios of the real game loop, checked against a baseline.
+
+    python benchmarks/bench_scenarios.py                    # run all, compare
+    python benchmarks/bench_scenarios.py menu_idle quiz     # some of them
+    python benchmarks/bench_scenarios.py --update-baseline  # store this machine's numbers
+
+Each scenario runs the game (limitrunner.py) in its own process under
+SDL_VIDEODRIVER=dummy. Input (clicks, space key down / up) is injected
+through pygame.event.get, the clock hands out exactly one 60 Hz step per frame
+without sleeping, and the runs are seeded (--seed), so every run plays the same
+frames as fast as the CPU allows. After a warm-up the frame profiler
+(limit_runner.profiler) records the work time of every frame.
+
+Reported per scenario: ms/frame p50/p95/p99, blits per frame, net
+allocated blocks per frame (growth of sys.getallocatedblocks(), not the
+allocation churn; gen-0 collections show that), gen-0 collections per 1000 frames, peak RSS and
+startup time (launch to first frame). The exit status is 1 when a p95/p99
+or the peak RSS is worse than the baseline by more than the tolerance.
+"""
+import argparse
+import array
+import gc
+import json
+import os
+import random
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+# name -> (warm-up frames, measured frames, description)
+SCENARIOS = {
+    'menu_idle': (30, 600, 'main menu, no input'),
+    'leaderboard': (30, 600, 'menu with the leaderboard panel open'),
+    'normal_run': (120, 900, 'regular run, jumping now and then'),
+    'dense_obstacles': (240, 900, 'an obstacle every 100 ms'),
+    'shield_orbiters': (120, 900, 'shield up all the time with 128 orbiters'),
+    'quiz': (60, 600, 'quiz page with the countdown running'),
+}
+# metric -> (relative, absolute) tolerance: a scenario fails when a metric is
+# above both baseline * (1 + relative) and baseline + absolute (sub-ms frame
+# times are mostly timer noise)
+TOLERANCE = {'p95': (0.50, 0.25), 'p99': (0.75, 0.5), 'peak_rss_kb': (0.20, 5 * 1024)}
+
+
+# -----------------------
+# child: one scenario inside the game process
+# -----------------------
+class StepClock:
+    """pygame.time.Clock stand-in: every frame is one simulation step, no waiting."""
+
+    def tick(self, framerate=0):
+        return 1000 / 60
+
+    def get_fps(self):
+        return 0.0
+
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:   # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def run_child(name, result_path):
+    launched = time.perf_counter()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    sys.path.insert(0, ROOT)
+    import pygame
+    from limit_runner import simulation
+
+    warmup, measured, _ = SCENARIOS[name]
+    # runs never end on their own: a death would change what is being measured
+    simulation.MAX_LIVES = 10 ** 6
+    if name == 'dense_obstacles':
+        simulation.OBSTACLE_INTERVAL_MS = 100
+    if name == 'quiz':
+        simulation.QUIZ_INTERVAL_MS = 500
+    if name != 'quiz':
+        simulation.QUIZ_INTERVAL_MS = 10 ** 9
+
+    state = {'frame': 0, 'startup': None, 'blits': 0}
+    work = array.array('d', bytes(8 * measured))
+    result = {}
+    real_get = pygame.event.get
+
+    def click(rect):
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=rect.center)
+
+    def get(*args, **kwargs):
+        events = real_get(*args, **kwargs)
+        g = sys.modules['limit_runner.app'].__dict__   # the game's globals
+        frame = state['frame']
+        state['frame'] += 1
+        # space held for one frame every jump_every
+        if frame % jump_every == 0:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        elif frame % jump_every == 1:
+            events.append(pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE))
+        if frame == 0:
+            state['startup'] = time.perf_counter() - launched
+            random.seed(1)
+            if name not in ('menu_idle', 'leaderboard'):
+                events.append(click(g['button_play'].rect))
+            if name == 'leaderboard':
+                events.append(click(g['button_leader'].rect))
+        world = g['world']   # built once Play is clicked
+        if name == 'shield_orbiters' and world is not None:
+            world.shield_count = 128
+            if world.shield is None and world.state == simulation.RUNNING:
+                world.shield = world.new_shield()
+
+        profiler = g['profiler']
+        if warmup < frame <= warmup + measured:
+            # the frame that just ended; stored without allocating, so the
+            # block count below is the game's own
+            work[frame - warmup - 1] = profiler.last['frame']
+            state['blits'] += profiler.last['blits']
+        if frame == warmup - 1:
+            # profiles from the next frame on (this one has already started)
+            # the rolling windows would keep every measured frame alive
+            for key in profiler.recent:
+                profiler.recent[key] = deque(maxlen=1)
+            gc.collect()
+            profiler.enabled = True
+            state['blocks'] = sys.getallocatedblocks()
+            state['gen0'] = gc.get_stats()[0]['collections']
+        elif frame == warmup + measured:
+            n = measured
+            blocks = sys.getallocatedblocks() - state['blocks']
+            gen0 = gc.get_stats()[0]['collections'] - state['gen0']
+            ordered = sorted(work)
+            result.update({
+                'frames': n,
+                'mean': sum(ordered) / n,
+                'p50': ordered[n // 2],
+                'p95': ordered[min(n - 1, int(n * 0.95))],
+                'p99': ordered[min(n - 1, int(n * 0.99))],
+                'blits_per_frame': state['blits'] / n,
+                'net_blocks_per_frame': blocks / n,   # allocated minus freed, not churn
+                'gen0_per_1000_frames': gen0 * 1000 / n,
+                'peak_rss_kb': peak_rss_kb(),
+                'startup_s': state['startup'],
+            })
+            with open(result_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            events.append(pygame.event.Event(pygame.QUIT))
+        return events
+
+    pygame.event.get = get
+    jump_every = 45
+    pygame.time.Clock = StepClock
+
+    # the save file and anything else relative to the cwd stays out of the repo
+    os.chdir(tempfile.mkdtemp(prefix='limitrunner-bench-'))
+    # the runs are seeded: every scenario plays the same obstacles each time
+    sys.argv = ['limitrunner.py', '--seed', '1']
+    try:
+        runpy.run_path(os.path.join(ROOT, 'limitrunner.py'), run_name='__main__')
+    except SystemExit:
+        pass
+
+
+# -----------------------
+# parent: run, print, compare
+# -----------------------
+def run_scenario(name):
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', name, '--result', path],
+                              capture_output=True, text=True)
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        if proc.returncode != 0 or not text:
+            raise RuntimeError(f'scenario {name} failed:\n{proc.stdout}\n{proc.stderr}')
+        return json.loads(text)
+    finally:
+        os.remove(path)
+
+
+def compare(name, result, baseline):
+    base = baseline.get(name)
+    if base is None:
+        return []
+    failures = []
+    for metric, (relative, absolute) in TOLERANCE.items():
+        if result.get(metric) is None or base.get(metric) is None:
+            continue
+        limit = max(base[metric] * (1 + relative), base[metric] + absolute)
+        if result[metric] > limit:
+            failures.append(f'{name}: {metric} {result[metric]:.2f} > {limit:.2f} '
+                            f'(baseline {base[metric]:.2f})')
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', help=f'default: all of {", ".join(SCENARIOS)}')
+    parser.add_argument('--update-baseline', action='store_true', help=f'write the results to {BASELINE}')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child, args.result)
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f'unknown scenario(s): {", ".join(unknown)}')
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print(f'{"scenario":<16} {"p50":>6} {"p95":>6} {"p99":>6} {"blits":>6} {"net blk":>7} '
+          f'{"gen0/1k":>7} {"rss MB":>7} {"start s":>7}   (ms / frame)')
+    results = {}
+    failures = []
+    for name in names:
+        r = run_scenario(name)
+        if compare(name, r, baseline):
+            # one noisy run (another process, a page fault burst) is not a
+            # regression: keep the better of two runs
+            again = run_scenario(name)
+            if again['p95'] < r['p95']:
+                r = again
+        results[name] = r
+        rss = f'{r["peak_rss_kb"] / 1024:7.1f}' if r['peak_rss_kb'] is not None else f'{"-":>7}'
+        print(f'{name:<16} {r["p50"]:>6.2f} {r["p95"]:>6.2f} {r["p99"]:>6.2f} {r["blits_per_frame"]:>6.1f} '
+              f'{r["net_blocks_per_frame"]:>7.2f} {r["gen0_per_1000_frames"]:>7.1f} {rss} {r["startup_s"]:>7.2f}')
+        failures += compare(name, r, baseline)
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print('baseline written to', args.baseline)
+        return 0
+    if not baseline:
+        print('no baseline yet: run with --update-baseline')
+        return 0
+    if failures:
+        print('REGRESSION:')
+        for line in failures:
+            print('  ' + line)
+        return 1
+    print('ok: within the baseline tolerances')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
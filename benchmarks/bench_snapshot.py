@@ -0,0 +1,89 @@
+"""Size and cost of world snapshots (snapshot.py) against get_state() / set_state().
+
+    python benchmarks/bench_snapshot.py
+
+Each scene is a running world filled with the given number of obstacles,
+gepreks and shield orbiters. ``get_state`` sizes are the pickled bytes (what
+a replay keyframe stores before zlib) and the objects held in memory;
+snapshot sizes are ``Snapshot.nbytes()``. The last column is the memory of a
+full 10 s rewind buffer of such snapshots (600 of them).
+"""
+import os
+import pickle
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limit_runner import collision
+from limit_runner.simulation import NO_INPUT, TICK_MS, TICK_RATE, Simulation
+from limit_runner.snapshot import capture, restore
+
+REPEAT = 2000
+# (obstacles, gepreks, shield orbiters)
+SCENES = [(2, 1, 0), (8, 8, 8), (64, 64, 128), (256, 256, 512)]
+
+
+def deep_size(obj, seen=None):
+    # bytes of the objects reachable from obj (containers and their items)
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(v, seen) for v in obj)
+    return size
+
+
+def scene(obstacles, gepreks, orbiters):
+    sim = Simulation(shield_count=max(orbiters, 1))
+    sim.reset(1)
+    for i in range(obstacles):
+        o = sim.obstacle_pool.acquire('burung' if i % 2 else 'kucing', 800 + i * 3)
+        collision.insert(sim.obstacles, o)
+    for i in range(gepreks):
+        sim.spawn_geprek()
+    if orbiters:
+        sim.shield = sim.new_shield()
+    # a few steps so every field holds a mid-run value (but nothing is due to leave yet)
+    for _ in range(3):
+        sim.step(TICK_MS, NO_INPUT)
+    return sim
+
+
+def per_call_us(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+def main():
+    print(f'{"obst/gep/orb":>14} {"state pickled":>13} {"state in mem":>12} {"snapshot":>9}   '
+          f'{"get_state":>9} {"set_state":>9} {"capture":>8} {"restore":>8}   {"10 s ring":>9}')
+    for obstacles, gepreks, orbiters in SCENES:
+        sim = scene(obstacles, gepreks, orbiters)
+        state = sim.get_state()
+        snap = capture(sim)
+        assert pickle.dumps(sim.get_state()) == pickle.dumps(state)
+
+        t_get = per_call_us(sim.get_state)
+        t_set = per_call_us(lambda: sim.set_state(state))
+        t_capture = per_call_us(lambda: capture(sim, snap))
+        t_restore = per_call_us(lambda: restore(sim, snap))
+        assert pickle.dumps(sim.get_state()) == pickle.dumps(state)
+
+        ring = snap.nbytes() * 10 * TICK_RATE
+        print(f'{f"{obstacles}/{gepreks}/{orbiters}":>14} {len(pickle.dumps(state, protocol=4)):>11} B '
+              f'{deep_size(state):>10} B {snap.nbytes():>7} B   '
+              f'{t_get:>6.1f} us {t_set:>6.1f} us {t_capture:>5.1f} us {t_restore:>5.1f} us   '
+              f'{ring / 1024:>6.0f} KB')
+
+
+if __name__ == '__main__':
+    main()
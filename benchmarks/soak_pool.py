@@ -0,0 +1,61 @@
+"""Soak test for the obstacle / geprek pools.
+
+    python benchmarks/soak_pool.py [--minutes 60]
+
+Plays back-to-back headless games for the given amount of game time and
+prints, once per game minute, how many entities the pools have ever
+allocated plus the gc collection counts. After warm-up the allocation
+counts must stay flat; the script exits with status 1 if they keep growing.
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limit_runner.headless import jump_policy
+from limit_runner.simulation import OVER, TICK_MS, TICK_RATE, Simulation
+
+WARMUP_MINUTES = 5
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=int, default=60, help='game time to simulate')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    sim = Simulation(rng=rng)
+    steps_per_minute = TICK_RATE * 60
+    games = 1
+    after_warmup = None
+
+    print(f'{"minute":>6} {"games":>6} {"obst live":>9} {"obst alloc":>10} '
+          f'{"gep live":>8} {"gep alloc":>9} {"gc gen0/1/2":>16}')
+    for minute in range(1, args.minutes + 1):
+        for _ in range(steps_per_minute):
+            if sim.state == OVER:
+                sim.reset()
+                games += 1
+            sim.step(TICK_MS, jump_policy(sim, rng))
+        pools = sim.pool_stats()
+        gcs = '/'.join(str(g['collections']) for g in gc.get_stats())
+        print(f'{minute:>6} {games:>6} {pools["obstacle"]["live"]:>9} {pools["obstacle"]["allocated"]:>10} '
+              f'{pools["geprek"]["live"]:>8} {pools["geprek"]["allocated"]:>9} {gcs:>16}')
+        if minute == WARMUP_MINUTES:
+            after_warmup = (pools["obstacle"]["allocated"], pools["geprek"]["allocated"])
+
+    final = (pools["obstacle"]["allocated"], pools["geprek"]["allocated"])
+    if after_warmup is not None and final != after_warmup:
+        print(f'FAIL: pools kept allocating after warm-up: {after_warmup} -> {final}')
+        return 1
+    print('ok: allocations flat after warm-up')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
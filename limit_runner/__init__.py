@@ -0,0 +1 @@
+"""Limit Runner: the game (app.py, started by limitrunner.py) and its support modules."""
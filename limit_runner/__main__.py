@@ -0,0 +1,3 @@
+from limit_runner.app import main
+
+main()
@@ -0,0 +1,921 @@
+"""The game: window, input and drawing around limit_runner.simulation.
+
+    python limitrunner.py [--fps 144] [--dirty] [--seed N] ...
+    python -m limit_runner ...
+
+Importing this module does nothing; ``main()`` brings the game up in stages
+so the menu shows as early as possible:
+
+1. only the display and font modules are started (``pygame.init()`` would
+   also open the audio device, joysticks, ... that the game never uses)
+2. the menu: its fonts, background, buttons and the leaderboard
+3. the in-game sprites start decoding on a thread pool, and the menu runs
+   while they do; Play collects them, waiting only for what is unfinished
+   (with a built sprite pack only the small sprites are decoded; the
+   background and layer images are mapped from it)
+
+The milestones (first menu frame, Play, first gameplay frame) are printed
+with the other reports on exit.
+"""
+import argparse
+import os
+import random
+import time
+from sys import exit
+
+import pygame
+
+from limit_runner.assets import ROOT_DIR, AssetRegistry
+from limit_runner.atlas import PACK_FILE
+from limit_runner.controls import Controls, block_unused
+from limit_runner.dirtyrects import DirtyRects
+from limit_runner.leaderboard import Leaderboard
+from limit_runner.parallax import Layer, Parallax
+from limit_runner.persistence import SaveService
+from limit_runner.profiler import FrameProfiler, ProfilerOverlay, StartupTimer
+from limit_runner.quality import LEVEL_NAMES, QualityGovernor
+from limit_runner.renderqueue import RenderQueue
+from limit_runner.replay import Replay, ReplayWriter, decode_inputs
+from limit_runner.snapshot import RewindBuffer, capture, restore
+from limit_runner.text import CounterText, TextCache, wrap_text
+from limit_runner import simulation as sim
+from limit_runner.simulation import Inputs, Simulation
+from limit_runner.timestep import FixedTimestep
+
+# -----------------------
+# command line: render rate is free, the simulation always runs at 60 Hz
+# -----------------------
+arg_parser = argparse.ArgumentParser(description='Limit Runner')
+arg_parser.add_argument('--fps', type=int, default=60, help='render frame rate, e.g. 30, 60 or 144')
+arg_parser.add_argument('--dirty', action='store_true', help='dirty-rect rendering: static screens are drawn once')
+arg_parser.add_argument('--quality', default='auto', choices=['auto'] + LEVEL_NAMES,
+                        help='render detail; auto steps down when frames run over budget (default)')
+arg_parser.add_argument('--raw-surfaces', action='store_true',
+                        help='keep every image as decoded (per-pixel alpha, no RLE), for comparison')
+arg_parser.add_argument('--pixel-collision', action='store_true', help='pixel-accurate hits using sprite masks')
+arg_parser.add_argument('--player', default='You', help='name the runs are recorded under on the leaderboard')
+arg_parser.add_argument('--profile', action='store_true', help='start with the frame profiler overlay on (F3 toggles it)')
+arg_parser.add_argument('--profile-out', metavar='PATH', help='profile every frame and write them to PATH (.csv or .json) on exit')
+arg_parser.add_argument('--seed', type=int, help='session seed: the runs of a session are reproducible')
+arg_parser.add_argument('--record', metavar='PATH', help='record every run to PATH (later runs: PATH-2, PATH-3, ...)')
+arg_parser.add_argument('--replay', metavar='PATH', help='play back a recorded run instead of reading the keyboard')
+arg_parser.add_argument('--seek', type=float, default=0, metavar='SECONDS', help='with --replay: start this far into the run')
+arg_parser.add_argument('--rewind', type=float, default=0, metavar='SECONDS',
+                        help='debug: keep the last SECONDS of a run; hold Backspace to rewind, R restarts the run')
+
+# -----------------------
+# >>> CHANGED: persistence file for player's bests
+# -----------------------
+# next to the assets, wherever the game is started from
+SAVE_FILE = os.path.join(ROOT_DIR, "leaderboard_save.json")
+
+# -----------------------
+# Sprite frames and drawing
+# -----------------------
+# The game rules (physics, spawns, shield, quiz, lives, score) live in
+# limit_runner/simulation.py; this file only turns the world into pixels.
+GEPREK_PATH = 'assets/geprek.png'
+HEART_SIZE = (40, 40)
+# what the first menu frame needs, loaded before it
+MENU_ASSETS = [
+    ('assets/heart.png', None),
+    ('assets/menu_bg.png', None),
+]
+# the rest, decoded in the background while the menu is up, so spawning
+# sprites never touches the disk; the sprites are drawn as they are, the
+# layer images are cropped by their parallax Layer
+SPRITE_ASSETS = [
+    ('assets/run1.png', sim.PLAYER_SIZE),
+    ('assets/run2.png', sim.PLAYER_SIZE),
+    ('assets/idle1.png', sim.PLAYER_SIZE),
+    ('assets/jump1.png', sim.PLAYER_SIZE),
+    ('assets/burung1.png', sim.OBSTACLE_SIZES['burung']),
+    ('assets/burung2.png', sim.OBSTACLE_SIZES['burung']),
+    ('assets/kucing1.png', sim.OBSTACLE_SIZES['kucing']),
+    ('assets/kucing2.png', sim.OBSTACLE_SIZES['kucing']),
+    (GEPREK_PATH, sim.GEPREK_SIZE),
+    (GEPREK_PATH, sim.SHIELD_ITEM_SIZE),
+    ('assets/heart.png', HEART_SIZE),
+]
+LAYER_ASSETS = [
+    ('assets/tanah.png', None),
+    ('assets/awan1.png', None),
+    ('assets/awan2.png', None),
+    ('assets/danau.png', (800, 490)),
+    ('assets/tiang.png', (950, 635)),
+]
+GAME_ASSETS = SPRITE_ASSETS + LAYER_ASSETS
+
+# Sprites are drawn between their last two simulation positions; alpha is how
+# far the render time is into the current step (0..1). During gameplay
+# ``surface`` is a layer of the render queue (limit_runner/renderqueue.py).
+def lerp_pos(prev, rect, alpha):
+    return (prev[0] + (rect.x - prev[0]) * alpha, prev[1] + (rect.y - prev[1]) * alpha)
+
+def draw_player(surface, p, alpha):
+    # walk cycle, then the jump pose (sim.JUMP_FRAME)
+    surface.blit(player_frames[p.frame], lerp_pos(p.prev, p.rect, alpha))
+
+def draw_obstacles(surface, obstacles, alpha):
+    surface.blits([(obstacle_frames[o.type][o.frame], lerp_pos(o.prev, o.rect, alpha))
+                   for o in obstacles])
+
+def draw_gepreks(surface, gepreks, alpha):
+    surface.blits([(geprek_image, lerp_pos(g.prev, g.rect, alpha)) for g in gepreks])
+
+def draw_shield(surface, shield, alpha):
+    # draw each small geprek (lower quality levels: every n-th)
+    positions = shield.positions(alpha)[::governor.quality.orbiter_step]
+    surface.blits([(shield_item_image, pos) for pos in positions])
+
+# -----------------------
+# UI helper: simple Button
+# -----------------------
+class Button:
+    def __init__(self, rect, text, font, action=None):
+        self.rect = pygame.Rect(rect)
+        self.text = text
+        self.font = font
+        self.action = action
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, (50, 50, 100), self.rect)
+        pygame.draw.rect(surface, (200, 200, 200), self.rect, 3)
+        txt_surf = text_cache.render(self.font, self.text, True, 'White')
+        txt_rect = txt_surf.get_rect(center=self.rect.center)
+        surface.blit(txt_surf, txt_rect)
+        profiler.count('blits')
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
+
+# -----------------------
+# Score / quiz / health etc.
+# -----------------------
+def display_score(surface):
+    global current_time
+    # current_time is the value we use as "score" (hundredths of a second of play, quiz excluded)
+    current_time = world.score
+    score_surface = score_text.render(current_time)
+    score_rect = score_surface.get_rect(center = (360, 50))
+    surface.blit(score_surface,score_rect)
+
+def display_quiztimer(surface):
+    seconds_left = max(0, world.quiz_in_ms) / 1000.0
+    quiztimer_surf = quiz_in_text.render(seconds_left)
+    quiztimer_rect = quiztimer_surf.get_rect(topleft=(10, 10))
+    surface.blit(quiztimer_surf, quiztimer_rect)
+
+# >>> CHANGED: handle game end and persist bests
+def end_game():
+    global current_time
+    global game_state_active, game_over   # <<< TAMBAHKAN INI !!!
+
+    final_score = world.score
+    final_answers = world.correct_answers
+    current_time = final_score
+
+    finish_recording()
+    if playback is None:
+        # queued, not written here: the game over frame does not wait on the disk
+        save_store.record_run(final_score, final_answers, player=PLAYER_NAME)
+        leaderboard.record(PLAYER_NAME, final_answers, final_score)
+
+    game_state_active = False
+    game_over = True   # <<< BARU SEKARANG MENJADI GLOBAL
+
+def jawaban(playerAnswer: bool):
+    # the answer is handed to the simulation on the next step
+    global quiz_answer
+    if quiz_answer is None:
+        quiz_answer = playerAnswer
+
+QUIZ_TEXT_WIDTH = 660
+QUIZ_FONT = 'assets/cambriamath.ttf'
+# long questions step down through these sizes until they fit
+QUIZ_FONT_SIZES = (20, 18, 16, 14)
+QUIZ_GAP = 16
+# lowest y of the question block, leaving room for the countdown under it
+QUIZ_BOTTOM = 440
+
+def layout_quiz_page(question):
+    # the whole quiz page (instruction + word-wrapped question) is rendered
+    # once when the question is drawn; every quiz frame is then one blit
+    global quiz_page
+    page = pygame.Surface((720, 480)).convert()
+    page.fill('White')
+    instruction_surf = text_cache.render(quiz_font, 'Jawab benar dengan ↑ atau salah dengan ↓', True, 'Black')
+    instruction_rect = instruction_surf.get_rect(center=(360, 130))
+    page.blit(instruction_surf, instruction_rect)
+
+    q_text = question[0] if question else "Question missing"
+    first = instruction_rect.bottom + QUIZ_GAP
+    for size in QUIZ_FONT_SIZES:
+        font = assets.font(QUIZ_FONT, size)
+        lines = wrap_text(font, q_text, QUIZ_TEXT_WIDTH)
+        line_h = font.get_linesize()
+        if first + line_h * len(lines) <= QUIZ_BOTTOM:
+            break
+    else:
+        # still too long at the smallest size: cut it, with room for the ellipsis
+        lines = lines[:(QUIZ_BOTTOM - first) // line_h]
+        words = lines[-1].split()
+        while len(words) > 1 and font.size(' '.join(words) + ' …')[0] > QUIZ_TEXT_WIDTH:
+            words.pop()
+        lines[-1] = ' '.join(words) + ' …'
+    # block centred on y=200, where the single line used to be, but never
+    # over the instruction or past the bottom
+    top = max(first, min(200 - line_h * len(lines) // 2, QUIZ_BOTTOM - line_h * len(lines)))
+    for i, line in enumerate(lines):
+        line_surf = font.render(line, True, 'Black')
+        page.blit(line_surf, line_surf.get_rect(midtop=(360, top + i * line_h)))
+    profiler.count('font_renders', len(lines))
+    # countdown below the question
+    timer_y = max(240, top + len(lines) * line_h + 20)
+    quiz_page = (question, page, timer_y)
+
+def quiz():
+    # static quiz page, drawn once per question in dirty-rect mode
+    if quiz_page is None or quiz_page[0] != world.current_question:
+        layout_quiz_page(world.current_question)
+    screen.blit(quiz_page[1], (0, 0))
+    profiler.count('blits')
+
+def draw_quiz_timer():
+    # countdown line under the question; returns the area it changed (or None)
+    global quiz_timer_rect
+    seconds_left = max(0, world.quiz_left_ms) / 1000.0
+    shown = quiz_countdown_text.text
+    timer_surf = quiz_countdown_text.render(seconds_left)
+    if quiz_countdown_text.text == shown and quiz_timer_rect and dirty.enabled:
+        return None
+    timer_rect = timer_surf.get_rect(center=(360, quiz_page[2]))
+    changed = timer_rect.union(quiz_timer_rect) if quiz_timer_rect else timer_rect
+    pygame.draw.rect(screen, 'White', changed)
+    screen.blit(timer_surf, timer_rect)
+    profiler.count('blits')
+    quiz_timer_rect = timer_rect
+    return changed
+
+def draw_game_over():
+    screen.fill((0, 0, 0))
+    over_surf = text_cache.render(font1, "GAME OVER", True, "White")
+    over_rect = over_surf.get_rect(center=(360, 160))
+    screen.blit(over_surf, over_rect)
+
+    score_surf = text_cache.render(font1, f"Your Score : {current_time}", True, "White")
+    score_rect = score_surf.get_rect(center=(360, 220))
+    screen.blit(score_surf, score_rect)
+
+    retry_surf = text_cache.render(font2, "Press ENTER to restart", True, "White")
+    retry_rect = retry_surf.get_rect(center=(360, 280))
+    screen.blit(retry_surf, retry_rect)
+
+    menu_surf = text_cache.render(font2, "Press ESC or M to go back to Menu", True, "White")
+    menu_rect = menu_surf.get_rect(center=(360, 320))
+    screen.blit(menu_surf, menu_rect)
+    profiler.count('blits', 4)
+
+
+
+# -----------------------
+# helper: start, restart & back-to-menu
+# -----------------------
+def begin_run():
+    # every run gets its own seed, so any run can be recorded and replayed;
+    # world.reset() is how every new run starts (Play, restart after game over).
+    # Snapshots are only for --rewind: the run's start is captured for R / retry_run
+    global recorder, run_count, playback_at, run_start
+    finish_recording()
+    controls.forget()
+    run_count += 1
+    playback_at = 0
+    if playback is not None:
+        playback_at = playback.seek(world, playback_start)
+        return
+    seed = session_rng.getrandbits(63)
+    world.reset(seed)
+    if args.record:
+        path = args.record if run_count == 1 else f'{args.record}-{run_count}'
+        recorder = ReplayWriter(path, world, seed)
+    if rewind is not None:
+        run_start = capture(world, run_start)
+        rewind.clear()
+        rewind.push(world)
+
+def retry_run():
+    # --rewind: the same run again from its first step, restored from a snapshot
+    global game_over, game_state_active, quiz_answer
+    restore(world, run_start)
+    controls.forget()
+    rewind.clear()
+    rewind.push(world)
+    parallax.reset()
+    timestep.reset()
+    quiz_answer = None
+    game_over = False
+    game_state_active = True
+
+def finish_recording():
+    global recorder
+    if recorder is not None:
+        recorder.close()
+        print('run recorded to', recorder.f.name, f'({recorder.ticks} steps)')
+        recorder = None
+
+def start_game():
+    global game_state_active
+    print('mulai main (clicked Play)')
+    startup.mark('play')
+    build_world()
+    load_game_assets()
+    begin_run()
+    game_state_active = True
+    parallax.reset()
+    timestep.reset()
+
+def restart_game():
+    global game_over, game_state_active
+    # fresh run with a new seed: lives, score, timers and moving things are reset by
+    # world.reset() in begin_run, not restored from a snapshot (that is retry_run, --rewind)
+    begin_run()
+    timestep.reset()
+    # set states
+    game_over = False
+    game_state_active = True
+
+def back_to_menu():
+    global game_over, game_state_active, show_leaderboard
+    # reset flags to menu (the world is reset when Play is clicked)
+    game_over = False
+    game_state_active = False
+    show_leaderboard = False
+    controls.forget()
+    # optionally reset background positions
+    parallax.reset()
+
+# -----------------------
+# Game state
+# -----------------------
+game_state_active = False
+game_over = False
+current_time = 0
+quiz_answer = None   # B/S key pressed, passed to the next world.step()
+quiz_timer_rect = None   # where the quiz countdown is on screen (dirty-rect mode)
+quiz_page = None   # (question, pre-rendered page, countdown y), see layout_quiz_page
+parallax = None   # built with the in-game assets, on the first Play
+
+# >>> LEADERBOARD FIXED ENTRIES (unchanged)
+leaderboard_answers = [
+    ("alexa", 6),
+    ("bobby", 8),
+    ("fauzan", 15),
+    ("kucing", 21),
+    ("mark xyz f(x)", 67),
+]
+leaderboard_scores = {
+    "alexa": 1000,
+    "bobby": 1400,
+    "fauzan": 3200,
+    "kucing": 5400,
+    "mark xyz f(x)": 10000,
+}
+
+show_leaderboard = False
+leaderboard_mode = 'answers'  # 'answers' or 'scores'
+LEADERBOARD_BOX = pygame.Rect(100, 60, 520, 380)
+LEADERBOARD_TOP = 5
+# rendered panel per tab, rebuilt only when the leaderboard changes
+leaderboard_panels = {}
+
+# -----------------------
+# startup, in stages (see the module docstring)
+# -----------------------
+def init_display():
+    global clock, screen, dirty, controls, render_queue
+    # only the modules the game uses
+    pygame.display.init()
+    pygame.font.init()
+    clock = pygame.time.Clock()
+    screen = pygame.display.set_mode((720, 480))
+    pygame.display.set_caption('Limit Runner')
+    dirty = DirtyRects(screen, enabled=args.dirty)
+    render_queue = RenderQueue()
+    # mouse motion, text input, most window events ... never reach the queue
+    block_unused()
+    controls = Controls()
+    startup.mark('display')
+
+def init_menu():
+    global assets, font1, font2, text_cache, score_text, quiz_in_text, correct_text, hud_counters
+    global profiler, profiler_overlay, show_profiler, save_store, leaderboard
+    global menu_bg, menu_bg_rect, button_play, button_leader, button_exit
+    # every image / font goes through the registry so it is decoded and scaled only once;
+    # with a built sprite pack (python -m limit_runner.atlas) images come from its mapped pages
+    assets = AssetRegistry(pack=PACK_FILE)
+    assets.preload(MENU_ASSETS)
+    if not args.raw_surfaces:
+        # opaque: no alpha to blend (the icon stays as it is)
+        assets.optimize([('assets/menu_bg.png', None)])
+    font1 = assets.font('assets/slkscr.ttf', 25)
+    font2 = assets.font('assets/slkscr.ttf', 20)
+    # rendered text is cached; HUD counters only re-render when their text changes
+    text_cache = TextCache()
+    score_text = CounterText(font1, '{}', False, 'White')
+    quiz_in_text = CounterText(font1, 'Quiz in: {:.1f}s', False, 'White')
+    correct_text = CounterText(font2, 'Jawaban Benar: {}', False, 'White')
+    hud_counters = (score_text, quiz_in_text, correct_text)   # + the quiz countdown, see load_game_assets
+    # frame phases / blits / font renders; near free while off
+    profiler = FrameProfiler(enabled=args.profile or bool(args.profile_out), keep_frames=bool(args.profile_out),
+                             font_renders=lambda: text_cache.misses + sum(c.renders for c in hud_counters))
+    profiler_overlay = ProfilerOverlay(profiler, assets.font('assets/slkscr.ttf', 14))
+    show_profiler = args.profile
+
+    # bests + journal of recent runs; written atomically on a background thread
+    save_store = SaveService(SAVE_FILE)
+    # fixed entries first, then every player from the save file
+    leaderboard = Leaderboard()
+    for name, answers in leaderboard_answers:
+        leaderboard.record(name, answers, leaderboard_scores[name])
+    leaderboard.load(save_store.players)
+    # the current player is listed (with 0) even before their first run
+    leaderboard.record(PLAYER_NAME, 0, 0)
+
+    pygame.display.set_icon(assets.image('assets/heart.png'))
+    menu_bg = assets.image('assets/menu_bg.png')
+    menu_bg_rect = menu_bg.get_rect(topleft = (0,0))
+
+    # -----------------------
+    # >>> CHANGE BUTTON POSITION HERE (kanan bawah)
+    button_width = 200
+    button_height = 50
+    margin_right = 20
+    margin_bottom = 20
+    base_x = screen.get_width() - button_width - margin_right
+    base_y = screen.get_height() - button_height - margin_bottom
+    gap = 12
+
+    button_play = Button((base_x, base_y - 2 * (button_height + gap), button_width, button_height), 'Play', font2, action='play')
+    button_leader = Button((base_x, base_y - (button_height + gap), button_width, button_height), 'Leaderboard', font2, action='leaderboard')
+    button_exit = Button((base_x, base_y, button_width, button_height), 'Exit', font2, action='exit')
+    startup.mark('menu assets')
+
+def init_world():
+    global playback, playback_start, world, session_rng, run_count, recorder, playback_at, timestep
+    global rewind, run_start
+    # --replay: the recorded runs, played from --seek
+    playback = Replay(args.replay) if args.replay else None
+    if playback is not None:
+        playback_start = min(playback.ticks, round(args.seek * sim.TICK_RATE))
+    world = None   # built on the first Play, see build_world
+    # run seeds come from the session seed (random when not given)
+    session_rng = random.Random(args.seed)
+    run_count = 0
+    recorder = None   # ReplayWriter of the current run with --record
+    playback_at = 0   # steps of the current run so far (index into the replay inputs)
+    timestep = FixedTimestep()
+    # --rewind: a snapshot of every step of the last seconds, and of the run's start
+    rewind = RewindBuffer(args.rewind) if args.rewind else None
+    run_start = None
+
+def build_parallax(assets, rle=True):
+    """The in-game background, back to front (speeds in px/s); also what
+    benchmarks/bench_parallax.py measures."""
+    # danau is scaled to 800x490 but only the 720x480 window is ever shown;
+    # tiang used to be moved twice per step, 480 px/s keeps its on-screen speed;
+    # tiang and clouds cross the screen once per game (their re-spawn timers
+    # never fired), both cloud images always moved together so they are one layer
+    clouds = assets.image('assets/awan1.png').copy()
+    clouds.blit(assets.image('assets/awan2.png'), (0, 0))
+    return Parallax([
+        Layer('danau', assets.image('assets/danau.png', (800,490)), wrap='static', rle=rle),
+        Layer('tanah', assets.image('assets/tanah.png'), speed=480, wrap='tile', rle=rle),
+        Layer('tiang', assets.image('assets/tiang.png', (950,635)), pos=(0,-140), speed=480, wrap='once', rle=rle),
+        Layer('awan', clouds, speed=60, wrap='once', rle=rle),
+    ])
+
+def build_world():
+    """Game world (headless rules), on the first Play: the question banks are
+    read here, next to the in-game assets that draw it."""
+    global world
+    if world is not None:
+        return
+    # --replay: a world set up like the recorded one, fed the recorded inputs
+    world = playback.new_simulation() if playback is not None else Simulation()
+    # collision is reported as its own phase, out of the simulation time
+    world._collide = profiler.wrap('collision', world._collide)
+
+def load_game_assets():
+    """Sprite frames, background layers and the quiz font, on the first Play;
+    waits only for the sprites still decoding in the background."""
+    global quiz_font, quiz_countdown_text, hud_counters
+    global player_frames, obstacle_frames, geprek_image, shield_item_image, parallax
+    global heart_image, heart_rects
+    if parallax is not None:
+        return
+    assets.collect()
+    if not args.raw_surfaces:
+        # colour keys + RLE for the sprites (limit_runner/surfaces.py), those
+        # the menu's idle time did not get to
+        assets.optimize(optimize_queue)
+        optimize_queue.clear()
+    quiz_font = assets.font(QUIZ_FONT, QUIZ_FONT_SIZES[0])
+    quiz_countdown_text = CounterText(quiz_font, 'Time left: {:.1f}s', True, 'Black')
+    hud_counters += (quiz_countdown_text,)
+
+    scaled_idle1 = assets.image('assets/idle1.png', sim.PLAYER_SIZE)
+    player_walk = [scaled_idle1, assets.image('assets/run1.png', sim.PLAYER_SIZE),
+                   scaled_idle1, assets.image('assets/run2.png', sim.PLAYER_SIZE)]
+    # indexed by Player.frame: the walk cycle, then the jump pose
+    player_frames = player_walk + [assets.image('assets/jump1.png', sim.PLAYER_SIZE)]
+    obstacle_frames = {
+        'burung': assets.frames(['assets/burung1.png', 'assets/burung2.png'], sim.OBSTACLE_SIZES['burung']),
+        'kucing': assets.frames(['assets/kucing1.png', 'assets/kucing2.png'], sim.OBSTACLE_SIZES['kucing']),
+    }
+    geprek_image = assets.image(GEPREK_PATH, sim.GEPREK_SIZE)
+    shield_item_image = assets.image(GEPREK_PATH, sim.SHIELD_ITEM_SIZE)
+
+    if args.pixel_collision:
+        # a mask per animation frame; each hit test uses the frame on screen
+        def frame_masks(frames):
+            return [pygame.mask.from_surface(f) for f in frames]
+        world.collider.set_masks({
+            'player': frame_masks(player_frames),
+            'burung': frame_masks(obstacle_frames['burung']),
+            'kucing': frame_masks(obstacle_frames['kucing']),
+            'geprek': frame_masks([geprek_image]),
+        })
+
+    parallax = build_parallax(assets, rle=not args.raw_surfaces)
+
+    # one heart image, drawn at up to three places
+    heart_image = assets.image('assets/heart.png', HEART_SIZE)
+    heart_rects = [heart_image.get_rect(midbottom=(x, 50)) for x in (680, 635, 590)]
+    apply_quality()
+    startup.mark('game assets')
+
+def apply_quality():
+    # the governor's level, applied to what is drawn (the simulation never changes)
+    q = governor.quality
+    parallax.hide(q.hidden_layers)
+    for counter in hud_counters:
+        counter.restyle(every=q.hud_every)
+
+def startup_report():
+    menu = startup.ms('first menu frame')
+    play = startup.ms('play')
+    gameplay = startup.ms('first gameplay frame')
+    lines = [startup.report()]
+    if menu is not None:
+        lines.append(f'time to menu: {menu:.1f} ms')
+    if gameplay is not None:
+        lines.append(f'time to first gameplay frame: {gameplay:.1f} ms ({gameplay - play:.1f} ms after Play)')
+    return '\n'.join(lines)
+
+def quit_game():
+    # finish any pending write before the process goes away
+    finish_recording()
+    save_store.close()
+    assets.close()
+    print(startup_report())
+    print(governor.report())
+    print(controls.report())
+    # hit/miss counters: spawns during play should all be hits
+    print(assets.report())
+    print(dirty.report())
+    print(render_queue.report())
+    print(text_cache.report())
+    if parallax is not None:
+        # timed at the render queue's flush, where the blits happen
+        print(parallax.report())
+    if rewind is not None:
+        print(f'rewind: {len(rewind)} snapshots ({rewind.seconds:.1f}s), {rewind.nbytes() // 1024} KB')
+    if profiler.frame_count:
+        print('\n'.join(['frame profile (ms):'] + profiler.lines()))
+    if args.profile_out:
+        profiler.export(args.profile_out)
+        print('frame profile written to', args.profile_out)
+    if world is not None:
+        print('pools:', world.pool_stats())
+    print(save_store.report())
+    pygame.quit()
+    exit()
+
+def leaderboard_panel(mode):
+    key = (mode, leaderboard.version)
+    panel = leaderboard_panels.get(mode)
+    if panel is not None and panel[0] == key:
+        return panel[1]
+
+    # bigger leaderboard box to fit entries and hint
+    box = LEADERBOARD_BOX
+    surf = pygame.Surface(box.size).convert()
+    surf.fill((240,240,240))
+
+    title = text_cache.render(font1, 'Leaderboard', True, 'Black')
+    surf.blit(title, (180, 12))
+
+    # DRAW toggle tabs (Answers / Scores)
+    tab_w, tab_h = 150, 34
+    tab_answers = pygame.Rect(20, 40, tab_w, tab_h)
+    tab_scores = pygame.Rect(20 + tab_w + 12, 40, tab_w, tab_h)
+
+    if mode == 'answers':
+        pygame.draw.rect(surf, (70,120,180), tab_answers)
+        pygame.draw.rect(surf, (180,180,180), tab_scores)
+    else:
+        pygame.draw.rect(surf, (180,180,180), tab_answers)
+        pygame.draw.rect(surf, (70,120,180), tab_scores)
+
+    a_text = text_cache.render(font2, 'By Answers', True, 'White')
+    s_text = text_cache.render(font2, 'By Scores', True, 'White')
+    surf.blit(a_text, a_text.get_rect(center=tab_answers.center))
+    surf.blit(s_text, s_text.get_rect(center=tab_scores.center))
+
+    metric = 'answers' if mode == 'answers' else 'score'
+    label = 'Correct Answers (best)' if mode == 'answers' else 'Score (best)'
+    label_surf = text_cache.render(font2, label, True, 'Black')
+    surf.blit(label_surf, (36, 84))
+
+    y = 120
+    you_in_top = False
+    for rank, (name, val) in enumerate(leaderboard.top(LEADERBOARD_TOP, metric), start=1):
+        display_name = name
+        if name == PLAYER_NAME:
+            display_name = f'{name} (You)'
+            you_in_top = True
+        line = text_cache.render(font2, f'{rank}. {display_name}: {val}', True, 'Black')
+        surf.blit(line, (36, y))
+        y += 36
+
+    if not you_in_top:
+        player_rank = leaderboard.rank(PLAYER_NAME, metric)
+        player_val = leaderboard.best(PLAYER_NAME, metric)
+        y += 6
+        your_line = text_cache.render(font2, f'Your rank: {player_rank}    You: {player_val}', True, 'Black')
+        surf.blit(your_line, (36, y))
+
+    # hint moved lower in box (if not fit, box enlarged above)
+    hint = text_cache.render(font2, 'Press Esc to go back', True, 'Black')
+    surf.blit(hint, (36, box.height - 28))
+
+    leaderboard_panels[mode] = (key, surf)
+    return surf
+
+def draw_menu():
+    # MENU (+ leaderboard panel when open)
+    screen.blit(menu_bg,menu_bg_rect)
+    profiler.count('blits')
+    button_play.draw(screen)
+    button_leader.draw(screen)
+    button_exit.draw(screen)
+
+    if show_leaderboard:
+        screen.blit(leaderboard_panel(leaderboard_mode), LEADERBOARD_BOX)
+        profiler.count('blits')
+
+# -----------------------
+# input: what each action does on each screen (actions: limit_runner/controls.py)
+# -----------------------
+def current_screen():
+    if game_over:
+        return 'game_over'
+    if game_state_active:
+        return 'quiz' if world.state == sim.QUIZ else 'playing'
+    return 'leaderboard' if show_leaderboard else 'menu'
+
+def toggle_profiler(action):
+    # profiler overlay; keeps profiling while exporting
+    global show_profiler
+    show_profiler = not show_profiler
+    if not args.profile_out:
+        profiler.toggle()
+    # static screens redraw, and the whole window is flipped once so the
+    # overlay's pixels go away when it is hidden
+    dirty.invalidate()
+    dirty.mark_full()
+
+def window_exposed(action):
+    # the window was uncovered: push the whole screen, static scenes included
+    dirty.mark_full()
+
+def press_jump(action):
+    # held jumps are read from controls in the step loop; this only times the press
+    if playback is None:
+        controls.stamp('jump', action)
+
+def answer_key(action):
+    if quiz_answer is None and playback is None:
+        controls.stamp('answer', action)
+    jawaban(action.name == 'answer_yes')
+
+def retry_key(action):
+    if rewind is not None:
+        retry_run()
+
+def menu_click(action):
+    if button_play.is_clicked(action.pos):
+        start_game()
+    elif button_leader.is_clicked(action.pos):
+        open_leaderboard(True)
+    elif button_exit.is_clicked(action.pos):
+        quit_game()
+
+def leaderboard_click(action):
+    global leaderboard_mode
+    # the tabs, where leaderboard_panel() draws them
+    tab_w, tab_h = 150, 34
+    tab_x = LEADERBOARD_BOX.x + 20
+    tab_y = LEADERBOARD_BOX.y + 40
+    if pygame.Rect(tab_x, tab_y, tab_w, tab_h).collidepoint(action.pos):
+        leaderboard_mode = 'answers'
+    if pygame.Rect(tab_x + tab_w + 12, tab_y, tab_w, tab_h).collidepoint(action.pos):
+        leaderboard_mode = 'scores'
+    # the menu buttons stay clickable around the panel
+    menu_click(action)
+
+def open_leaderboard(shown):
+    global show_leaderboard
+    show_leaderboard = shown
+
+SCREEN_HANDLERS = {
+    'menu': {'click': menu_click},
+    'leaderboard': {'click': leaderboard_click, 'back': lambda action: open_leaderboard(False)},
+    'playing': {'jump': press_jump, 'retry': retry_key},
+    'quiz': {'answer_yes': answer_key, 'answer_no': answer_key, 'retry': retry_key},
+    'game_over': {'restart': lambda action: restart_game(), 'back': lambda action: back_to_menu(),
+                  'menu': lambda action: back_to_menu(), 'retry': retry_key},
+}
+# on every screen
+GLOBAL_HANDLERS = {
+    'quit': lambda action: quit_game(),   # saves on quit as well
+    'profiler': toggle_profiler,
+    'expose': window_exposed,
+}
+
+# -----------------------
+# main loop
+# -----------------------
+def run():
+    global quiz_answer, current_time, quiz_timer_rect, playback_at
+    dt = 1000 / RENDER_FPS   # ms since last frame, from clock.tick()
+    while True:
+        frame_start = time.perf_counter()
+        profiler.start_frame()
+        for action in controls.poll():
+            handler = SCREEN_HANDLERS[current_screen()].get(action.name) or GLOBAL_HANDLERS.get(action.name)
+            if handler is not None:
+                handler(action)
+        profiler.lap('events')
+
+        # -----------------------
+        # Simulation: as many fixed 60 Hz steps as the last frame took
+        # -----------------------
+        if game_state_active:
+            # a tap released before the next step still jumps once
+            jump = controls.is_held('jump') or controls.pending('jump')
+            steps = timestep.advance(dt)
+            if rewind is not None and controls.is_held('rewind'):
+                # back through the kept seconds at twice the speed, instead of stepping
+                if steps:
+                    rewind.rewind(world, 2 * steps)
+                    quiz_answer = None
+                    controls.forget()
+                steps = 0
+            for _ in range(steps):
+                running = world.state == sim.RUNNING
+                if playback is not None:
+                    if playback_at >= playback.ticks:
+                        # the recording stops here (a run quit before game over)
+                        print('end of replay')
+                        back_to_menu()
+                        break
+                    inputs = decode_inputs(playback.inputs[playback_at])
+                else:
+                    inputs = Inputs(jump=jump, answer=quiz_answer)
+                world_events = world.step(sim.TICK_MS, inputs)
+                if inputs.jump:
+                    controls.taken('jump')
+                if inputs.answer is not None:
+                    controls.taken('answer')
+                playback_at += 1
+                if recorder is not None:
+                    recorder.record(inputs)
+                if rewind is not None:
+                    rewind.push(world)
+                quiz_answer = None
+                profiler.count('steps')
+                if running and world.state == sim.RUNNING:
+                    current_time = world.score
+                    parallax.update(sim.TICK_MS)
+                if 'quiz' in world_events:
+                    layout_quiz_page(world.current_question)
+                if 'game_over' in world_events:
+                    end_game()
+                    break
+        profiler.lap('simulation')
+        alpha = timestep.alpha
+        # -----------------------
+        # Rendering / Game states
+        # -----------------------
+        if game_state_active:
+            if world.state == sim.QUIZ:
+                if dirty.begin_scene(('quiz', world.current_question)):
+                    quiz()
+                    quiz_timer_rect = None
+                    draw_quiz_timer()
+                    dirty.mark_full()
+                else:
+                    changed = draw_quiz_timer()
+                    if changed:
+                        dirty.mark(changed)
+            else:
+                # gameplay scrolls everything: full redraw
+                dirty.invalidate()
+                dirty.mark_full()
+                # queued per layer, drawn with one blits() call per layer
+                queue = render_queue
+                parallax.draw(queue.background, alpha)
+
+                draw_player(queue.sprites, world.player, alpha)
+                draw_obstacles(queue.sprites, world.obstacles, alpha)
+                draw_gepreks(queue.sprites, world.gepreks, alpha)
+                # shield is visual only, the simulation decides when it blocks a hit
+                if world.shield is not None:
+                    draw_shield(queue.effects, world.shield, alpha)
+
+                # display hearts based on nyawa
+                queue.hud.blits([(heart_image, rect) for rect in heart_rects[:max(0, world.lives)]])
+
+                # display_score updates current_time used as score
+                display_score(queue.hud)
+                display_quiztimer(queue.hud)
+
+                correctAns_surf = correct_text.render(world.correct_answers)
+                correctAns_rect = correctAns_surf.get_rect(topleft=(10, 40))
+                queue.hud.blit(correctAns_surf, correctAns_rect)
+
+                blits, calls = queue.flush(screen)
+                profiler.count('blits', blits)
+                profiler.count('blit_calls', calls)
+
+        elif game_over:
+             # game over
+            if dirty.begin_scene(('over', current_time)):
+                draw_game_over()
+                dirty.mark_full()
+
+        else:
+            # MENU: static until the leaderboard panel or saved bests change
+            if dirty.begin_scene(('menu', show_leaderboard, leaderboard_mode, leaderboard.version)):
+                draw_menu()
+                dirty.mark_full()
+
+        if show_profiler:
+            dirty.mark(profiler_overlay.draw(screen))
+        profiler.lap('render')
+        dirty.flush()
+        if game_state_active:
+            startup.mark('first gameplay frame')
+        elif not game_over:
+            startup.mark('first menu frame')
+        profiler.lap('flip')
+        # only running gameplay is judged: menu and quiz frames would always say there is room
+        if game_state_active and world.state == sim.RUNNING:
+            if governor.frame((time.perf_counter() - frame_start) * 1000):
+                apply_quality()
+        if optimize_queue and not game_state_active:
+            assets.optimize_idle(optimize_queue)
+        dt = clock.tick(RENDER_FPS)
+        profiler.lap('idle')
+        profiler.end_frame()
+
+
+def main(argv=None, started=None):
+    """Runs the game until it quits; ``started`` is the launch time (perf_counter)
+    the startup report counts from, by default the call."""
+    global args, RENDER_FPS, PLAYER_NAME, startup, governor, optimize_queue
+    startup = StartupTimer(started)
+    startup.mark('imports')
+    args = arg_parser.parse_args(argv)
+    if args.pixel_collision and (args.record or args.replay):
+        arg_parser.error('recordings use the rectangle collider; drop --pixel-collision')
+    if args.rewind and (args.record or args.replay):
+        arg_parser.error('recordings play straight through; drop --rewind')
+    RENDER_FPS = args.fps
+    PLAYER_NAME = args.player
+    # frame budget governor: fixed at one level unless --quality auto
+    auto = args.quality == 'auto'
+    governor = QualityGovernor(1000 / RENDER_FPS, auto=auto, level=0 if auto else LEVEL_NAMES.index(args.quality))
+
+    init_display()
+    init_menu()
+    init_world()
+    # the menu's own assets are in; the rest decodes on other threads from here
+    assets.prefetch(GAME_ASSETS)
+    # and the sprites get their blit formats while the menu waits (or on Play)
+    optimize_queue = [] if args.raw_surfaces else list(SPRITE_ASSETS)
+    if playback is not None:
+        # straight into the recorded run
+        start_game()
+    run()
@@ -0,0 +1,250 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from limit_runner import surfaces
+
+# -----------------------
+# Asset registry: every image is loaded, converted and scaled once, then shared
+# -----------------------
+# paths in the game are written relative to the repo root ('assets/run1.png'),
+# resolve them here so the game also starts from another working directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AssetRegistry:
+    def __init__(self, base_dir=ROOT_DIR, pack=None):
+        self.base_dir = base_dir
+        # prebuilt sprite pack (atlas.py), opened on the first image() once a display exists
+        self.pack_path = pack
+        self.pack = None
+        self._images = {}   # (path, size) -> converted (and scaled) Surface
+        self._fonts = {}    # (path, size) -> Font
+        self._pending = {}  # (path, size) -> Future of a prefetch still to be collected
+        self._pool = None
+        self._originals = {}   # path -> the decoded image, when optimize() replaced it (scaling starts from it)
+        self._optimized = {}   # size -> [[fingerprint or None, source, optimized surface]]
+        self.optimized = dict.fromkeys(surfaces.KINDS, 0)
+        self.shared = 0
+        self.optimize_time = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0  # seconds spent decoding / converting / scaling
+        self.background_time = 0.0  # the same, on the prefetch threads
+
+    def resolve(self, path):
+        if os.path.isabs(path):
+            return path
+        return os.path.join(self.base_dir, path)
+
+    def image(self, path, size=None):
+        """Return the surface for ``path`` scaled to ``size`` (None = original size)."""
+        key = (path, size)
+        surf = self._images.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        future = self._pending.get(key)
+        if future is not None:
+            self._collect(future)
+            return self._images[key]
+        if self.pack_path is not None:
+            self._open_pack()
+        start = time.perf_counter()
+        if self.pack is not None:
+            surf = self.pack.get(path, size)
+            if surf is not None:
+                self._images[key] = surf
+                self.load_time += time.perf_counter() - start
+                return surf
+        base = self._originals.get(path)
+        if base is None:
+            base = self._images.get((path, None))
+        if base is None:
+            base = pygame.image.load(self.resolve(path)).convert_alpha()
+            self._images[(path, None)] = base
+        if size is None:
+            surf = base
+        else:
+            surf = pygame.transform.scale(base, size)
+            self._images[key] = surf
+        self.load_time += time.perf_counter() - start
+        return surf
+
+    def _open_pack(self):
+        from limit_runner.atlas import AssetPack, PackError
+        path, self.pack_path = self.pack_path, None
+        if not os.path.exists(path):
+            return
+        try:
+            self.pack = AssetPack(path, self.base_dir)
+        except PackError as e:
+            print(f'{e}; decoding the PNGs (rebuild with: python -m limit_runner.atlas)')
+            return
+        self.load_time += self.pack.load_time
+
+    # -----------------------
+    # background decoding: the PNGs of a manifest decode on worker threads
+    # (pygame releases the GIL while decoding and scaling) while the main thread
+    # keeps drawing; the results are only stored in the registry from the main thread
+    # -----------------------
+    def prefetch(self, manifest, workers=2):
+        """Start decoding every (path, size) pair in the background. image()
+        and collect() pick the results up. Needs a display mode."""
+        if self.pack_path is not None:
+            self._open_pack()
+        sizes = {}
+        for path, size in manifest:
+            key = (path, size)
+            if key in self._images or key in self._pending:
+                continue
+            if self.pack is not None and self.pack.has(path, size):
+                self.image(path, size)   # a view into the mapped pack: nothing to decode
+                continue
+            sizes.setdefault(path, []).append(size)
+        if not sizes:
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(workers, thread_name_prefix='assets')
+        for path, path_sizes in sizes.items():
+            future = self._pool.submit(self._decode, path, path_sizes)
+            for size in path_sizes + [None]:
+                self._pending.setdefault((path, size), future)
+
+    def _decode(self, path, sizes):
+        # worker thread: one decode per file, every size scaled from it
+        start = time.perf_counter()
+        base = pygame.image.load(self.resolve(path)).convert_alpha()
+        surfs = {size: pygame.transform.scale(base, size) for size in sizes if size is not None}
+        surfs[None] = base
+        return path, surfs, time.perf_counter() - start
+
+    def _collect(self, future):
+        start = time.perf_counter()
+        path, surfs, seconds = future.result()
+        self.load_time += time.perf_counter() - start   # only the wait counts on this thread
+        self.background_time += seconds
+        for size, surf in surfs.items():
+            self._images.setdefault((path, size), surf)
+            if self._pending.get((path, size)) is future:
+                del self._pending[(path, size)]
+
+    def collect(self):
+        """Wait for everything still decoding in the background and keep it."""
+        while self._pending:
+            self._collect(next(iter(self._pending.values())))
+        self.close()
+        # like preload: loading is not gameplay traffic
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        # drops prefetches not started yet; must run before pygame.quit()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._pending.clear()
+
+    def frames(self, paths, size=None):
+        return [self.image(path, size) for path in paths]
+
+    def font(self, path, size):
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(self.resolve(path), size)
+            self._fonts[key] = font
+        return font
+
+    def preload(self, manifest):
+        """Load every (path, size) pair up front. Needs a display mode for convert_alpha()."""
+        for path, size in manifest:
+            self.image(path, size)
+        # preloading is not gameplay traffic: start the counters clean
+        self.hits = 0
+        self.misses = 0
+
+    def optimize(self, manifest):
+        """Converts every (path, size) of ``manifest`` to its cheapest blit format
+        (surfaces.optimize) and shares identical ones. Only for images that are
+        drawn as they are: RLE surfaces must not be cut into subsurfaces."""
+        start = time.perf_counter()
+        for path, size in manifest:
+            key = (path, size)
+            surf = self.image(path, size)
+            done = self._optimized.setdefault(surf.get_size(), [])
+            if any(surf is entry[2] for entry in done):
+                continue
+            shared = self._same_pixels(surf, done)
+            if shared is not None:
+                self.shared += 1
+            else:
+                kind = surfaces.classify(surf)
+                shared = surfaces.optimize(surf, kind)
+                done.append([None, surf, shared])
+                self.optimized[kind] += 1
+            if size is None:
+                self._originals.setdefault(path, surf)
+            self._images[key] = shared
+        self.optimize_time += time.perf_counter() - start
+
+    def optimize_idle(self, queue, budget_ms=2.0):
+        """optimize() the loaded entries of ``queue`` (taken off it) for about
+        ``budget_ms``; entries still decoding stay queued for a later call."""
+        start = time.perf_counter()
+        for key in list(queue):
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+            if key in self._pending:
+                continue
+            queue.remove(key)
+            self.optimize([key])
+
+    @staticmethod
+    def _same_pixels(surf, done):
+        # the optimized copy of an image with surf's pixels among ``done`` (all of
+        # surf's size); fingerprints are only taken when there is one to compare
+        if not done:
+            return None
+        fingerprint = surfaces.fingerprint(surf)
+        for entry in done:
+            if entry[0] is None:
+                entry[0] = surfaces.fingerprint(entry[1])
+            if entry[0] == fingerprint:
+                return entry[2]
+        return None
+
+    def memory_bytes(self):
+        # pack sprites are views into the pack pages, counted once; RLE surfaces
+        # at their plain size (SDL keeps the encoded runs instead)
+        total = self.pack.memory_bytes() if self.pack is not None else 0
+        held = {id(s): s for s in list(self._images.values()) + list(self._originals.values())}
+        return total + sum(s.get_width() * s.get_height() * s.get_bytesize()
+                           for s in held.values() if s.get_parent() is None)
+
+    def stats(self):
+        return {
+            "surfaces": len(self._images),
+            "hits": self.hits,
+            "misses": self.misses,
+            "load_time_ms": round(self.load_time * 1000, 2),
+            "background_ms": round(self.background_time * 1000, 2),
+            "optimize_ms": round(self.optimize_time * 1000, 2),
+            "memory_kb": self.memory_bytes() // 1024,
+        }
+
+    def report(self):
+        s = self.stats()
+        pack = f", {len(self.pack.pages)} pack page(s)" if self.pack is not None else ""
+        background = f" (+{s['background_ms']} ms in the background)" if s['background_ms'] else ""
+        line = (f"assets: {s['surfaces']} surfaces{pack}, {s['memory_kb']} KB, "
+                f"load {s['load_time_ms']} ms{background}, hits {s['hits']}, misses {s['misses']}")
+        if any(self.optimized.values()):
+            kinds = ', '.join(f'{n} {kind}' for kind, n in self.optimized.items() if n)
+            line += (f"\n  optimized for blitting in {s['optimize_ms']} ms: {kinds}, "
+                     f"{self.shared} identical image(s) shared")
+        return line
@@ -0,0 +1,261 @@
+"""Sprite atlas pack: every scaled image the game draws, pre-decoded, in one file.
+
+    python -m limit_runner.atlas            # build assets/sprites.pack, print the memory report
+
+The build loads each (path, size) of ``MANIFEST`` the way AssetRegistry
+would, shelf-packs them into a few large pages and writes the pages as raw
+pixels in the display's per-pixel-alpha format (ARGB8888, the format
+``convert_alpha()`` produces). At startup the game memory-maps the file and
+wraps the pages as surfaces with ``pygame.image.frombuffer``: no PNG
+decoding, no scaling, no conversion, and the pixels are shared page cache
+rather than private heap. ``AssetRegistry.image()`` then hands out
+subsurfaces of the pages, so blitting a sprite blits a sub-rect of its page.
+
+Only the large images are packed: the menu background and the parallax
+layers, 3-9 ms each to decode and scale. The gameplay sprites (``SPRITES``)
+decode in about 2 ms all together on the background threads, and the game
+replaces each of them with its own RLE copy anyway (surfaces.py): SDL can
+only RLE-encode pixels a surface owns, and views into the mapped pages
+blitted 3-6x slower than those copies.
+
+File: b'LRPK', u32 index length, JSON index, pages at 4096-byte offsets.
+The index records every source file's size and mtime; when a PNG changed
+after the build the pack is ignored (and the game decodes the PNGs as
+before) until it is rebuilt.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+
+import pygame
+
+from limit_runner import simulation as sim
+from limit_runner.assets import ROOT_DIR, AssetRegistry
+
+PACK_FILE = os.path.join(ROOT_DIR, 'assets', 'sprites.pack')
+MAGIC = b'LRPK'
+VERSION = 1
+PAGE_SIZE = 2048
+ALIGN = 4096
+# pixel layout of the pages: the masks of a convert_alpha() surface on
+# little-endian ARGB8888 displays, which frombuffer 'BGRA' reproduces
+PAGE_FORMAT = 'BGRA'
+PAGE_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
+# the (path, size) pairs the game (limit_runner/app.py) asks the registry for
+# that are packed
+MANIFEST = [
+    ('assets/heart.png', None),                          # window icon, used as it is
+    ('assets/menu_bg.png', None),
+    ('assets/awan1.png', None),
+    ('assets/awan2.png', None),
+    ('assets/danau.png', (800, 490)),
+    ('assets/tanah.png', None),
+    ('assets/tiang.png', (950, 635)),
+]
+# and the ones that are not: decoded from the PNGs, then optimized copies
+SPRITES = [
+    ('assets/heart.png', (40, 40)),                      # HEART_SIZE
+    ('assets/idle1.png', sim.PLAYER_SIZE),
+    ('assets/run1.png', sim.PLAYER_SIZE),
+    ('assets/run2.png', sim.PLAYER_SIZE),
+    ('assets/jump1.png', sim.PLAYER_SIZE),
+    ('assets/burung1.png', sim.OBSTACLE_SIZES['burung']),
+    ('assets/burung2.png', sim.OBSTACLE_SIZES['burung']),
+    ('assets/kucing1.png', sim.OBSTACLE_SIZES['kucing']),
+    ('assets/kucing2.png', sim.OBSTACLE_SIZES['kucing']),
+    ('assets/geprek.png', sim.GEPREK_SIZE),
+    ('assets/geprek.png', sim.SHIELD_ITEM_SIZE),
+]
+
+
+class PackError(Exception):
+    pass
+
+
+def sprite_key(path, size):
+    return f'{path}|{size[0]}x{size[1]}' if size else path
+
+
+def source_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+# -----------------------
+# build
+# -----------------------
+def shelf_pack(sizes, page_width=PAGE_SIZE, page_size=PAGE_SIZE):
+    """Places (w, h) boxes on pages ``page_width`` wide and ``page_size`` high, tallest first, in rows.
+
+    Returns ([(page, x, y)] in input order, [(page w, page h)]).
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places = [None] * len(sizes)
+    pages = []            # [width used, height used]
+    shelf = None          # (page, y, height, x)
+    for i in order:
+        w, h = sizes[i]
+        if w > page_width or h > page_size:
+            raise PackError(f'{w}x{h} does not fit on a {page_width}x{page_size} page')
+        if shelf is None or shelf[3] + w > page_width:
+            # new row under the last one, or a new page
+            if shelf is not None and shelf[1] + shelf[2] + h <= page_size:
+                shelf = (shelf[0], shelf[1] + shelf[2], h, 0)
+            else:
+                pages.append([0, 0])
+                shelf = (len(pages) - 1, 0, h, 0)
+        page, y, row_h, x = shelf
+        places[i] = (page, x, y)
+        shelf = (page, y, row_h, x + w)
+        pages[page][0] = max(pages[page][0], x + w)
+        pages[page][1] = max(pages[page][1], y + h)
+    return places, [tuple(p) for p in pages]
+
+
+def best_pack(sizes, page_size=PAGE_SIZE):
+    """shelf_pack with the page width (up to ``page_size``) that wastes the least area."""
+    widest = max(w for w, h in sizes)
+    best = None
+    for width in range(widest, page_size + 1, 16):
+        places, pages = shelf_pack(sizes, width, page_size)
+        area = sum(w * h for w, h in pages)
+        if best is None or area < best[0]:
+            best = (area, places, pages)
+    return best[1], best[2]
+
+
+def build(out=PACK_FILE, manifest=MANIFEST, page_size=PAGE_SIZE, base_dir=ROOT_DIR):
+    """Writes the pack; returns a stats dict for the report."""
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    registry = AssetRegistry(base_dir)
+    start = time.perf_counter()
+    images = [registry.image(path, size) for path, size in manifest]
+    decode_s = time.perf_counter() - start
+    registry_bytes = registry.memory_bytes()
+
+    places, page_sizes = best_pack([s.get_size() for s in images], page_size)
+    pages = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha() for size in page_sizes]
+    if pages and pages[0].get_masks() != PAGE_MASKS:
+        raise PackError(f'display alpha format {pages[0].get_masks()} is not ARGB8888')
+    sprites = {}
+    for (path, size), image, (page, x, y) in zip(manifest, images, places):
+        # copy the pixels as they are, alpha included
+        pages[page].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        sprites[sprite_key(path, size)] = [page, x, y, image.get_width(), image.get_height()]
+
+    index = {
+        'version': VERSION,
+        'format': PAGE_FORMAT,
+        'pages': [],
+        'sprites': sprites,
+        'sources': {path: source_stamp(registry.resolve(path)) for path, _ in manifest},
+    }
+    index_pos = len(MAGIC) + 4
+    blobs = [pygame.image.tobytes(page, PAGE_FORMAT) for page in pages]
+    # the index size decides where the first page goes: lay out twice
+    for _ in range(2):
+        raw = json.dumps(index).encode('utf-8')
+        offset = -(-(index_pos + len(raw)) // ALIGN) * ALIGN
+        index['pages'] = []
+        for page, blob in zip(pages, blobs):
+            index['pages'].append({'size': page.get_size(), 'offset': offset, 'length': len(blob)})
+            offset += -(-len(blob) // ALIGN) * ALIGN
+    raw = json.dumps(index).encode('utf-8')
+
+    tmp = out + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(raw)) + raw)
+        for page, blob in zip(index['pages'], blobs):
+            f.seek(page['offset'])
+            f.write(blob)
+    os.replace(tmp, out)
+    return {
+        'sprites': len(sprites),
+        'pages': page_sizes,
+        'file_bytes': os.path.getsize(out),
+        'before_bytes': registry_bytes,
+        'after_bytes': sum(w * h * 4 for w, h in page_sizes),
+        'decode_ms': decode_s * 1000,
+    }
+
+
+# -----------------------
+# load
+# -----------------------
+class AssetPack:
+    """A memory-mapped pack; ``get(path, size)`` is a subsurface of its page or None."""
+
+    def __init__(self, path, base_dir=ROOT_DIR):
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            # copy-on-write: page cache is shared, nothing is read until touched
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        m = self._map
+        if m[:4] != MAGIC:
+            raise PackError(f'{path}: not a sprite pack')
+        (n,) = struct.unpack_from('<I', m, 4)
+        index = json.loads(m[8:8 + n])
+        if index['version'] != VERSION:
+            raise PackError(f'{path}: pack version {index["version"]}, expected {VERSION}')
+        for source, stamp in index['sources'].items():
+            full = source if os.path.isabs(source) else os.path.join(base_dir, source)
+            if not os.path.exists(full) or source_stamp(full) != stamp:
+                raise PackError(f'{path}: {source} changed since the pack was built')
+
+        # wrap the mapped pixels; convert only if this display uses another layout
+        probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        native = probe.get_masks() == PAGE_MASKS
+        self.pages = []
+        for page in index['pages']:
+            view = memoryview(m)[page['offset']:page['offset'] + page['length']]
+            surf = pygame.image.frombuffer(view, tuple(page['size']), index['format'])
+            self.pages.append(surf if native else surf.convert_alpha())
+        self.native = native
+        self.sprites = index['sprites']
+        self.path = path
+        self.load_time = time.perf_counter() - start
+
+    def has(self, path, size=None):
+        return sprite_key(path, size) in self.sprites
+
+    def get(self, path, size=None):
+        entry = self.sprites.get(sprite_key(path, size))
+        if entry is None:
+            return None
+        page, x, y, w, h = entry
+        return self.pages[page].subsurface((x, y, w, h))
+
+    def memory_bytes(self):
+        return sum(p.get_width() * p.get_height() * 4 for p in self.pages)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the sprite atlas pack')
+    parser.add_argument('--out', default=PACK_FILE)
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    args = parser.parse_args(argv)
+    # the build needs a display for convert_alpha(), not a window
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    s = build(args.out, page_size=args.page_size)
+    pages = ', '.join(f'{w}x{h}' for w, h in s['pages'])
+    print(f'{s["sprites"]} sprites on {len(s["pages"])} page(s) ({pages}) -> {args.out}, '
+          f'{s["file_bytes"] // 1024} KB')
+    print(f'texture memory: {s["before_bytes"] // 1024} KB decoded + scaled from PNG '
+          f'(originals kept for rescaling), {s["after_bytes"] // 1024} KB in the pack pages, '
+          f'mapped from the file')
+    print(f'PNG decode + scale: {s["decode_ms"]:.1f} ms')
+    pygame.display.set_mode((720, 480))
+    pack = AssetPack(args.out)
+    print(f'pack load: {pack.load_time * 1000:.2f} ms ({"native format" if pack.native else "converted"})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+"""Many seeded headless games across all cores, for balancing the rules.
+
+    python -m limit_runner.batch --runs 100000 --out runs.lrb
+    python -m limit_runner.batch --runs 20000 --obstacle-interval 1500 --shield-duration 8000 \\
+        --quiz-ms hard=8000 --policy jump:0.5 --out faster.lrb
+    python -m limit_runner.batch --summary runs.lrb      # distributions of an earlier batch
+
+Run ``i`` of a batch plays ``Simulation.reset(seed + i)``, with the policy's
+own RNG seeded from the same number, so any single run can be played again.
+Workers send back blocks of finished runs; each block is appended to the
+results file as soon as it arrives, column by column, so an interrupted
+batch keeps everything finished so far.
+
+Results file: b'LRBR', u32 header length, JSON header (columns, typecodes,
+settings), then blocks of u32 row count followed by each column's values
+(native ``array`` bytes).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from limit_runner import simulation
+from limit_runner.headless import parse_policy
+from limit_runner.questions import default_question_banks
+from limit_runner.simulation import OVER, TICK_MS, Simulation
+
+MAGIC = b'LRBR'
+# column -> array typecode
+COLUMNS = {
+    'seed': 'q',
+    'score': 'q',
+    'answers': 'q',          # correct quiz answers
+    'wrong': 'q',            # wrong quiz answers (each costs a life; a timeout does not)
+    'hits': 'q',             # obstacle hits that cost a life
+    'deaths': 'q',           # lives lost in total
+    'shield_pickups': 'q',   # gepreks eaten (each gives / refreshes a shield)
+    'shield_blocks': 'q',    # hits the shield absorbed
+    'death_time_s': 'd',     # game time at game over, -1 when the run hit --max-ticks
+    'steps': 'q',
+}
+BLOCK = 64   # runs per block sent back by a worker
+# aggregate rows printed by summarize
+SUMMARY_COLUMNS = ('score', 'answers', 'deaths', 'hits', 'wrong', 'shield_pickups', 'shield_blocks',
+                   'death_time_s')
+
+
+# -----------------------
+# workers
+# -----------------------
+def apply_rules(rules):
+    """Overrides of the simulation tuning, e.g. {'OBSTACLE_INTERVAL_MS': 1500}."""
+    for name, value in rules.items():
+        setattr(simulation, name, value)
+
+
+def question_banks(quiz_ms):
+    return {name: (questions, quiz_ms.get(name, duration))
+            for name, (questions, duration) in default_question_banks().items()}
+
+
+_worker = {}
+
+
+def _init_worker(settings):
+    apply_rules(settings['rules'])
+    # one world per worker, reused (and its pools kept warm) for every run; with
+    # a handful of sprites the per-sprite motion beats the NumPy batches
+    _worker['sim'] = Simulation(question_banks=question_banks(settings['quiz_ms']), batched_motion=False)
+    _worker['policy'] = parse_policy(settings['policy'])
+    _worker['max_ticks'] = settings['max_ticks']
+
+
+def play_run(sim, policy, seed, max_ticks):
+    """One game from ``seed``; returns a row of COLUMNS values."""
+    sim.reset(seed)
+    rng = random.Random(seed)
+    counts = dict.fromkeys(('correct', 'wrong', 'hit', 'pickup', 'shield_break'), 0)
+    steps = 0
+    while sim.state != OVER and steps < max_ticks:
+        for event in sim.step(TICK_MS, policy(sim, rng)):
+            if event in counts:
+                counts[event] += 1
+        steps += 1
+    death_time = sim.time_ms / 1000 if sim.state == OVER else -1.0
+    return (seed, sim.score, counts['correct'], counts['wrong'], counts['hit'],
+            counts['wrong'] + counts['hit'], counts['pickup'], counts['shield_break'], death_time, steps)
+
+
+def _run_block(block):
+    first, count = block
+    sim, policy, max_ticks = _worker['sim'], _worker['policy'], _worker['max_ticks']
+    return [play_run(sim, policy, seed, max_ticks) for seed in range(first, first + count)]
+
+
+# -----------------------
+# results file
+# -----------------------
+class ResultsWriter:
+    def __init__(self, path, settings):
+        self.f = open(path, 'wb')
+        header = json.dumps({'columns': COLUMNS, 'settings': settings}).encode('utf-8')
+        self.f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self.rows = 0
+
+    def write_block(self, rows):
+        columns = [array(code) for code in COLUMNS.values()]
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+        self.f.write(struct.pack('<I', len(rows)))
+        for column in columns:
+            column.tofile(self.f)
+        self.f.flush()
+        self.rows += len(rows)
+
+    def close(self):
+        self.f.close()
+
+
+def read_results(path):
+    """(settings, {column: array}) of a results file; a truncated last block is ignored."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f'{path}: not a batch results file')
+    (n,) = struct.unpack_from('<I', data, 4)
+    header = json.loads(data[8:8 + n])
+    columns = {name: array(code) for name, code in header['columns'].items()}
+    pos = 8 + n
+    while pos + 4 <= len(data):
+        (rows,) = struct.unpack_from('<I', data, pos)
+        size = rows * sum(column.itemsize for column in columns.values())
+        if pos + 4 + size > len(data):
+            break
+        pos += 4
+        for column in columns.values():
+            nbytes = rows * column.itemsize
+            column.frombytes(data[pos:pos + nbytes])
+            pos += nbytes
+    return header['settings'], columns
+
+
+# -----------------------
+# aggregates
+# -----------------------
+def percentiles(values, qs=(5, 25, 50, 75, 95)):
+    ordered = sorted(values)
+    n = len(ordered)
+    return [ordered[min(n - 1, int(q / 100 * n))] for q in qs]
+
+
+def summarize(columns, out=print):
+    n = len(columns['seed'])
+    if not n:
+        out('no runs')
+        return
+    out(f'{n} runs')
+    out(f'{"":<16} {"mean":>9} {"p5":>8} {"p25":>8} {"p50":>8} {"p75":>8} {"p95":>8} {"max":>8}')
+    for name in SUMMARY_COLUMNS:
+        values = columns[name]
+        if name == 'death_time_s':
+            values = [v for v in values if v >= 0]
+            if not values:
+                continue
+        p = percentiles(values)
+        out(f'{name:<16} {sum(values) / len(values):>9.1f} ' + ' '.join(f'{v:>8.1f}' for v in p)
+            + f' {max(values):>8.1f}')
+
+    capped = sum(1 for v in columns['death_time_s'] if v < 0)
+    out(f'ended by game over: {n - capped}, hit the step cap: {capped}')
+    lost = sum(columns['deaths'])
+    if lost:
+        out(f'lives lost: {sum(columns["hits"]) * 100 / lost:.1f}% to obstacles, '
+            f'{sum(columns["wrong"]) * 100 / lost:.1f}% to quiz answers')
+
+    # when runs end, in minutes of game time
+    minutes = {}
+    for t in columns['death_time_s']:
+        if t >= 0:
+            minutes[int(t // 60)] = minutes.get(int(t // 60), 0) + 1
+    if minutes:
+        out('game over by minute:')
+        top = max(minutes.values())
+        for m in range(max(minutes) + 1):
+            k = minutes.get(m, 0)
+            out(f'  {m:>3}-{m + 1:<3} {k:>7} {k * 100 / n:5.1f}% ' + '#' * round(40 * k / top))
+
+
+# -----------------------
+# command line
+# -----------------------
+def parse_quiz_ms(specs):
+    quiz_ms = {}
+    for spec in specs:
+        name, _, ms = spec.partition('=')
+        banks = default_question_banks()
+        if name not in banks or not ms.isdigit():
+            raise argparse.ArgumentTypeError(f'--quiz-ms expects BANK=MS with BANK one of {", ".join(banks)}')
+        quiz_ms[name] = int(ms)
+    return quiz_ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1, help='first run seed (run i plays seed + i)')
+    parser.add_argument('--policy', default='jump', help='jump[:SKILL] or random[:JUMP_RATE]')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--max-ticks', type=int, default=60 * 60 * 30, help='cap per run (default 30 min)')
+    parser.add_argument('--out', default='batch.lrb', help='results file')
+    parser.add_argument('--summary', metavar='FILE', help='print the distributions of an earlier batch and exit')
+    rules = parser.add_argument_group('rules (default: the game\'s)')
+    rules.add_argument('--obstacle-interval', type=int, metavar='MS')
+    rules.add_argument('--geprek-spawn', type=int, nargs=2, metavar=('MIN_MS', 'MAX_MS'))
+    rules.add_argument('--shield-duration', type=int, metavar='MS')
+    rules.add_argument('--quiz-interval', type=int, metavar='MS')
+    rules.add_argument('--quiz-ms', action='append', default=[], metavar='BANK=MS', help='quiz time of one bank')
+    args = parser.parse_args(argv)
+
+    if args.summary:
+        settings, columns = read_results(args.summary)
+        print(json.dumps(settings))
+        summarize(columns)
+        return 0
+
+    try:
+        parse_policy(args.policy)
+        quiz_ms = parse_quiz_ms(args.quiz_ms)
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        parser.error(str(e))
+    overrides = {'OBSTACLE_INTERVAL_MS': args.obstacle_interval,
+                 'GEPREK_SPAWN_MS': tuple(args.geprek_spawn) if args.geprek_spawn else None,
+                 'SHIELD_DURATION_MS': args.shield_duration,
+                 'QUIZ_INTERVAL_MS': args.quiz_interval}
+    settings = {'runs': args.runs, 'seed': args.seed, 'policy': args.policy, 'max_ticks': args.max_ticks,
+                'rules': {k: v for k, v in overrides.items() if v is not None}, 'quiz_ms': quiz_ms}
+
+    blocks = [(first, min(BLOCK, args.seed + args.runs - first))
+              for first in range(args.seed, args.seed + args.runs, BLOCK)]
+    writer = ResultsWriter(args.out, settings)
+    start = time.perf_counter()
+    steps = 0
+    last_report = start
+    print(f'{args.runs} runs on {args.workers} worker(s) -> {args.out}')
+    try:
+        with multiprocessing.Pool(args.workers, _init_worker, (settings,)) as pool:
+            for rows in pool.imap_unordered(_run_block, blocks):
+                writer.write_block(rows)
+                steps += sum(row[-1] for row in rows)
+                now = time.perf_counter()
+                if now - last_report >= 5 or writer.rows == args.runs:
+                    last_report = now
+                    rate = writer.rows / (now - start)
+                    eta = (args.runs - writer.rows) / rate if rate else 0
+                    print(f'  {writer.rows:>8}/{args.runs} runs  {rate:8.1f} runs/s  '
+                          f'{steps / (now - start):>11,.0f} steps/s  eta {eta / 60:6.1f} min', flush=True)
+    except KeyboardInterrupt:
+        print(f'interrupted: {writer.rows} runs kept in {args.out}')
+    finally:
+        writer.close()
+
+    _, columns = read_results(args.out)
+    summarize(columns)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Input: which events reach the game, what they mean, and how long they take to act.
+
+* ``block_unused()`` has SDL drop every event type the game does not use
+  (mouse motion and wheel, text input, window, joystick, touch ...) before
+  it is queued, so a mouse sweep no longer puts hundreds of events a second
+  through the main loop;
+* keys and mouse buttons map to actions (``KEY_ACTIONS``, ``BUTTON_ACTIONS``);
+  ``Controls.poll()`` turns the frame's events into ``Action``s and keeps
+  which of the held actions (jump, rewind) are down from the key down / up
+  events, so nothing polls ``pygame.key.get_pressed()`` next to the queue;
+* the game looks up what an action does in a handler table per screen
+  (see ``run()`` in app.py);
+* the window being exposed again (uncovered, restored) is the 'expose'
+  action, so dirty-rect mode can push the whole screen once.
+
+pygame 2 events carry no timestamp. A key polled now was pressed at some
+point since the previous poll, so every action is stamped with the time of
+that previous poll: the earliest it can have happened. ``stamp()`` marks a
+press the simulation should act on and ``taken()`` closes it at the step
+that used it, which gives the input-to-simulation latency of jumps and quiz
+answers including the wait in the event queue (so at most one frame more
+than the real latency, never less).
+"""
+import time
+from collections import deque
+
+import pygame
+
+from limit_runner.profiler import percentile
+
+# the only event types the game reads
+USED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN,
+               pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+EXPOSE_EVENTS = frozenset((pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE))
+
+KEY_ACTIONS = {
+    pygame.K_SPACE: 'jump',
+    pygame.K_UP: 'answer_yes',
+    pygame.K_DOWN: 'answer_no',
+    pygame.K_RETURN: 'restart',
+    pygame.K_ESCAPE: 'back',
+    pygame.K_m: 'menu',
+    pygame.K_r: 'retry',
+    pygame.K_BACKSPACE: 'rewind',
+    pygame.K_F3: 'profiler',
+}
+BUTTON_ACTIONS = {1: 'click'}
+# actions that last while the key is down (the others happen once per press)
+HELD_ACTIONS = frozenset(('jump', 'rewind'))
+
+
+def block_unused(used=USED_EVENTS):
+    """Blocks every event type but ``used`` (needs the display module started)."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(used))
+
+
+class Action:
+    __slots__ = ('name', 'pos', 't')
+
+    def __init__(self, name, pos=None, t=0.0):
+        self.name = name
+        self.pos = pos   # mouse position of clicks
+        self.t = t       # perf_counter() at the poll before the one that read it
+
+
+class Controls:
+
+    def __init__(self, keys=KEY_ACTIONS, buttons=BUTTON_ACTIONS, window=600):
+        self.keys = keys
+        self.buttons = buttons
+        self.held = set()
+        self.stamps = {}      # latency name -> poll time of a press the simulation has not used yet
+        self.latency = {}     # latency name -> recent press-to-step times in ms
+        self.window = window
+        self.events = 0       # events polled
+        self.actions = 0      # of which mapped to an action
+        self.last_poll = time.perf_counter()
+
+    def poll(self):
+        """The actions of the events queued since the last poll."""
+        # the events arrived since the last poll; stamp them with its time
+        now, self.last_poll = self.last_poll, time.perf_counter()
+        events = pygame.event.get()
+        self.events += len(events)
+        actions = []
+        for event in events:
+            kind = event.type
+            if kind == pygame.KEYDOWN:
+                name = self.keys.get(event.key)
+                if name is None:
+                    continue
+                if name in HELD_ACTIONS:
+                    self.held.add(name)
+                actions.append(Action(name, None, now))
+            elif kind == pygame.KEYUP:
+                self.held.discard(self.keys.get(event.key))
+            elif kind == pygame.MOUSEBUTTONDOWN:
+                name = self.buttons.get(event.button)
+                if name is not None:
+                    actions.append(Action(name, event.pos, now))
+            elif kind == pygame.QUIT:
+                actions.append(Action('quit', None, now))
+            elif kind in EXPOSE_EVENTS:
+                actions.append(Action('expose', None, now))
+        self.actions += len(actions)
+        return actions
+
+    def is_held(self, name):
+        return name in self.held
+
+    def stamp(self, name, action):
+        # the first press counts until the simulation takes it
+        self.stamps.setdefault(name, action.t)
+
+    def pending(self, name):
+        return name in self.stamps
+
+    def taken(self, name):
+        """The simulation used the press stamped as ``name`` (if any)."""
+        t = self.stamps.pop(name, None)
+        if t is not None:
+            times = self.latency.get(name)
+            if times is None:
+                times = self.latency[name] = deque(maxlen=self.window)
+            times.append((time.perf_counter() - t) * 1000)
+
+    def forget(self):
+        # presses of a run that ended before a step used them
+        self.stamps.clear()
+
+    def report(self):
+        lines = [f'input: {self.events} events polled, {self.actions} actions']
+        for name, times in self.latency.items():
+            ordered = sorted(times)
+            lines.append(f'  {name} latency (queued -> simulation step): n={len(ordered)} '
+                         f'p50 {percentile(ordered, 50):.1f} / p90 {percentile(ordered, 90):.1f} / '
+                         f'max {ordered[-1]:.1f} ms')
+        return '\n'.join(lines)
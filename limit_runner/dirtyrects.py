@@ -0,0 +1,67 @@
+import pygame
+
+
+class DirtyRects:
+    """Dirty-rect display updates: push only the screen areas that changed.
+
+    Static screens (menu, game over, quiz page) are keyed with ``begin_scene``;
+    they are drawn once when the key changes and afterwards only the parts
+    that really move (e.g. the quiz countdown) are marked and pushed. With
+    ``enabled=False`` every frame redraws and pushes the whole screen, like a
+    plain ``pygame.display.update()``, but the pixel counters still run so the
+    two modes can be compared.
+    """
+
+    def __init__(self, surface, enabled=True):
+        self.surface = surface
+        self.screen_rect = surface.get_rect()
+        self.enabled = enabled
+        self.scene = None          # key of the static screen currently shown
+        self.rects = []
+        self.full = False
+        # counters
+        self.frames = 0
+        self.idle_frames = 0       # frames that pushed nothing at all
+        self.pixels_last_frame = 0
+        self.pixels_total = 0
+
+    def begin_scene(self, key):
+        """True when the static screen ``key`` must be drawn from scratch."""
+        if not self.enabled or key != self.scene:
+            self.scene = key
+            return True
+        return False
+
+    def invalidate(self):
+        # the screen is animated (gameplay): the next static scene redraws fully
+        self.scene = None
+
+    def mark(self, rect):
+        self.rects.append(self.screen_rect.clip(rect))
+
+    def mark_full(self):
+        self.full = True
+
+    def flush(self):
+        if not self.enabled or self.full:
+            pygame.display.update()
+            pixels = self.screen_rect.width * self.screen_rect.height
+        elif self.rects:
+            pygame.display.update(self.rects)
+            pixels = sum(r.width * r.height for r in self.rects)
+        else:
+            pixels = 0
+            self.idle_frames += 1
+        self.rects.clear()
+        self.full = False
+
+        self.frames += 1
+        self.pixels_last_frame = pixels
+        self.pixels_total += pixels
+
+    def report(self):
+        mode = 'dirty-rect' if self.enabled else 'full'
+        avg = self.pixels_total // self.frames if self.frames else 0
+        full = self.screen_rect.width * self.screen_rect.height
+        return (f"display ({mode}): {self.frames} frames, avg {avg} px/frame "
+                f"({avg * 100 // full}% of screen), {self.idle_frames} idle frames")
@@ -0,0 +1,496 @@
+"""Reinforcement-learning style environments around the game rules.
+
+``RunnerEnv`` wraps one ``Simulation`` with the reset / step API of gym
+(gymnasium's five-tuple), without depending on gym. ``VecRunnerEnv`` plays N
+independent games in one ``step(actions)`` call: every game's state lives
+in NumPy arrays (fixed slots for obstacles and gepreks) and the rules of
+simulation.py are applied to all games at once. Finished games restart on
+their own.
+
+The vectorized rules are the same as the Simulation's, but it draws from a
+NumPy random generator, so a given seed plays a different (equally likely)
+game than ``Simulation.reset(seed)`` does.
+
+Actions: 0 nothing, 1 jump, 2 answer B (benar / up), 3 answer S (salah / down).
+Observations: ``OBS_FIELDS`` as float32, or with ``pixels=(w, h)`` a
+grayscale uint8 image of the scene (h, w) drawn offscreen with flat shapes.
+Fractions run from 0 to 1: 'quiz_left' is the part of the current question's
+time still left (the banks give different durations).
+
+    python -m limit_runner.env              # steps/s of both, random actions
+"""
+import argparse
+import math
+import time
+
+from limit_runner import simulation as sim
+from limit_runner.motion import HAVE_NUMPY, np
+from limit_runner.questions import default_question_banks
+from limit_runner.simulation import (GEPREK_SIZE, GROUND_Y, OBSTACLE_SIZES, OBSTACLE_Y, OVER, PLAYER_SIZE,
+                                     PLAYER_X, QUIZ, RUNNING, SCREEN_WIDTH, TICK_MS, Inputs, Simulation)
+
+NOOP, JUMP, ANSWER_TRUE, ANSWER_FALSE = range(4)
+N_ACTIONS = 4
+ACTION_INPUTS = (Inputs(), Inputs(jump=True), Inputs(answer=True), Inputs(answer=False))
+
+SCREEN_HEIGHT = 480
+OBS_FIELDS = (
+    'player_bottom', 'player_vy', 'on_ground', 'lives', 'shield_left', 'in_quiz', 'quiz_left',
+    # the two nearest obstacles not yet passed (dx 1.0 = none), then the nearest geprek
+    'obstacle1_dx', 'obstacle1_bird', 'obstacle2_dx', 'obstacle2_bird',
+    'geprek_dx', 'geprek_bottom',
+)
+OBS_SIZE = len(OBS_FIELDS)
+# reward per event of a step; 'step' is paid for every step the world runs
+REWARDS = {'step': 0.01, 'pickup': 1.0, 'correct': 1.0, 'hit': -1.0, 'wrong': -1.0}
+# pixel observation shades
+SHADES = {'sky': 0, 'ground': 60, 'quiz': 30, 'player': 255, 'kucing': 170, 'burung': 130, 'geprek': 210}
+
+PLAYER_LEFT = PLAYER_X - PLAYER_SIZE[0] // 2
+PLAYER_RIGHT = PLAYER_LEFT + PLAYER_SIZE[0]
+MAX_STEPS = 60 * 60 * 30
+
+
+def _require_numpy(what):
+    if not HAVE_NUMPY:
+        raise RuntimeError(f'{what} needs NumPy (pip install numpy)')
+
+
+def rasterize(size, running, shapes):
+    """Flat-shaded frames of N games: (N, h, w) uint8.
+
+    ``shapes`` is a list of (shade, left, top, right, bottom, visible), each an
+    array over the games (screen coordinates); games not ``running`` show the
+    quiz page.
+    """
+    w, h = size
+    n = len(running)
+    xs = (np.arange(w) + 0.5) * (SCREEN_WIDTH / w)
+    ys = (np.arange(h) + 0.5) * (SCREEN_HEIGHT / h)
+    frames = np.zeros((n, h, w), dtype=np.uint8)
+    frames[:, ys >= GROUND_Y, :] = SHADES['ground']
+    for shade, left, top, right, bottom, visible in shapes:
+        cols = (xs >= left[:, None]) & (xs < right[:, None])
+        rows = (ys >= top[:, None]) & (ys < bottom[:, None]) & visible[:, None]
+        frames[rows[:, :, None] & cols[:, None, :]] = shade
+    frames[~running] = SHADES['quiz']
+    return frames
+
+
+# -----------------------
+# one game
+# -----------------------
+class RunnerEnv:
+    """One game: ``obs, info = reset(seed)``, ``obs, reward, terminated, truncated, info = step(action)``."""
+
+    def __init__(self, pixels=None, max_steps=MAX_STEPS, **sim_kwargs):
+        if pixels is not None:
+            _require_numpy('pixel observations')
+        self.pixels = pixels
+        self.max_steps = max_steps
+        self.sim = Simulation(**sim_kwargs)
+        self.steps = 0
+        # duration of each question's bank, for the quiz_left fraction
+        banks = self.sim.question_banks
+        self.quiz_ms = {}
+        for name in ('hard', 'medium', 'easy'):
+            questions, ms = banks[name]
+            self.quiz_ms.update(dict.fromkeys(questions, ms))
+        self.default_quiz_ms = banks['easy'][1]   # "No more questions"
+
+    def reset(self, seed=None):
+        self.sim.reset(seed)
+        self.steps = 0
+        return self.observation(), self.info([])
+
+    def step(self, action):
+        s = self.sim
+        running = s.state == RUNNING
+        events = s.step(TICK_MS, ACTION_INPUTS[action])
+        self.steps += 1
+        reward = REWARDS['step'] if running and s.state == RUNNING else 0.0
+        for event in events:
+            reward += REWARDS.get(event, 0.0)
+        terminated = s.state == OVER
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observation(), reward, terminated, truncated, self.info(events)
+
+    def info(self, events):
+        s = self.sim
+        return {'score': s.score, 'lives': s.lives, 'correct_answers': s.correct_answers, 'events': events}
+
+    def observation(self):
+        s = self.sim
+        if self.pixels is not None:
+            return self._pixels()
+        p = s.player.rect
+        ahead = [o for o in s.obstacles if o.rect.right > PLAYER_LEFT][:2]
+        obstacles = []
+        for i in range(2):
+            if i < len(ahead):
+                o = ahead[i]
+                obstacles += [(o.rect.left - PLAYER_RIGHT) / SCREEN_WIDTH, float(o.type == 'burung')]
+            else:
+                obstacles += [1.0, 0.0]
+        gepreks = [g for g in s.gepreks if g.rect.right > PLAYER_LEFT]
+        if gepreks:
+            g = gepreks[0].rect
+            geprek = [(g.left - PLAYER_RIGHT) / SCREEN_WIDTH, g.bottom / SCREEN_HEIGHT]
+        else:
+            geprek = [1.0, 0.0]
+        shield = s.shield
+        quiz_ms = self.quiz_ms.get(s.current_question, self.default_quiz_ms)
+        obs = [p.bottom / SCREEN_HEIGHT, s.player.gravity / 30, float(s.player.on_ground),
+               s.lives / sim.MAX_LIVES,
+               1 - shield.elapsed_ms / shield.duration_ms if shield is not None else 0.0,
+               float(s.state == QUIZ), s.quiz_left_ms / quiz_ms] + obstacles + geprek
+        return np.array(obs, dtype=np.float32) if HAVE_NUMPY else obs
+
+    def _pixels(self):
+        s = self.sim
+        rects = [('player', s.player.rect)] + [(o.type, o.rect) for o in s.obstacles] \
+            + [('geprek', g.rect) for g in s.gepreks]
+        shapes = [(SHADES[kind], np.array([r.left]), np.array([r.top]), np.array([r.right]),
+                   np.array([r.bottom]), np.ones(1, dtype=bool)) for kind, r in rects]
+        return rasterize(self.pixels, np.array([s.state == RUNNING]), shapes)[0]
+
+
+# -----------------------
+# N games in arrays
+# -----------------------
+class VecRunnerEnv:
+    """N games stepped together; ``step(actions)`` takes an int array of N actions.
+
+    Returns ``(obs, rewards, terminated, truncated, info)`` with one row per
+    game. A game that ends is restarted in the same call; its final score
+    is in ``info['final_score']`` (-1 for games that did not end).
+
+    Obstacles and gepreks live in fixed slots per game, sized for the most
+    that the spawn intervals can put on screen at once. A spawn that finds
+    no free slot is dropped; ``dropped`` counts them (it stays 0 unless the
+    rules change after the env was made) and ``info['dropped']`` has the
+    total so far.
+    """
+
+    def __init__(self, n, seed=None, pixels=None, max_steps=MAX_STEPS, question_banks=None):
+        _require_numpy('VecRunnerEnv')
+        self.n = n
+        self.pixels = pixels
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        # rules read now, so overrides made before (batch.apply_rules) apply
+        self.obstacle_interval = sim.OBSTACLE_INTERVAL_MS
+        self.geprek_spawn = sim.GEPREK_SPAWN_MS
+        self.shield_duration = sim.SHIELD_DURATION_MS
+        self.quiz_interval = sim.QUIZ_INTERVAL_MS
+        self.max_lives = sim.MAX_LIVES
+
+        # an obstacle lives ~1000 px / OBSTACLE_STEP steps; one slot more than can be on screen
+        lifetime_ms = (900 + 150) / sim.OBSTACLE_STEP * TICK_MS
+        self.obstacle_slots = int(lifetime_ms // self.obstacle_interval) + 2
+        lifetime_ms = (900 + 50 + GEPREK_SIZE[0]) / (sim.GEPREK_SPEED // sim.TICK_RATE) * TICK_MS
+        self.geprek_slots = int(lifetime_ms // self.geprek_spawn[0]) + 2
+
+        # question banks as answer arrays; per game a shuffled order and a draw count per bank
+        banks = question_banks if question_banks is not None else default_question_banks()
+        self.bank_names = ('easy', 'medium', 'hard')
+        self.bank_answers = [np.array([a for _, a in banks[b][0]], dtype=bool) for b in self.bank_names]
+        self.bank_ms = np.array([banks[b][1] for b in self.bank_names], dtype=np.float64)
+
+        z = lambda dtype, *shape: np.zeros((n,) + shape, dtype=dtype)   # noqa: E731
+        self.state = z(np.int8)            # 0 running, 1 quiz
+        self.lives = z(np.int64)
+        self.correct = z(np.int64)
+        self.time_ms = z(np.float64)
+        self.steps = z(np.int64)
+        self.bottom = z(np.int64)          # player
+        self.vy = z(np.int64)
+        self.obstacle_in = z(np.float64)
+        self.geprek_in = z(np.float64)
+        self.quiz_in = z(np.float64)
+        self.quiz_left = z(np.float64)
+        self.quiz_ms = z(np.float64)       # duration of the current question
+        self.answer = z(bool)              # of the current question
+        self.shield = z(bool)
+        self.shield_elapsed = z(np.float64)
+        k = self.obstacle_slots
+        self.ob_alive = z(bool, k)
+        self.ob_left = z(np.int64, k)
+        self.ob_bird = z(bool, k)
+        k = self.geprek_slots
+        self.g_alive = z(bool, k)
+        self.g_left = z(np.int64, k)
+        self.g_start = z(np.int64, k)
+        self.g_center = z(np.float64, k)
+        self.g_phase = z(np.float64, k)
+        self.g_bottom = z(np.int64, k)
+        self.dropped = 0                   # spawns that found every slot taken
+        self.order = [z(np.int64, len(a)) for a in self.bank_answers]
+        self.drawn = [z(np.int64) for _ in self.bank_answers]
+        self._rows = np.arange(n)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset(np.ones(self.n, dtype=bool))
+        return self.observation(), {}
+
+    def _reset(self, m):
+        k = int(m.sum())
+        if not k:
+            return
+        self.state[m] = 0
+        self.lives[m] = self.max_lives
+        self.correct[m] = 0
+        self.time_ms[m] = 0
+        self.steps[m] = 0
+        self.bottom[m] = GROUND_Y
+        self.vy[m] = 0
+        self.obstacle_in[m] = self.obstacle_interval
+        self.geprek_in[m] = self.rng.integers(self.geprek_spawn[0], self.geprek_spawn[1] + 1, k)
+        self.quiz_in[m] = self.quiz_interval
+        self.quiz_left[m] = 0
+        self.quiz_ms[m] = self.bank_ms[0]
+        self.shield[m] = False
+        self.ob_alive[m] = False
+        self.g_alive[m] = False
+        for order, drawn, answers in zip(self.order, self.drawn, self.bank_answers):
+            order[m] = self.rng.random((k, len(answers))).argsort(axis=1)
+            drawn[m] = 0
+
+    @staticmethod
+    def _free_slot(alive, m):
+        """Index of the first free slot per game (games in ``m``), -1 when full."""
+        free = ~alive
+        slot = free.argmax(axis=1)
+        return np.where(m & free.any(axis=1), slot, -1)
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        n, rng, dt = self.n, self.rng, TICK_MS
+        rows = self._rows
+        reward = np.zeros(n, dtype=np.float64)
+        running = self.state == 0
+        in_quiz = ~running
+
+        # -- quiz: an answer ends it, otherwise its timer runs out
+        answered = in_quiz & (actions >= ANSWER_TRUE)
+        right = answered & ((actions == ANSWER_TRUE) == self.answer)
+        wrong = answered & ~right
+        self.correct += right
+        self.lives -= wrong
+        reward += right * REWARDS['correct'] + wrong * REWARDS['wrong']
+        waiting = in_quiz & ~answered
+        self.quiz_left[waiting] -= dt
+        ended = answered | (waiting & (self.quiz_left <= 0))
+        self.state[ended] = 0
+        self.quiz_left[ended] = 0
+        self.quiz_in[ended] = self.quiz_interval
+
+        # -- running: the quiz timer first; a game that starts a quiz does nothing else
+        self.quiz_in[running] -= dt
+        starting = running & (self.quiz_in <= 0)
+        if starting.any():
+            self._start_quiz(starting)
+        live = running & ~starting
+        self.time_ms[live] += dt
+        reward += live * REWARDS['step']
+
+        self.obstacle_in[live] -= dt
+        spawn = live & (self.obstacle_in <= 0)
+        if spawn.any():
+            self.obstacle_in[spawn] += self.obstacle_interval
+            slot = self._free_slot(self.ob_alive, spawn)
+            g = slot >= 0
+            k = int(g.sum())
+            self.dropped += int(spawn.sum()) - k
+            bird = rng.integers(0, 3, k) == 2       # kucing twice as likely
+            x = rng.integers(800, 901, k)
+            width = np.where(bird, OBSTACLE_SIZES['burung'][0], OBSTACLE_SIZES['kucing'][0])
+            self.ob_alive[rows[g], slot[g]] = True
+            self.ob_bird[rows[g], slot[g]] = bird
+            self.ob_left[rows[g], slot[g]] = x - width // 2
+        self.geprek_in[live] -= dt
+        spawn = live & (self.geprek_in <= 0)
+        if spawn.any():
+            k = int(spawn.sum())
+            self.geprek_in[spawn] = rng.integers(self.geprek_spawn[0], self.geprek_spawn[1] + 1, k)
+            slot = self._free_slot(self.g_alive, spawn)
+            g = slot >= 0
+            k = int(g.sum())
+            self.dropped += int(spawn.sum()) - k
+            candidates = np.array(sim.GEPREK_Y_CANDIDATES)
+            y = np.minimum(candidates[rng.integers(0, len(candidates), k)], GROUND_Y - 6)
+            phase = rng.integers(0, 361, k) * math.pi / 180.0
+            r, c = rows[g], slot[g]
+            left = 900 - GEPREK_SIZE[0] // 2
+            self.g_alive[r, c] = True
+            self.g_left[r, c] = left
+            self.g_start[r, c] = left
+            self.g_center[r, c] = y
+            self.g_phase[r, c] = phase
+            self.g_bottom[r, c] = y
+
+        # player
+        jump = live & (actions == JUMP) & (self.bottom >= GROUND_Y)
+        self.vy[jump] = sim.JUMP_STEP
+        self.vy[live] += sim.GRAVITY_STEP
+        self.bottom[live] += self.vy[live]
+        landed = live & (self.bottom >= GROUND_Y)
+        self.bottom[landed] = GROUND_Y
+        self.vy[landed] = 0
+
+        # obstacles / gepreks
+        moving = live[:, None]
+        self.ob_left -= moving * sim.OBSTACLE_STEP
+        self.ob_alive &= ~(moving & (self.ob_left <= -150))
+        self.g_left -= moving * (sim.GEPREK_SPEED // sim.TICK_RATE)
+        wave = sim.GEPREK_AMPLITUDE * np.sin(2 * math.pi * (self.g_start - self.g_left) / sim.GEPREK_WAVELENGTH
+                                             + self.g_phase)
+        self.g_bottom = np.where(moving, np.minimum((self.g_center + wave).astype(np.int64), GROUND_Y - 2),
+                                 self.g_bottom)
+        self.g_alive &= ~(moving & (self.g_left + GEPREK_SIZE[0] < -50))
+
+        # shield
+        self.shield_elapsed[live & self.shield] += dt
+        self.shield &= ~(live & (self.shield_elapsed >= self.shield_duration))
+
+        # collisions (pygame colliderect: overlap of the open rects)
+        top = self.bottom - PLAYER_SIZE[1]
+        bottom = self.bottom[:, None]
+        touching = (self.g_alive & moving & (self.g_left < PLAYER_RIGHT) & (self.g_left + GEPREK_SIZE[0] > PLAYER_LEFT)
+                    & (self.g_bottom - GEPREK_SIZE[1] < bottom) & (self.g_bottom > top[:, None]))
+        picked = touching.any(axis=1)
+        self.g_alive &= ~touching
+        self.lives[picked] = np.minimum(self.max_lives, self.lives[picked] + 1)
+        self.shield[picked] = True
+        self.shield_elapsed[picked] = 0
+        reward += picked * REWARDS['pickup']
+
+        width = np.where(self.ob_bird, OBSTACLE_SIZES['burung'][0], OBSTACLE_SIZES['kucing'][0])
+        height = np.where(self.ob_bird, OBSTACLE_SIZES['burung'][1], OBSTACLE_SIZES['kucing'][1])
+        ob_bottom = np.where(self.ob_bird, OBSTACLE_Y['burung'], OBSTACLE_Y['kucing'])
+        touching = (self.ob_alive & moving & (self.ob_left < PLAYER_RIGHT) & (self.ob_left + width > PLAYER_LEFT)
+                    & (ob_bottom - height < bottom) & (ob_bottom > top[:, None]))
+        hit = touching.any(axis=1)
+        self.ob_alive &= ~touching
+        blocked = hit & self.shield
+        self.shield[blocked] = False
+        lost = hit & ~blocked
+        self.lives -= lost
+        reward += lost * REWARDS['hit']
+
+        self.steps += 1
+        terminated = self.lives <= 0
+        truncated = ~terminated & (self.steps >= self.max_steps)
+        done = terminated | truncated
+        final_score = np.where(done, (self.time_ms // 10).astype(np.int64), -1)
+        self._reset(done)
+        info = {'final_score': final_score, 'dropped': self.dropped}
+        return self.observation(), reward, terminated, truncated, info
+
+    def _start_quiz(self, m):
+        # Simulation.start_quiz: a random bank, falling back to harder ones when it is used up
+        pick = self.rng.integers(0, 3, self.n)
+        left = [drawn < len(a) for drawn, a in zip(self.drawn, self.bank_answers)]
+        bank = np.where((pick == 0) & left[0], 0, np.where((pick == 1) & left[1], 1, np.where(left[2], 2, -1)))
+        self.state[m] = 1
+        self.answer[m] = True                      # "No more questions"
+        self.quiz_left[m] = self.bank_ms[0]
+        self.quiz_ms[m] = self.bank_ms[0]
+        for b, (order, drawn, answers) in enumerate(zip(self.order, self.drawn, self.bank_answers)):
+            g = m & (bank == b)
+            if g.any():
+                r = self._rows[g]
+                self.answer[g] = answers[order[r, drawn[g]]]
+                self.quiz_left[g] = self.bank_ms[b]
+                self.quiz_ms[g] = self.bank_ms[b]
+                drawn[g] += 1
+
+    @property
+    def score(self):
+        return (self.time_ms // 10).astype(np.int64)
+
+    def observation(self):
+        if self.pixels is not None:
+            return self._pixels()
+        obs = np.zeros((self.n, OBS_SIZE), dtype=np.float32)
+        obs[:, 0] = self.bottom / SCREEN_HEIGHT
+        obs[:, 1] = self.vy / 30
+        obs[:, 2] = self.bottom >= GROUND_Y
+        obs[:, 3] = self.lives / self.max_lives
+        obs[:, 4] = np.where(self.shield, 1 - self.shield_elapsed / self.shield_duration, 0)
+        obs[:, 5] = self.state == 1
+        obs[:, 6] = self.quiz_left / self.quiz_ms
+        # the two nearest obstacles ahead
+        width = np.where(self.ob_bird, OBSTACLE_SIZES['burung'][0], OBSTACLE_SIZES['kucing'][0])
+        ahead = self.ob_alive & (self.ob_left + width > PLAYER_LEFT)
+        key = np.where(ahead, self.ob_left, 1 << 30)
+        nearest = key.argsort(axis=1)[:, :2]
+        for i in range(2):
+            slot = nearest[:, i]
+            found = ahead[self._rows, slot]
+            obs[:, 7 + 2 * i] = np.where(found, (self.ob_left[self._rows, slot] - PLAYER_RIGHT) / SCREEN_WIDTH, 1.0)
+            obs[:, 8 + 2 * i] = found & self.ob_bird[self._rows, slot]
+        ahead = self.g_alive & (self.g_left + GEPREK_SIZE[0] > PLAYER_LEFT)
+        slot = np.where(ahead, self.g_left, 1 << 30).argmin(axis=1)
+        found = ahead[self._rows, slot]
+        obs[:, 11] = np.where(found, (self.g_left[self._rows, slot] - PLAYER_RIGHT) / SCREEN_WIDTH, 1.0)
+        obs[:, 12] = np.where(found, self.g_bottom[self._rows, slot] / SCREEN_HEIGHT, 0.0)
+        return obs
+
+    def _pixels(self):
+        pw, ph = PLAYER_SIZE
+        shapes = [(SHADES['player'], np.full(self.n, PLAYER_LEFT), self.bottom - ph, np.full(self.n, PLAYER_RIGHT),
+                   self.bottom, np.ones(self.n, dtype=bool))]
+        for kind in ('kucing', 'burung'):
+            w, h = OBSTACLE_SIZES[kind]
+            bird = kind == 'burung'
+            for k in range(self.obstacle_slots):
+                left = self.ob_left[:, k]
+                shapes.append((SHADES[kind], left, np.full(self.n, OBSTACLE_Y[kind] - h), left + w,
+                               np.full(self.n, OBSTACLE_Y[kind]), self.ob_alive[:, k] & (self.ob_bird[:, k] == bird)))
+        gw, gh = GEPREK_SIZE
+        for k in range(self.geprek_slots):
+            left, bottom = self.g_left[:, k], self.g_bottom[:, k]
+            shapes.append((SHADES['geprek'], left, bottom - gh, left + gw, bottom, self.g_alive[:, k]))
+        return rasterize(self.pixels, self.state == 0, shapes)
+
+
+# -----------------------
+# throughput check
+# -----------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Environment steps per second (random actions)')
+    parser.add_argument('--envs', type=int, default=1024, help='games in the vectorized env')
+    parser.add_argument('--steps', type=int, default=20_000, help='steps of the single env')
+    parser.add_argument('--pixels', type=int, nargs=2, metavar=('W', 'H'))
+    args = parser.parse_args(argv)
+    pixels = tuple(args.pixels) if args.pixels else None
+
+    env = RunnerEnv(pixels=pixels)
+    env.reset(seed=1)
+    rng = np.random.default_rng(1) if HAVE_NUMPY else None
+    actions = rng.integers(0, N_ACTIONS, args.steps) if rng is not None else [0] * args.steps
+    start = time.perf_counter()
+    for a in actions:
+        _, _, terminated, truncated, _ = env.step(int(a))
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    print(f'RunnerEnv            {args.steps / elapsed:>12,.0f} steps/s')
+    if not HAVE_NUMPY:
+        return
+    venv = VecRunnerEnv(args.envs, seed=1, pixels=pixels)
+    venv.reset()
+    calls = max(1, 200_000 // args.envs)
+    start = time.perf_counter()
+    for _ in range(calls):
+        venv.step(rng.integers(0, N_ACTIONS, args.envs))
+    elapsed = time.perf_counter() - start
+    print(f'VecRunnerEnv x{args.envs:<6} {calls * args.envs / elapsed:>12,.0f} steps/s '
+          f'({elapsed / calls * 1000:.2f} ms / call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Run Limit Runner games without a window, e.g. for balancing checks.
+
+    python -m limit_runner.headless --games 1000 --seed 1
+"""
+import argparse
+import os
+import random
+import time
+
+# no window, no audio: must be set before pygame initialises anything
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from limit_runner.simulation import GROUND_Y, OVER, QUIZ, TICK_MS, Inputs, Simulation
+
+
+def jump_policy(sim, rng, skill=0.3):
+    """Simple bot: tries to jump when a kucing gets close (succeeding with
+    probability ``skill`` per frame), answers quizzes at random."""
+    if sim.state == QUIZ:
+        return Inputs(answer=rng.random() < 0.5)
+    prect = sim.player.rect
+    for o in sim.obstacles:
+        if o.rect.bottom >= GROUND_Y and 0 < o.rect.left - prect.right < 60:
+            return Inputs(jump=rng.random() < skill)
+    return Inputs()
+
+
+def random_policy(sim, rng, jump_rate=0.02):
+    """Baseline bot: jumps at random (``jump_rate`` per step), answers quizzes at random."""
+    if sim.state == QUIZ:
+        return Inputs(answer=rng.random() < 0.5)
+    return Inputs(jump=rng.random() < jump_rate)
+
+
+# name -> (policy, name of its tuning parameter) for command lines: "jump:0.5", "random:0.05"
+POLICIES = {'jump': (jump_policy, 'skill'), 'random': (random_policy, 'jump_rate')}
+
+
+def parse_policy(spec):
+    """"jump" / "jump:0.5" -> a policy(sim, rng) function."""
+    name, _, value = spec.partition(':')
+    if name not in POLICIES:
+        raise ValueError(f'unknown policy {name!r} (one of {", ".join(POLICIES)})')
+    policy, param = POLICIES[name]
+    if not value:
+        return policy
+    kwargs = {param: float(value)}
+    return lambda sim, rng: policy(sim, rng, **kwargs)
+
+
+def play(sim, policy=jump_policy, max_ticks=60 * 60 * 30, rng=None):
+    """Play one game to game over (or ``max_ticks``). Returns the number of steps taken."""
+    rng = rng if rng is not None else random.Random()
+    steps = 0
+    while sim.state != OVER and steps < max_ticks:
+        sim.step(TICK_MS, policy(sim, rng))
+        steps += 1
+    return steps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--max-ticks', type=int, default=60 * 60 * 30, help='cap per game (default 30 min)')
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    sim = Simulation(rng=rng)
+    total_steps = 0
+    scores = []
+    start = time.perf_counter()
+    for _ in range(args.games):
+        sim.reset()
+        total_steps += play(sim, max_ticks=args.max_ticks, rng=rng)
+        scores.append(sim.score)
+    elapsed = time.perf_counter() - start
+
+    print(f'{args.games} games, {total_steps} steps in {elapsed:.2f}s '
+          f'({total_steps / elapsed:,.0f} steps/s)')
+    print(f'score: mean {sum(scores) / len(scores):.0f}, min {min(scores)}, max {max(scores)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Named-player leaderboard: best correct answers and best score per player.
+
+Each metric keeps a list of ``(-value, name)`` sorted ascending (so the best
+player is first), maintained with ``bisect``. Lookups (rank, position of a
+player) are binary searches; top-N is a slice. Updating a player removes the
+old key and inserts the new one, which is a binary search plus a memmove of
+the list tail - microseconds at the 10k-entry scale we care about.
+"""
+from bisect import bisect_left, insort
+
+METRICS = ('answers', 'score')
+
+
+class Leaderboard:
+
+    def __init__(self):
+        self.players = {}   # name -> {'answers': best, 'score': best}
+        self._ranked = {metric: [] for metric in METRICS}
+        self.version = 0    # bumped whenever any ranking changes
+
+    def __len__(self):
+        return len(self.players)
+
+    def __contains__(self, name):
+        return name in self.players
+
+    def record(self, name, answers, score):
+        """Keeps the best of the stored and the given values; True if anything improved."""
+        best = self.players.get(name)
+        if best is None:
+            best = self.players[name] = {}
+        changed = False
+        for metric, value in zip(METRICS, (answers, score)):
+            old = best.get(metric)
+            if old is not None and value <= old:
+                continue
+            ranked = self._ranked[metric]
+            if old is not None:
+                del ranked[bisect_left(ranked, (-old, name))]
+            insort(ranked, (-value, name))
+            best[metric] = value
+            changed = True
+        if changed:
+            self.version += 1
+        return changed
+
+    def best(self, name, metric):
+        return self.players.get(name, {}).get(metric)
+
+    def top(self, n, metric):
+        """[(name, value), ...] of the n best players."""
+        return [(name, -neg) for neg, name in self._ranked[metric][:n]]
+
+    def rank(self, name, metric):
+        """1-based rank (players with the same value share a rank), None if unknown."""
+        value = self.best(name, metric)
+        if value is None:
+            return None
+        return bisect_left(self._ranked[metric], (-value,)) + 1
+
+    def load(self, players):
+        for name, best in players.items():
+            self.record(name, best.get('answers', 0), best.get('score', 0))
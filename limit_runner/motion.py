@@ -0,0 +1,122 @@
+"""Batched (NumPy) motion for wave-moving gepreks and shield orbiters.
+
+Positions, phases, amplitudes and angles are kept in contiguous arrays and
+advanced with one vectorized step per frame instead of a ``math.sin`` /
+``math.cos`` call per sprite. NumPy is optional: without it
+``HAVE_NUMPY`` is False and the simulation keeps using the per-sprite
+``Geprek.update`` / ``Shield`` path.
+
+The two paths use the same formulas, but NumPy's sin/cos may differ from the
+math module in the last bit, so a replay must run on the path it was
+recorded with.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:   # optional dependency
+    np = None
+
+HAVE_NUMPY = np is not None
+
+
+class WaveBatch:
+    """Steps every geprek of the simulation in one go (see ``Geprek.update``).
+
+    The arrays are reloaded from the entities after ``invalidate()``, which
+    the simulation calls whenever the group changes (spawn / pickup / leaving
+    the screen); in between only the arrays move and the new x / bottom are
+    written back to the rects, which collision and drawing read.
+    """
+
+    def __init__(self, max_bottom):
+        self.max_bottom = max_bottom
+        self.stale = True
+
+    def invalidate(self):
+        self.stale = True
+
+    def _load(self, gepreks):
+        self.stale = False
+        self.x = np.array([g.rect.x for g in gepreks], dtype=np.int64)
+        self.width = np.array([g.rect.width for g in gepreks], dtype=np.int64)
+        self.start_x = np.array([g.start_x for g in gepreks], dtype=np.int64)
+        self.speed = np.array([g.speed for g in gepreks], dtype=np.int64)
+        self.y_center = np.array([g.y_center for g in gepreks], dtype=np.float64)
+        self.amplitude = np.array([g.amplitude for g in gepreks], dtype=np.float64)
+        self.wavelength = np.array([g.wavelength for g in gepreks], dtype=np.float64)
+        self.phase = np.array([g.phase for g in gepreks], dtype=np.float64)
+
+    def step(self, gepreks):
+        if not gepreks:
+            return
+        if self.stale:
+            self._load(gepreks)
+        self.x -= self.speed
+        x_moved = self.start_x - self.x
+        y_offset = self.amplitude * np.sin(2 * math.pi * x_moved / self.wavelength + self.phase)
+        bottom = np.minimum((self.y_center + y_offset).astype(np.int64), self.max_bottom)
+        gone = (self.x + self.width) < -50
+
+        for g, x, b, off in zip(gepreks, self.x.tolist(), bottom.tolist(), gone.tolist()):
+            rect = g.rect
+            g.prev = rect.topleft
+            rect.x = x
+            rect.bottom = b
+            if off:
+                g.alive = False
+
+
+class BatchShield:
+    """Array-backed drop-in for ``simulation.Shield`` (same attributes / methods).
+
+    Orbiter positions only exist as arrays; they are turned into draw
+    positions in ``positions()`` and never written to rects.
+    """
+
+    def __init__(self, player, count, radius, duration_ms, rotate_speed, item_size):
+        self.player = player
+        self.count = count
+        self.radius = radius
+        self.duration_ms = duration_ms
+        self.elapsed_ms = 0
+        self.rotate_speed = rotate_speed
+        self.half = np.array([item_size[0] // 2, item_size[1] // 2], dtype=np.int64)
+        self.angles = np.arange(count, dtype=np.float64) * (2 * math.pi / count)
+        # orbiter topleft (n, 2), now and before the last step
+        self.topleft = np.empty((count, 2), dtype=np.int64)
+        self.topleft[:] = np.array(player.rect.center, dtype=np.int64) - self.half
+        self.prev = self.topleft.copy()
+        self.alive = True
+
+    def refresh(self):
+        self.elapsed_ms = 0
+
+    def get_state(self):
+        # same layout as Shield.get_state
+        return (self.elapsed_ms, [(tuple(t), a, tuple(p)) for t, a, p in
+                                  zip(self.topleft.tolist(), self.angles.tolist(), self.prev.tolist())])
+
+    def set_state(self, state):
+        self.elapsed_ms, items = state
+        for i, (topleft, ang, prev) in enumerate(items):
+            self.topleft[i] = topleft
+            self.angles[i] = ang
+            self.prev[i] = prev
+
+    def update(self, dt):
+        self.elapsed_ms += dt
+        if self.elapsed_ms >= self.duration_ms:
+            self.alive = False
+            return
+        cx, cy = self.player.rect.center
+        self.prev[:] = self.topleft
+        self.angles += self.rotate_speed
+        # int() truncation, like the per-sprite path
+        self.topleft[:, 0] = cx + (self.radius * np.cos(self.angles)).astype(np.int64)
+        self.topleft[:, 1] = cy + (self.radius * np.sin(self.angles)).astype(np.int64)
+        self.topleft -= self.half
+
+    def positions(self, alpha):
+        """Interpolated topleft of every orbiter, for drawing."""
+        return (self.prev + (self.topleft - self.prev) * alpha).tolist()
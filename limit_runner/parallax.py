@@ -0,0 +1,176 @@
+"""Parallax background: layers declared with a speed and wrap behaviour.
+
+Every layer image is prepared once when the layer is created:
+
+* it is cropped to the part that is visible on screen and not fully
+  transparent (most of our layer PNGs are a full 720x480 canvas with a small
+  drawing on it);
+* the cropped part gets the cheapest format for its pixels
+  (``surfaces.optimize``): opaque content no alpha, binary transparency a
+  colour key, RLE encoded like partial transparency;
+* ``'tile'`` layers (seamless, e.g. the ground) are pre-composited into a
+  wrap-around strip holding the image repeated, so a frame is one blit of a
+  sub-rect of the strip.
+
+Wrap behaviour:
+
+  'tile'   seamless, repeats forever
+  'loop'   a single image that re-enters from the right ``spawn_ms`` after
+           it has left the screen on the left
+  'once'   crosses the screen once per ``reset()``
+  'static' does not move
+
+Positions advance once per simulation step (``update``); ``draw`` places
+them between the last two steps like the sprites.
+"""
+import time
+
+import pygame
+
+from limit_runner.simulation import TICK_RATE
+from limit_runner.surfaces import classify, describe, optimize
+
+
+class Layer:
+    def __init__(self, name, image, pos=(0, 0), speed=0, wrap='static', spawn_ms=None,
+                 view_size=(720, 480), rle=True):
+        """``pos`` is where the full image sits with the layer at x=0, ``speed`` is px/s;
+        ``rle=False`` keeps plain convert() / convert_alpha() surfaces."""
+        self.name = name
+        self.speed = speed
+        self.wrap = wrap
+        self.spawn_ms = None if wrap == 'once' else spawn_ms
+        self.view_w, view_h = view_size
+
+        # visible rows of the image (a static layer: the visible area), then
+        # only the non-transparent part
+        if wrap == 'static':
+            visible = pygame.Rect(-pos[0], -pos[1], self.view_w, view_h)
+        else:
+            visible = pygame.Rect(0, -pos[1], image.get_width(), view_h)
+        visible = visible.clip(image.get_rect())
+        content = image.subsurface(visible).get_bounding_rect().move(visible.topleft)
+        if wrap == 'tile':
+            # keep the full width, the strip must repeat with the image's period
+            content = pygame.Rect(0, content.y, image.get_width(), content.height)
+        part = image.subsurface(content)
+        self.kind = classify(part)
+        self.opaque = self.kind == 'opaque'
+        self.offset = (pos[0] + content.x, pos[1] + content.y)
+        self.width = content.width
+        self.image_width = image.get_width()   # wrap period / travel distance
+
+        if wrap == 'tile':
+            copies = -(-self.view_w // self.width) + 1
+            strip = pygame.Surface((self.width * copies, part.get_height()), 0 if self.opaque else pygame.SRCALPHA)
+            strip = strip.convert() if self.opaque else strip.convert_alpha()
+            for i in range(copies):
+                strip.blit(part, (i * self.width, 0))
+            self.image = optimize(strip, self.kind, rle)
+        else:
+            self.image = optimize(part, self.kind, rle)
+
+        self.visible = True   # hidden layers keep moving, they are only not drawn
+        self.draw_time = 0.0   # seconds spent blitting (at the flush when drawn into a render queue)
+        self.draws = 0
+        self.reset()
+
+    def reset(self, x=None):
+        """Back to the start: tiles at 0, moving sprites entering from the right edge."""
+        if x is None:
+            x = 0 if self.wrap in ('tile', 'static') else self.view_w
+        self.x = x
+        self.active = True
+        self.wait_ms = 0
+
+    @property
+    def step_px(self):
+        return self.speed / TICK_RATE
+
+    def update(self, dt):
+        if self.wrap == 'static':
+            return
+        if not self.active:
+            if self.spawn_ms is None:
+                return
+            self.wait_ms -= dt
+            if self.wait_ms <= 0:
+                self.active = True
+                self.x = self.view_w
+            return
+        self.x -= self.step_px
+        if self.wrap == 'tile':
+            if self.x <= -self.width:
+                self.x += self.width
+        elif self.x + self.image_width <= 0:
+            if self.spawn_ms == 0:
+                self.x = self.view_w
+            else:
+                self.active = False
+                self.wait_ms = self.spawn_ms or 0
+
+    def draw(self, surface, alpha=1.0):
+        if not self.active:
+            return
+        # a render queue layer only collects the blit: it times it when drawing it
+        charge = getattr(surface, 'charge', None)
+        if charge is not None:
+            charge(self)
+        start = time.perf_counter()
+        # layers move left every step, so "between steps" is slightly to the right
+        x = self.x + self.step_px * (1 - alpha)
+        if self.wrap == 'tile':
+            offset = int(-x) % self.width
+            surface.blit(self.image, self.offset, (offset, 0, self.view_w, self.image.get_height()))
+        else:
+            surface.blit(self.image, (x + self.offset[0], self.offset[1]))
+        if charge is None:
+            self.draw_time += time.perf_counter() - start
+            self.draws += 1
+
+
+class Parallax:
+    """Back-to-front list of layers."""
+
+    def __init__(self, layers=()):
+        self.layers = list(layers)
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def reset(self):
+        for layer in self.layers:
+            layer.reset()
+
+    def hide(self, names=()):
+        """Draw every layer but the ones in ``names`` (the rest: all shown again)."""
+        for layer in self.layers:
+            layer.visible = layer.name not in names
+
+    def update(self, dt):
+        for layer in self.layers:
+            layer.update(dt)
+
+    def draw(self, surface, alpha=1.0):
+        """Returns the number of blits."""
+        drawn = 0
+        for layer in self.layers:
+            if layer.active and layer.visible:
+                layer.draw(surface, alpha)
+                drawn += 1
+        return drawn
+
+    def timings(self):
+        """layer name -> mean draw time in ms."""
+        return {layer.name: (layer.draw_time / layer.draws * 1000 if layer.draws else 0.0)
+                for layer in self.layers}
+
+    def report(self):
+        lines = ['parallax layers:']
+        timings = self.timings()
+        for layer in self.layers:
+            ms = timings[layer.name]
+            lines.append(f'  {layer.name:<8} {layer.wrap:<6} {describe(layer.image):<12} {layer.image.get_width():>5}x'
+                         f'{layer.image.get_height():<4} {ms:.3f} ms/draw')
+        return '\n'.join(lines)
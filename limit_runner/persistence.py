@@ -0,0 +1,171 @@
+"""Crash-safe saving of the player's bests and a short journal of past runs.
+
+Every write goes to a temp file in the same directory, is fsync'ed and then
+renamed over the save file, so a power cut leaves either the old or the new
+file on disk, never half of one. Writes run on a background thread; saves
+requested while one is pending are coalesced into a single write.
+"""
+import json
+import os
+import threading
+import time
+
+JOURNAL_SIZE = 50
+
+
+def atomic_write_json(path, data):
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # make the rename itself durable (not possible on Windows)
+    if hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def empty_save():
+    return {"best_answers": 0, "best_score": 0, "runs": [], "players": {}}
+
+
+def _valid_run(run):
+    # hand-edited or older journals: record_run and the leaderboard need both numbers
+    return (isinstance(run, dict) and isinstance(run.get("score"), int)
+            and isinstance(run.get("answers"), int))
+
+
+def load_save(path):
+    """Reads the save file; a file that does not parse is moved aside, not lost."""
+    data = empty_save()
+    if not os.path.exists(path):
+        return data
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+        data["best_answers"] = int(loaded.get("best_answers", 0))
+        data["best_score"] = int(loaded.get("best_score", 0))
+        data["runs"] = [run for run in loaded.get("runs", []) if _valid_run(run)][-JOURNAL_SIZE:]
+        if "players" in loaded:
+            data["players"] = {name: {"answers": int(best.get("answers", 0)), "score": int(best.get("score", 0))}
+                               for name, best in dict(loaded["players"]).items() if isinstance(best, dict)}
+        elif data["best_answers"] or data["best_score"]:
+            # saves from before named players: the bests belonged to "You"
+            data["players"] = {"You": {"answers": data["best_answers"], "score": data["best_score"]}}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        broken = f'{path}.corrupt'
+        print(f'save file {path} is unreadable ({e}); kept as {broken}')
+        try:
+            os.replace(path, broken)
+        except OSError:
+            pass
+        return empty_save()
+    return data
+
+
+class SaveService:
+    """Owns the save data; ``record_run`` updates it and queues a background write.
+
+    ``flush()`` waits for pending writes, ``close()`` flushes and stops the
+    worker (call it on exit).
+    """
+
+    def __init__(self, path, journal_size=JOURNAL_SIZE):
+        self.path = path
+        self.journal_size = journal_size
+        self.data = load_save(path)
+        self.requested = 0   # saves asked for
+        self.written = 0     # files actually written
+        self.errors = 0
+        self._version = 0    # bumped on every change
+        self._saved_version = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name='save-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def best_answers(self):
+        return self.data["best_answers"]
+
+    @property
+    def best_score(self):
+        return self.data["best_score"]
+
+    @property
+    def runs(self):
+        return self.data["runs"]
+
+    @property
+    def players(self):
+        return self.data["players"]
+
+    def record_run(self, score, answers, player=None, **extra):
+        """Adds a finished run to the journal and raises the bests if beaten.
+
+        With ``player`` the run also counts towards that player's own bests.
+        """
+        with self._cond:
+            run = {"time": int(time.time()), "score": score, "answers": answers}
+            if player is not None:
+                run["player"] = player
+            run.update(extra)
+            runs = self.data["runs"]
+            runs.append(run)
+            del runs[:-self.journal_size]
+            self.data["best_answers"] = max(self.data["best_answers"], answers)
+            self.data["best_score"] = max(self.data["best_score"], score)
+            if player is not None:
+                best = self.data["players"].setdefault(player, {"answers": 0, "score": 0})
+                best["answers"] = max(best["answers"], answers)
+                best["score"] = max(best["score"], score)
+        self.save()
+
+    def save(self):
+        with self._cond:
+            self.requested += 1
+            self._version += 1
+            self._cond.notify()
+
+    def flush(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: self._saved_version == self._version, timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._saved_version != self._version)
+                if self._saved_version == self._version:
+                    return   # closed, nothing left to write
+                version = self._version
+                snapshot = json.loads(json.dumps(self.data))
+            try:
+                atomic_write_json(self.path, snapshot)
+                self.written += 1
+            except OSError as e:
+                self.errors += 1
+                print(f'saving {self.path} failed: {e}')
+            with self._cond:
+                self._saved_version = version
+                self._cond.notify_all()
+
+    def stats(self):
+        return {"requested": self.requested, "written": self.written,
+                "coalesced": self.requested - self.written - self.errors, "errors": self.errors}
+
+    def report(self):
+        s = self.stats()
+        return (f'saves: {s["requested"]} requested, {s["written"]} written, '
+                f'{s["coalesced"]} coalesced, {s["errors"]} failed')
@@ -0,0 +1,37 @@
+class Pool:
+    """Recycles entities instead of allocating a new one per spawn.
+
+    ``factory(*args)`` builds a new entity; a recycled one is re-initialised
+    with ``entity.reset(*args)``, so both take the same arguments.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._free = []
+        self.allocated = 0   # entities ever created
+        self.live = 0        # handed out and not yet released
+
+    @property
+    def pooled(self):
+        return len(self._free)
+
+    def acquire(self, *args):
+        self.live += 1
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(*args)
+            return entity
+        self.allocated += 1
+        return self.factory(*args)
+
+    def release(self, entity):
+        self.live -= 1
+        self._free.append(entity)
+
+    def release_all(self, entities):
+        for e in entities:
+            self.release(e)
+        entities.clear()
+
+    def stats(self):
+        return {"live": self.live, "pooled": self.pooled, "allocated": self.allocated}
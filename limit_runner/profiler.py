@@ -0,0 +1,236 @@
+"""Per-frame phase timings, counters and an on-screen overlay.
+
+The main loop calls ``start_frame()`` and then ``lap(phase)`` after each
+phase; a lap is the time since the previous one. Work that happens inside a
+phase but should be reported on its own (collision inside the simulation
+step) is timed with ``wrap()`` and subtracted from the enclosing lap.
+
+While disabled every call returns immediately, so the profiler can stay in
+the loop; it is switched on with ``--profile`` or at runtime (F3).
+
+``StartupTimer`` keeps the milestones of the game's startup (first menu
+frame, first gameplay frame) for the report printed on exit.
+"""
+import csv
+import json
+import time
+from bisect import bisect_right
+from collections import deque
+
+import pygame
+
+PHASES = ('events', 'simulation', 'collision', 'render', 'flip', 'idle')
+# phases that make up the work of a frame (idle is clock.tick waiting)
+WORK_PHASES = PHASES[:-1]
+# blit_calls: the blits() calls that drew the queued blits (renderqueue.py)
+COUNTERS = ('blits', 'blit_calls', 'font_renders', 'steps')
+# frame-time histogram bucket upper bounds in ms; the last bucket is open
+HISTOGRAM_MS = (1, 2, 4, 8, 12, 16.7, 25, 33.3, 50)
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))
+    return sorted_values[i]
+
+
+class FrameProfiler:
+
+    def __init__(self, enabled=False, window=600, keep_frames=False, font_renders=None):
+        """``window`` frames feed the rolling percentiles; ``keep_frames`` keeps
+        every frame for export. ``font_renders()`` returns a running total of
+        font renders done outside ``count()`` (the text caches)."""
+        self.enabled = enabled
+        self.keep_frames = keep_frames
+        self.font_renders = font_renders
+        self.recent = {name: deque(maxlen=window) for name in PHASES + ('frame',)}
+        self.histogram = [0] * (len(HISTOGRAM_MS) + 1)
+        self.frames = []   # one dict per frame when keep_frames
+        self.frame_count = 0
+        self.last = {}     # the last finished frame
+        self._t = 0.0
+        self._nested = 0.0
+        self._current = None
+        self._fonts_before = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._current = None
+
+    def start_frame(self):
+        if not self.enabled:
+            return
+        self._current = dict.fromkeys(PHASES + COUNTERS, 0)
+        self._nested = 0.0
+        if self.font_renders is not None:
+            self._fonts_before = self.font_renders()
+        self._t = time.perf_counter()
+
+    def lap(self, phase):
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        self._current[phase] += (now - self._t - self._nested) * 1000
+        self._nested = 0.0
+        self._t = now
+
+    def add(self, phase, seconds):
+        # time spent in a nested phase, taken out of the enclosing lap
+        self._current[phase] += seconds * 1000
+        self._nested += seconds
+
+    def wrap(self, phase, fn):
+        """``fn`` timed as ``phase`` whenever the profiler is on."""
+        def timed(*args, **kwargs):
+            if self._current is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+        return timed
+
+    def count(self, counter, n=1):
+        if self._current is not None:
+            self._current[counter] += n
+
+    def end_frame(self):
+        frame = self._current
+        if frame is None:
+            return
+        self._current = None
+        if self.font_renders is not None:
+            frame['font_renders'] += self.font_renders() - self._fonts_before
+        work = sum(frame[p] for p in WORK_PHASES)
+        frame['frame'] = work
+        for name, values in self.recent.items():
+            values.append(frame[name])
+        self.histogram[bisect_right(HISTOGRAM_MS, work)] += 1
+        self.frame_count += 1
+        self.last = frame
+        if self.keep_frames:
+            self.frames.append(frame)
+
+    # -----------------------
+    # results
+    # -----------------------
+    def summary(self):
+        """phase -> {p50, p95, p99, mean} in ms over the rolling window."""
+        out = {}
+        for name, values in self.recent.items():
+            ordered = sorted(values)
+            out[name] = {
+                'p50': percentile(ordered, 50),
+                'p95': percentile(ordered, 95),
+                'p99': percentile(ordered, 99),
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+            }
+        return out
+
+    def histogram_rows(self):
+        """[(label, frames), ...] for the work time of every profiled frame."""
+        rows = []
+        low = 0
+        for high, n in zip(HISTOGRAM_MS + (None,), self.histogram):
+            label = f'{low}-{high} ms' if high is not None else f'>{low} ms'
+            rows.append((label, n))
+            low = high
+        return rows
+
+    def lines(self):
+        """Overlay / console text."""
+        s = self.summary()
+        out = [f'{"":<10} {"p50":>6} {"p95":>6} {"p99":>6}']
+        for name in ('frame',) + WORK_PHASES:
+            v = s[name]
+            out.append(f'{name:<10} {v["p50"]:>6.2f} {v["p95"]:>6.2f} {v["p99"]:>6.2f}')
+        last = self.last
+        calls = last.get('blit_calls')
+        out.append(f'blits {last.get("blits", 0)}{f" in {calls} calls" if calls else ""}  '
+                   f'fonts {last.get("font_renders", 0)}  '
+                   f'steps {last.get("steps", 0)}')
+        return out
+
+    def export(self, path):
+        """Per-frame rows as .csv, or summary + histogram (+ frames) as .json."""
+        if path.endswith('.csv'):
+            fields = ('frame',) + PHASES + COUNTERS
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(('index',) + fields)
+                for i, frame in enumerate(self.frames):
+                    writer.writerow([i] + [round(frame[k], 4) if isinstance(frame[k], float) else frame[k]
+                                           for k in fields])
+        else:
+            data = {
+                'frames_profiled': self.frame_count,
+                'summary_ms': self.summary(),
+                'histogram': self.histogram_rows(),
+                'frames': self.frames,
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+
+
+class ProfilerOverlay:
+    """Draws ``profiler.lines()`` in a box; the text is re-rendered a few times a second.
+
+    The lines are laid out on a fixed character grid (glyphs rendered once), so the
+    columns line up in any font. The box is opaque and never shrinks, so redrawing it
+    over the last frame's overlay (``--dirty`` on a static scene) leaves nothing behind.
+    """
+
+    def __init__(self, profiler, font, every=15, pos=(8, 300)):
+        self.profiler = profiler
+        self.font = font
+        self.every = every
+        self.pos = pos
+        self.surface = None
+        self._frames = 0
+        self._glyphs = {}
+        self._cell = (font.size('0')[0], font.get_linesize())
+
+    def _glyph(self, char):
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._glyphs[char] = self.font.render(char, False, (255, 255, 255))
+        return glyph
+
+    def draw(self, surface):
+        if self.surface is None or self._frames % self.every == 0:
+            lines = self.profiler.lines()
+            cell_w, cell_h = self._cell
+            width = max(len(line) for line in lines) * cell_w + 8
+            height = len(lines) * cell_h + 8
+            if self.surface is not None:
+                width = max(width, self.surface.get_width())
+                height = max(height, self.surface.get_height())
+            box = pygame.Surface((width, height))
+            box.fill((0, 0, 0))
+            box.blits([(self._glyph(char), (4 + col * cell_w, 4 + row * cell_h))
+                       for row, line in enumerate(lines)
+                       for col, char in enumerate(line) if char != ' '], False)
+            self.surface = box
+        self._frames += 1
+        return surface.blit(self.surface, self.pos)
+
+
+class StartupTimer:
+    """Milestones of the game's startup, in seconds since launch (first time each is reached)."""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = {}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.started
+
+    def ms(self, name):
+        t = self.marks.get(name)
+        return None if t is None else t * 1000
+
+    def report(self):
+        return 'startup (ms since launch): ' + ', '.join(f'{name} {t * 1000:.1f}' for name, t in self.marks.items())
@@ -0,0 +1,115 @@
+"""Adaptive render quality: less detail when frames run over budget, more when there is room.
+
+The governor is fed the work time of every gameplay frame (everything but
+the wait in ``clock.tick``) and judges the last ``window`` of them by their
+90th percentile:
+
+* above ``down_at`` of the frame budget, it steps one level down at once;
+* below ``up_at`` of the budget for ``up_wait`` frames in a row, one level up.
+
+The gap between the two thresholds and the long wait before going up are
+the hysteresis. After every change the window starts empty, so a level is
+judged on its own frames only, and a step up that has to be taken back is
+not tried again as soon: each such bounce doubles ``up_wait`` (up to
+``MAX_UP_WAIT_FACTOR`` times the first).
+
+Levels only change what is drawn, never the simulation (shield orbiters,
+animation frames and spawns are part of recordings), so a run plays the
+same at every level.
+"""
+from collections import deque
+
+
+class Quality:
+    """Render settings of one level."""
+    __slots__ = ('name', 'hidden_layers', 'orbiter_step', 'hud_every')
+
+    def __init__(self, name, hidden_layers=(), orbiter_step=1, hud_every=1):
+        self.name = name
+        self.hidden_layers = hidden_layers   # parallax layers not drawn
+        self.orbiter_step = orbiter_step     # draw every n-th shield orbiter
+        self.hud_every = hud_every           # HUD counters re-render every n-th frame
+
+
+# best first
+LEVELS = (
+    Quality('full'),
+    Quality('no-clouds', hidden_layers=('awan',)),
+    Quality('reduced', hidden_layers=('awan', 'tiang'), orbiter_step=2),
+    Quality('minimal', hidden_layers=('awan', 'tiang'), orbiter_step=4, hud_every=6),
+)
+LEVEL_NAMES = [q.name for q in LEVELS]
+MAX_UP_WAIT_FACTOR = 8
+
+
+class QualityGovernor:
+
+    def __init__(self, budget_ms, levels=LEVELS, level=0, auto=True, window=60,
+                 down_at=0.9, up_at=0.6, up_wait=180, log=print):
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.level = level
+        self.auto = auto
+        self.down_at = down_at
+        self.up_at = up_at
+        self.first_up_wait = up_wait
+        self.up_wait = up_wait
+        self.log = log
+        self.samples = deque(maxlen=window)
+        self.calm = 0              # frames in a row with room to spare
+        self.last_change = 0       # +1 down, -1 up, 0 none yet
+        self.frames = 0
+        self.frames_at = [0] * len(levels)
+        self.changes = []          # (frame, from level, to level, p90 ms)
+
+    @property
+    def quality(self):
+        return self.levels[self.level]
+
+    def frame(self, work_ms):
+        """One gameplay frame took ``work_ms``; returns True when the level changed."""
+        self.frames += 1
+        self.frames_at[self.level] += 1
+        if not self.auto:
+            return False
+        samples = self.samples
+        samples.append(work_ms)
+        if len(samples) < samples.maxlen:
+            return False
+        ordered = sorted(samples)
+        p90 = ordered[int(len(ordered) * 0.9)]
+        if p90 > self.budget_ms * self.down_at:
+            if self.level + 1 < len(self.levels):
+                if self.last_change < 0:
+                    # it went up and could not hold: wait longer before the next try
+                    self.up_wait = min(self.up_wait * 2, self.first_up_wait * MAX_UP_WAIT_FACTOR)
+                self._change(self.level + 1, ordered, p90)
+                return True
+            self.calm = 0
+        elif p90 < self.budget_ms * self.up_at and self.level > 0:
+            self.calm += 1
+            if self.calm >= self.up_wait:
+                self._change(self.level - 1, ordered, p90)
+                return True
+        else:
+            self.calm = 0
+        return False
+
+    def _change(self, level, ordered, p90):
+        old = self.quality
+        self.last_change = 1 if level > self.level else -1
+        self.level = level
+        self.changes.append((self.frames, self.levels.index(old), level, p90))
+        self.log(f'quality: {old.name} -> {self.quality.name} at gameplay frame {self.frames}: '
+                 f'work p50 {ordered[len(ordered) // 2]:.1f} / p90 {p90:.1f} / max {ordered[-1]:.1f} ms '
+                 f'over {len(ordered)} frames, budget {self.budget_ms:.1f} ms')
+        self.samples.clear()
+        self.calm = 0
+
+    def report(self):
+        mode = 'auto' if self.auto else 'fixed'
+        if not self.frames:
+            return f'quality ({mode}): {self.quality.name}, no gameplay frames'
+        shares = ', '.join(f'{q.name} {n * 100 / self.frames:.0f}%'
+                           for q, n in zip(self.levels, self.frames_at) if n)
+        return f'quality ({mode}): now {self.quality.name}, {len(self.changes)} change(s); frames at {shares}'
@@ -0,0 +1,71 @@
+import json
+import os
+
+from limit_runner.assets import ROOT_DIR
+
+# -----------------------
+# Quiz questions: (text, answer) per difficulty, loaded from assets/questions.json
+# -----------------------
+# file format: {"easy": {"duration_ms": 10000, "questions": [{"text": ..., "answer": true}, ...]}, ...}
+QUESTIONS_FILE = os.path.join(ROOT_DIR, 'assets', 'questions.json')
+
+
+def load_question_banks(path=QUESTIONS_FILE):
+    """difficulty -> (questions, quiz duration in ms), questions as (text, answer) tuples."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    banks = {}
+    for name, bank in data.items():
+        try:
+            questions = [(q['text'], bool(q['answer'])) for q in bank['questions']]
+            banks[name] = (questions, int(bank['duration_ms']))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f'{path}: bad question bank {name!r} ({e!r})') from None
+    return banks
+
+
+class Deck:
+    """Questions of one difficulty served in random order, each once per run.
+
+    A lazy Fisher-Yates shuffle over question indices: ``draw`` swaps a
+    random not-yet-drawn index to the front of the remaining part, so every
+    draw is O(1) and ``reset`` (a new run) is O(1) too - the bank itself is
+    never copied or shrunk.
+    """
+
+    def __init__(self, questions, rng):
+        self.questions = questions
+        self.order = list(range(len(questions)))
+        self.rng = rng
+        self.drawn = 0
+
+    def __len__(self):
+        return len(self.order) - self.drawn
+
+    def reset(self):
+        self.drawn = 0
+
+    def draw(self):
+        order, i = self.order, self.drawn
+        j = self.rng.randrange(i, len(order))
+        order[i], order[j] = order[j], order[i]
+        self.drawn += 1
+        return self.questions[order[i]]
+
+    def get_state(self):
+        return (tuple(self.order), self.drawn)
+
+    def set_state(self, state):
+        order, self.drawn = state
+        self.order[:] = order
+
+
+_default_banks = None
+
+
+def default_question_banks():
+    """The banks of QUESTIONS_FILE, read on the first call (not at import)."""
+    global _default_banks
+    if _default_banks is None:
+        _default_banks = load_question_banks()
+    return _default_banks
@@ -0,0 +1,134 @@
+"""Batched drawing: blits are queued per layer and flushed in one call per layer.
+
+A gameplay frame is some 10 to several hundred blits (every shield orbiter,
+obstacle and geprek is one), each a separate call from Python into
+pygame. The draw functions now blit into a ``QueueLayer`` instead of the
+screen. It has the ``blit``/``blits`` of a Surface and only collects
+``(source, dest[, area])`` tuples. ``RenderQueue.flush(screen)`` then
+draws the layers back to front, each with a single ``fblits`` (pygame-ce)
+or ``blits(..., doreturn=False)`` call.
+
+Layers are drawn in ``LAYERS`` order whatever order they were filled in;
+within a layer, blits keep their submission order.
+
+Timing a single draw call tells nothing once it only queues. A drawer that
+wants its real cost calls ``charge(self)`` on the layer before queueing:
+its blits are then drawn in a call of their own at flush, and the time of
+that call goes to its ``draw_time`` / ``draws`` (parallax layers do this).
+"""
+import time
+
+LAYERS = ('background', 'sprites', 'effects', 'hud')
+
+
+class QueueLayer:
+    """Stands in for the target surface of one layer: ``blit`` / ``blits`` only queue."""
+    __slots__ = ('name', 'items', 'areas', 'owners', 'flush_time')
+
+    def __init__(self, name):
+        self.name = name
+        self.items = []
+        self.areas = False   # some blit has a source area (fblits takes (source, dest) only)
+        self.owners = []     # (index of the first item, owner) per charge()
+        self.flush_time = 0.0   # seconds spent drawing this layer
+
+    def blit(self, source, dest, area=None):
+        if area is None:
+            self.items.append((source, dest))
+        else:
+            self.items.append((source, dest, area))
+            self.areas = True
+
+    def blits(self, sequence):
+        self.items.extend(sequence)
+
+    def charge(self, owner):
+        """The blits queued from here on (up to the next charge) are timed for
+        ``owner`` at flush: its ``draw_time`` and ``draws`` go up."""
+        self.owners.append((len(self.items), owner))
+
+    def clear(self):
+        self.items.clear()
+        self.owners.clear()
+        self.areas = False
+
+
+def _draw(target, items, fblits):
+    if fblits is not None:
+        fblits(items)
+    else:
+        target.blits(items, doreturn=False)
+
+
+class RenderQueue:
+
+    def __init__(self, layers=LAYERS):
+        self.layers = [QueueLayer(name) for name in layers]
+        for layer in self.layers:
+            setattr(self, layer.name, layer)
+        # the last flush, and the totals over every flush
+        self.submitted = 0
+        self.calls = 0
+        self.total_submitted = 0
+        self.total_calls = 0
+        self.frames = 0
+
+    def pending(self):
+        return sum(len(layer.items) for layer in self.layers)
+
+    def flush(self, target):
+        """Draws every queued blit on ``target``, back layer first, and empties the queue."""
+        fblits = getattr(target, 'fblits', None)
+        submitted = calls = 0
+        for layer in self.layers:
+            items = layer.items
+            if not items:
+                layer.owners.clear()
+                continue
+            fast = fblits if not layer.areas else None
+            start = time.perf_counter()
+            if layer.owners:
+                calls += self._draw_charged(target, layer, fast)
+            else:
+                _draw(target, items, fast)
+                calls += 1
+            layer.flush_time += time.perf_counter() - start
+            submitted += len(items)
+            layer.clear()
+        self.submitted = submitted
+        self.calls = calls
+        self.total_submitted += submitted
+        self.total_calls += calls
+        self.frames += 1
+        return submitted, calls
+
+    @staticmethod
+    def _draw_charged(target, layer, fblits):
+        # one call for the blits before the first charge, then one per charge, timed
+        items, owners = layer.items, layer.owners
+        calls = 0
+        if owners[0][0]:
+            _draw(target, items[:owners[0][0]], fblits)
+            calls += 1
+        ends = [begin for begin, _ in owners[1:]] + [len(items)]
+        for (begin, owner), end in zip(owners, ends):
+            if begin == end:
+                continue
+            start = time.perf_counter()
+            _draw(target, items[begin:end], fblits)
+            owner.draw_time += time.perf_counter() - start
+            owner.draws += 1
+            calls += 1
+        return calls
+
+    def clear(self):
+        for layer in self.layers:
+            layer.clear()
+
+    def report(self):
+        if not self.frames:
+            return 'render queue: not used'
+        per_layer = ', '.join(f'{layer.name} {layer.flush_time / self.frames * 1000:.3f}'
+                              for layer in self.layers)
+        return (f'render queue: {self.frames} frames, {self.total_submitted / self.frames:.1f} blits '
+                f'in {self.total_calls / self.frames:.1f} calls per frame; ms/frame: {per_layer}')
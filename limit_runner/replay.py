@@ -0,0 +1,263 @@
+"""Recording and bit-for-bit playback of runs.
+
+A run is fully determined by its seed (``Simulation.reset(seed)``), the
+simulation settings and the inputs of every step, so a replay stores just
+those: one byte per step, run-length encoded. Every ``keyframe_every`` steps
+a compressed ``Simulation.get_state()`` is stored as well; seeking restores
+the nearest keyframe before the target and simulates only the rest, and
+playback checks the re-simulated world against every keyframe it passes.
+
+File layout (little endian)::
+
+    header   b'LRRP' u16 version  u64 seed  u8 batched_motion  u16 shield_count
+             u32 question-bank crc
+    records  u8 kind  u32 length  payload
+             kind b'I': inputs, runs of (u8 input byte, u16 count)
+             kind b'K': u32 tick + zlib(pickle(state))
+    index    b'X' record: u32 ticks, u32 keyframes, (u32 tick, u64 offset) * keyframes,
+             then zlib(pickle(summary))
+    trailer  u64 index offset  b'LRRX'
+
+    python -m limit_runner.replay RUN.lrr              # re-simulate at full speed, verify
+    python -m limit_runner.replay RUN.lrr --seek 600   # jump to tick 600 first
+"""
+import argparse
+import os
+import pickle
+import struct
+import time
+import zlib
+
+from limit_runner.simulation import OVER, TICK_MS, TICK_RATE, Inputs, Simulation
+
+MAGIC = b'LRRP'
+TRAILER = b'LRRX'
+VERSION = 2
+HEADER = struct.Struct('<4sHQBHI')
+RECORD = struct.Struct('<cI')
+RUN = struct.Struct('<BH')
+KEYFRAME_EVERY = 10 * TICK_RATE    # steps between keyframes
+INPUT_BLOCK = 16 * 1024            # max encoded bytes per inputs record
+
+JUMP = 1
+ANSWERED = 2
+ANSWER_TRUE = 4
+
+
+class ReplayError(Exception):
+    pass
+
+
+def encode_inputs(inputs):
+    b = JUMP if inputs.jump else 0
+    if inputs.answer is not None:
+        b |= ANSWERED | (ANSWER_TRUE if inputs.answer else 0)
+    return b
+
+
+def decode_inputs(b):
+    return Inputs(jump=bool(b & JUMP), answer=bool(b & ANSWER_TRUE) if b & ANSWERED else None)
+
+
+def banks_crc(question_banks):
+    return zlib.crc32(repr(sorted(question_banks.items())).encode('utf-8'))
+
+
+def state_crc(sim):
+    return zlib.crc32(pickle.dumps(sim.get_state(), protocol=4))
+
+
+class ReplayWriter:
+    """Records one run: call ``record(inputs)`` after every ``sim.step(TICK_MS, inputs)``."""
+
+    def __init__(self, path, sim, seed, keyframe_every=KEYFRAME_EVERY):
+        self.sim = sim
+        self.keyframe_every = keyframe_every
+        self.f = open(path, 'wb')
+        self.f.write(HEADER.pack(MAGIC, VERSION, seed, sim.batched_motion, sim.shield_count,
+                                 banks_crc(sim.question_banks)))
+        self.ticks = 0
+        self.keyframes = []   # (tick, offset)
+        self._runs = bytearray()
+        self._value = None
+        self._count = 0
+
+    def record(self, inputs):
+        b = encode_inputs(inputs)
+        if b == self._value and self._count < 0xFFFF:
+            self._count += 1
+        else:
+            self._end_run()
+            self._value, self._count = b, 1
+        self.ticks += 1
+        if self.ticks % self.keyframe_every == 0:
+            self._keyframe()
+
+    def _end_run(self):
+        if self._count:
+            self._runs += RUN.pack(self._value, self._count)
+            self._count = 0
+            if len(self._runs) >= INPUT_BLOCK:
+                self._flush_inputs()
+
+    def _flush_inputs(self):
+        if self._runs:
+            self._write(b'I', bytes(self._runs))
+            self._runs.clear()
+
+    def _write(self, kind, payload):
+        offset = self.f.tell()
+        self.f.write(RECORD.pack(kind, len(payload)))
+        self.f.write(payload)
+        return offset
+
+    def _keyframe(self):
+        self._end_run()
+        self._value = None
+        self._flush_inputs()
+        state = zlib.compress(pickle.dumps(self.sim.get_state(), protocol=4))
+        offset = self._write(b'K', struct.pack('<I', self.ticks) + state)
+        self.keyframes.append((self.ticks, offset))
+
+    def close(self):
+        if self.f.closed:
+            return
+        self._end_run()
+        self._flush_inputs()
+        sim = self.sim
+        summary = {'ticks': self.ticks, 'score': sim.score, 'lives': sim.lives,
+                   'correct_answers': sim.correct_answers, 'over': sim.state == OVER,
+                   'state_crc': state_crc(sim)}
+        index = struct.pack('<II', self.ticks, len(self.keyframes))
+        index += b''.join(struct.pack('<IQ', t, o) for t, o in self.keyframes)
+        index += zlib.compress(pickle.dumps(summary, protocol=4))
+        offset = self._write(b'X', index)
+        self.f.write(struct.pack('<Q', offset) + TRAILER)
+        self.f.close()
+
+
+class Replay:
+    """A recorded run, read once into memory (one byte per step once decoded)."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.path = path
+        self.size = len(data)
+        try:
+            magic, version, self.seed, batched, self.shield_count, self.banks_crc = HEADER.unpack_from(data)
+        except struct.error:
+            raise ReplayError(f'{path}: not a replay file') from None
+        if magic != MAGIC or data[-4:] != TRAILER:
+            raise ReplayError(f'{path}: not a complete replay file')
+        if version != VERSION:
+            raise ReplayError(f'{path}: replay version {version}, expected {VERSION}')
+        self.batched_motion = bool(batched)
+        self._data = data
+
+        (index_offset,) = struct.unpack_from('<Q', data, len(data) - 12)
+        kind, length = RECORD.unpack_from(data, index_offset)
+        index = data[index_offset + RECORD.size:index_offset + RECORD.size + length]
+        self.ticks, n = struct.unpack_from('<II', index)
+        self.keyframes = [struct.unpack_from('<IQ', index, 8 + 12 * i) for i in range(n)]
+        self.summary = pickle.loads(zlib.decompress(index[8 + 12 * n:]))
+
+        # all inputs, one byte per step
+        inputs = bytearray()
+        pos = HEADER.size
+        while pos < index_offset:
+            kind, length = RECORD.unpack_from(data, pos)
+            pos += RECORD.size
+            if kind == b'I':
+                for i in range(0, length, RUN.size):
+                    value, count = RUN.unpack_from(data, pos + i)
+                    inputs += bytes((value,)) * count
+            pos += length
+        if len(inputs) != self.ticks:
+            raise ReplayError(f'{path}: {len(inputs)} recorded inputs for {self.ticks} steps')
+        self.inputs = bytes(inputs)
+
+    def new_simulation(self, **kwargs):
+        """A simulation set up like the recorded one, at tick 0."""
+        sim = Simulation(batched_motion=self.batched_motion, shield_count=self.shield_count, **kwargs)
+        if banks_crc(sim.question_banks) != self.banks_crc:
+            raise ReplayError(f'{self.path}: recorded with different question banks')
+        sim.reset(self.seed)
+        return sim
+
+    def keyframe_state(self, offset):
+        kind, length = RECORD.unpack_from(self._data, offset)
+        payload = self._data[offset + RECORD.size + 4:offset + RECORD.size + length]
+        return pickle.loads(zlib.decompress(payload))
+
+    def seek(self, sim, tick):
+        """Brings ``sim`` to ``tick``: nearest keyframe, then simulate the rest."""
+        tick = max(0, min(tick, self.ticks))
+        start, offset = 0, None
+        for t, o in self.keyframes:
+            if t > tick:
+                break
+            start, offset = t, o
+        if offset is None:
+            sim.reset(self.seed)
+        else:
+            sim.set_state(self.keyframe_state(offset))
+        for b in self.inputs[start:tick]:
+            sim.step(TICK_MS, decode_inputs(b))
+        return tick
+
+    def play(self, sim, start=0, verify=True):
+        """Steps ``sim`` (already at ``start``) through the rest of the run.
+
+        Yields after every step; with ``verify`` the world is compared with
+        each keyframe passed and with the final state, and a mismatch raises
+        ReplayError.
+        """
+        keyframes = {t: o for t, o in self.keyframes if t > start}
+        for tick in range(start, self.ticks):
+            sim.step(TICK_MS, decode_inputs(self.inputs[tick]))
+            offset = keyframes.get(tick + 1)
+            if verify and offset is not None and self.keyframe_state(offset) != sim.get_state():
+                raise ReplayError(f'{self.path}: diverged from the recording before tick {tick + 1}')
+            yield tick + 1
+        if verify and state_crc(sim) != self.summary['state_crc']:
+            raise ReplayError(f'{self.path}: final state differs from the recording')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Re-simulate a recorded Limit Runner run')
+    parser.add_argument('replay')
+    parser.add_argument('--seek', type=int, default=0, help='start at this tick (via the nearest keyframe)')
+    parser.add_argument('--realtime', action='store_true', help='pace the steps at 60 per second')
+    parser.add_argument('--no-verify', action='store_true')
+    args = parser.parse_args(argv)
+    # no window, no audio (set here: the game imports this module too)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    replay = Replay(args.replay)
+    s = replay.summary
+    print(f'{args.replay}: {replay.ticks} steps ({replay.ticks / TICK_RATE:.1f}s), seed {replay.seed}, '
+          f'{len(replay.keyframes)} keyframes, {replay.size} bytes')
+    print(f'recorded: score {s["score"]}, answers {s["correct_answers"]}, lives {s["lives"]}')
+
+    sim = replay.new_simulation()
+    start = time.perf_counter()
+    at = replay.seek(sim, args.seek)
+    seek_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for tick in replay.play(sim, at, verify=not args.no_verify):
+        if args.realtime:
+            delay = (tick - at) / TICK_RATE - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+    elapsed = time.perf_counter() - start
+    steps = replay.ticks - at
+    print(f'seek to {at} in {seek_time * 1000:.1f} ms, replayed {steps} steps in {elapsed:.2f}s '
+          f'({steps / elapsed if elapsed else 0:,.0f} steps/s)')
+    print(f'replayed: score {sim.score}, answers {sim.correct_answers}, lives {sim.lives}'
+          + ('' if args.no_verify else '  (matches the recording)'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Timers on a pausable game clock.
+
+The clock only moves when ``advance(dt)`` is called, so the same calls always
+fire the same jobs at the same game times, however fast the steps come
+(a headless run fast-forwards simply by advancing more often). Jobs are kept
+in a heap ordered by due time and creation order; each ``advance`` pops the
+ones that are due.
+
+``pause()`` stops the clock and every job on it at once; ``resume()``
+continues where it stopped, so nothing has to be re-armed or shifted. A
+job that pauses the clock (the quiz) also stops the rest of that
+``advance``: jobs still due fire on the first advance after ``resume()``.
+
+Jobs have names so a scheduler's state can be captured as plain data and
+put back on the same jobs (replay keyframes).
+"""
+import heapq
+from itertools import count
+
+
+class Job:
+    __slots__ = ('name', 'fn', 'args', 'interval', 'due', 'seq', 'cancelled')
+
+    def __init__(self, name, fn, args, interval):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.interval = interval   # None (one-shot), ms, or a callable returning ms
+        self.due = 0.0
+        self.seq = 0
+        self.cancelled = False
+
+    def next_interval(self):
+        return self.interval() if callable(self.interval) else self.interval
+
+
+class Scheduler:
+    def __init__(self):
+        self.now = 0.0
+        self.paused = False
+        self.jobs = {}     # name -> Job
+        self._heap = []    # (due, seq, job)
+        self._seq = count()
+        self.fired = 0
+
+    def clear(self):
+        """Back to time 0, no jobs, running."""
+        self.now = 0.0
+        self.paused = False
+        self.jobs.clear()
+        self._heap.clear()
+
+    # -----------------------
+    # jobs
+    # -----------------------
+    def after(self, delay_ms, fn, *args, name=None):
+        """Run ``fn(*args)`` once, ``delay_ms`` of game time from now."""
+        return self._add(Job(name or fn.__name__, fn, args, None), delay_ms)
+
+    def every(self, interval, fn, *args, name=None, first=None):
+        """Run ``fn(*args)`` every ``interval`` ms (or every ``interval()`` ms,
+        drawn again each time). The first run is after ``first`` ms, by default
+        one interval."""
+        job = Job(name or fn.__name__, fn, args, interval)
+        return self._add(job, job.next_interval() if first is None else first)
+
+    def cancel(self, job):
+        # left in the heap, skipped when popped
+        job.cancelled = True
+        if self.jobs.get(job.name) is job:
+            del self.jobs[job.name]
+
+    def time_left(self, name):
+        job = self.jobs.get(name)
+        return job.due - self.now if job is not None else None
+
+    def _add(self, job, delay_ms):
+        old = self.jobs.get(job.name)
+        if old is not None:
+            old.cancelled = True
+        self.jobs[job.name] = job
+        self._schedule(job, self.now + delay_ms)
+        return job
+
+    def _schedule(self, job, due):
+        job.due = due
+        job.seq = next(self._seq)
+        heapq.heappush(self._heap, (due, job.seq, job))
+
+    # -----------------------
+    # clock
+    # -----------------------
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def advance(self, dt):
+        """Move the clock by ``dt`` ms (unless paused) and run the jobs that
+        are due, in due-time order. Returns the number of jobs run."""
+        if self.paused:
+            return 0
+        self.now += dt
+        heap = self._heap
+        ran = 0
+        while heap and heap[0][0] <= self.now and not self.paused:
+            due, seq, job = heapq.heappop(heap)
+            if job.cancelled:
+                continue
+            if job.interval is None:
+                del self.jobs[job.name]
+            else:
+                # from the due time, not from now: repeating jobs do not drift
+                self._schedule(job, due + job.next_interval())
+            job.fn(*job.args)
+            ran += 1
+        self.fired += ran
+        return ran
+
+    # -----------------------
+    # state capture
+    # -----------------------
+    def get_state(self):
+        # jobs in firing order for equal due times; the seq numbers themselves are not kept
+        jobs = sorted(self.jobs.values(), key=lambda job: job.seq)
+        return (self.now, self.paused, [(job.name, job.due) for job in jobs])
+
+    def set_state(self, state):
+        """Puts a captured state back; the jobs must already be registered under the same names."""
+        self.now, self.paused, jobs = state
+        self._heap.clear()
+        self.jobs = {name: self.jobs[name] for name, _ in jobs}
+        for name, due in jobs:
+            self._schedule(self.jobs[name], due)
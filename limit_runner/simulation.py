@@ -0,0 +1,545 @@
+"""Headless game rules for Limit Runner.
+
+Everything that decides how a run plays out lives here: player physics,
+obstacle / geprek motion, the shield, quiz scheduling, lives and score.
+Nothing in this module draws or touches the display, so it runs under the
+SDL dummy driver (or with no pygame display at all) as fast as the CPU allows.
+The game (limit_runner/app.py) is a renderer on top of ``Simulation``.
+
+The world advances in fixed steps of ``TICK_MS`` (60 Hz) whatever the render
+rate is; speeds are declared per second and applied per step. Every entity
+keeps its position from before the last step (``prev``) so the renderer can
+interpolate between the last two steps.
+"""
+import math
+import random
+
+import pygame
+
+from limit_runner import collision
+from limit_runner.collision import Collider
+from limit_runner.motion import HAVE_NUMPY, BatchShield, WaveBatch
+from limit_runner.pool import Pool
+from limit_runner.questions import Deck, default_question_banks
+from limit_runner.scheduler import Scheduler
+
+# -----------------------
+# rules / tuning
+# -----------------------
+TICK_RATE = 60               # simulation steps per second
+TICK_MS = 1000 / TICK_RATE
+SCREEN_WIDTH = 720
+GROUND_Y = 400               # player / kucing midbottom
+MAX_LIVES = 3
+
+PLAYER_SIZE = (120, 155)
+PLAYER_X = 100
+JUMP_VELOCITY = -1320        # px/s
+GRAVITY = 3600               # px/s^2
+ANIMATION_FPS = 6            # walk / flap frames per second
+
+OBSTACLE_INTERVAL_MS = 1800
+OBSTACLE_SPEED = 480         # px/s
+OBSTACLE_TYPES = ['kucing', 'kucing', 'burung']   # kucing twice as likely
+OBSTACLE_SIZES = {'burung': (100, 100), 'kucing': (95, 70)}
+OBSTACLE_Y = {'burung': 210, 'kucing': GROUND_Y}
+OBSTACLE_MAX_WIDTH = max(w for w, h in OBSTACLE_SIZES.values())
+
+GEPREK_SIZE = (70, 70)
+GEPREK_SPAWN_MS = (5_000, 10_000)
+GEPREK_Y_CANDIDATES = [210, 300, 340, 380]
+GEPREK_SPEED = 480           # px/s
+GEPREK_AMPLITUDE = 22
+GEPREK_WAVELENGTH = 140
+
+SHIELD_COUNT = 8
+SHIELD_RADIUS = 60
+SHIELD_DURATION_MS = 10_000
+SHIELD_ITEM_SIZE = (30, 30)
+SHIELD_ROTATE_SPEED = 4.8    # rad/s
+
+QUIZ_INTERVAL_MS = 10_000
+
+# per-step amounts (whole pixels, so a run is exactly reproducible)
+JUMP_STEP = JUMP_VELOCITY // TICK_RATE
+GRAVITY_STEP = GRAVITY // (TICK_RATE * TICK_RATE)
+OBSTACLE_STEP = OBSTACLE_SPEED // TICK_RATE
+ANIMATION_STEP = ANIMATION_FPS / TICK_RATE
+# player frames: the walk cycle (idle, run, idle, run), then the jump pose
+JUMP_FRAME = 4
+
+# simulation states
+RUNNING = 'running'
+QUIZ = 'quiz'
+OVER = 'over'
+
+
+class Inputs:
+    """What the player is doing during one step."""
+    __slots__ = ('jump', 'answer')
+
+    def __init__(self, jump=False, answer=None):
+        self.jump = jump        # jump key held
+        self.answer = answer    # None, or True / False for the quiz (B / S)
+
+
+NO_INPUT = Inputs()
+
+
+# -----------------------
+# entities
+# -----------------------
+class Player:
+    kind = 'player'
+
+    def __init__(self):
+        self.rect = pygame.Rect((0, 0), PLAYER_SIZE)
+        self.reset()
+
+    def reset(self):
+        self.rect.midbottom = (PLAYER_X, GROUND_Y)
+        self.prev = self.rect.topleft
+        self.gravity = 0
+        self.player_index = 0
+
+    @property
+    def on_ground(self):
+        return self.rect.bottom >= GROUND_Y
+
+    @property
+    def frame(self):
+        # the pose shown (and hit-tested with --pixel-collision)
+        return int(self.player_index) if self.on_ground else JUMP_FRAME
+
+    def apply_gravity(self):
+        self.gravity += GRAVITY_STEP
+        self.rect.y += self.gravity
+        if self.rect.bottom >= GROUND_Y:
+            self.rect.bottom = GROUND_Y
+            self.gravity = 0
+
+    def update(self, jump):
+        self.prev = self.rect.topleft
+        if jump and self.on_ground:
+            self.gravity = JUMP_STEP
+        self.apply_gravity()
+        # walk cycle index (4 frames), the renderer picks the frame from it
+        if self.on_ground:
+            self.player_index += ANIMATION_STEP
+            if self.player_index >= 4:
+                self.player_index = 0
+
+
+class Obstacle:
+    def __init__(self, type, x):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(type, x)
+
+    def reset(self, type, x):
+        # also the recycle path: Simulation.obstacle_pool reuses dead obstacles
+        self.type = type
+        self.kind = type
+        self.rect.size = OBSTACLE_SIZES[type]
+        # spawn off-screen right
+        self.rect.midbottom = (x, OBSTACLE_Y[type])
+        self.prev = self.rect.topleft
+        self.animation_index = 0
+        self.alive = True
+
+    @property
+    def frame(self):
+        return int(self.animation_index)
+
+    def update(self):
+        self.prev = self.rect.topleft
+        self.animation_index += ANIMATION_STEP
+        if self.animation_index >= 2:
+            self.animation_index = 0
+        self.rect.x -= OBSTACLE_STEP
+        if self.rect.x <= -150:
+            self.alive = False
+
+
+class Geprek:
+    kind = 'geprek'
+    frame = 0
+
+    def __init__(self, y_pos, speed=GEPREK_SPEED, amplitude=GEPREK_AMPLITUDE,
+                 wavelength=GEPREK_WAVELENGTH, phase=0):
+        self.rect = pygame.Rect((0, 0), GEPREK_SIZE)
+        self.reset(y_pos, speed, amplitude, wavelength, phase)
+
+    def reset(self, y_pos, speed=GEPREK_SPEED, amplitude=GEPREK_AMPLITUDE,
+              wavelength=GEPREK_WAVELENGTH, phase=0):
+        # also the recycle path: Simulation.geprek_pool reuses collected / passed gepreks
+        # use midbottom as baseline so y_pos indicates midbottom
+        self.rect.midbottom = (900, y_pos)
+        self.prev = self.rect.topleft
+        self.start_x = self.rect.x
+        self.speed = speed // TICK_RATE    # px per step
+        self.amplitude = amplitude
+        self.wavelength = wavelength
+        self.phase = phase
+        self.y_center = y_pos
+        self.alive = True
+
+    def update(self):
+        self.prev = self.rect.topleft
+        # horizontal movement (right -> left)
+        self.rect.x -= self.speed
+
+        # wave offset based on horizontal traveled distance
+        x_moved = self.start_x - self.rect.x
+        y_offset = self.amplitude * math.sin(2 * math.pi * x_moved / self.wavelength + self.phase)
+
+        # clamp so geprek does not go below ground surface (small visual gap)
+        target_bottom = int(self.y_center + y_offset)
+        self.rect.bottom = min(target_bottom, GROUND_Y - 2)
+
+        if self.rect.right < -50:
+            self.alive = False
+
+
+class Shield:
+    """Small gepreks orbiting the player; absorbs one obstacle hit."""
+
+    def __init__(self, player, count=SHIELD_COUNT, radius=SHIELD_RADIUS, duration_ms=SHIELD_DURATION_MS):
+        self.player = player
+        self.count = count
+        self.radius = radius
+        self.duration_ms = duration_ms
+        self.elapsed_ms = 0
+        # rotate speed (radians per step)
+        self.rotate_speed = SHIELD_ROTATE_SPEED / TICK_RATE
+        # [rect, angle, prev topleft] per orbiting item
+        self.items = []
+        for i in range(count):
+            rect = pygame.Rect((0, 0), SHIELD_ITEM_SIZE)
+            rect.center = player.rect.center
+            self.items.append([rect, i * (2 * math.pi / count), rect.topleft])
+        self.alive = True
+
+    def refresh(self):
+        self.elapsed_ms = 0
+
+    def get_state(self):
+        return (self.elapsed_ms, [(tuple(rect.topleft), ang, tuple(prev)) for rect, ang, prev in self.items])
+
+    def set_state(self, state):
+        self.elapsed_ms, items = state
+        for item, (topleft, ang, prev) in zip(self.items, items):
+            item[0].topleft = topleft
+            item[1] = ang
+            item[2] = prev
+
+    def positions(self, alpha):
+        """Interpolated topleft of every orbiter, for drawing."""
+        return [(prev[0] + (rect.x - prev[0]) * alpha, prev[1] + (rect.y - prev[1]) * alpha)
+                for rect, ang, prev in self.items]
+
+    def update(self, dt):
+        self.elapsed_ms += dt
+        if self.elapsed_ms >= self.duration_ms:
+            self.alive = False
+            return
+        cx, cy = self.player.rect.center
+        for item in self.items:
+            item[2] = item[0].topleft
+            item[1] += self.rotate_speed
+            ang = item[1]
+            item[0].center = (cx + int(self.radius * math.cos(ang)),
+                              cy + int(self.radius * math.sin(ang)))
+
+
+# -----------------------
+# world
+# -----------------------
+class Simulation:
+    def __init__(self, rng=None, question_banks=None, collider=None,
+                 batched_motion=HAVE_NUMPY, shield_count=SHIELD_COUNT):
+        self.rng = rng if rng is not None else random.Random()
+        # NumPy path for geprek waves / shield orbiters (motion.py), per-sprite path otherwise
+        self.batched_motion = batched_motion and HAVE_NUMPY
+        self.wave_batch = WaveBatch(GROUND_Y - 2) if self.batched_motion else None
+        self.shield_count = shield_count
+        if question_banks is None:
+            question_banks = default_question_banks()
+        self.question_banks = question_banks
+        # shuffled per-difficulty decks, rewound (not rebuilt) by reset()
+        self.decks = {name: Deck(bank, self.rng) for name, (bank, _) in question_banks.items()}
+        # obstacles / gepreks are kept sorted by x for the collider's broad phase
+        self.collider = collider if collider is not None else Collider()
+        # spawned entities are recycled, long runs stop allocating after warm-up
+        self.obstacle_pool = Pool(Obstacle)
+        self.geprek_pool = Pool(Geprek)
+        self.obstacles = []
+        self.gepreks = []
+        self.player = Player()
+        # running-time clock for spawns and quizzes; paused while a quiz is up
+        self.timers = Scheduler()
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a fresh run (lives, score, timers, entities, question pool).
+
+        With ``seed`` the run is reproducible: the same seed and the same
+        inputs per step play exactly the same game (see replay.py).
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.state = RUNNING
+        self.lives = MAX_LIVES
+        self.correct_answers = 0
+        self.ticks = 0
+        self.player.reset()
+        self.obstacle_pool.release_all(self.obstacles)
+        self.geprek_pool.release_all(self.gepreks)
+        self._gepreks_changed()
+        self.shield = None
+        timers = self.timers
+        timers.clear()
+        timers.every(QUIZ_INTERVAL_MS, self.start_quiz, name='quiz')
+        timers.every(OBSTACLE_INTERVAL_MS, self.spawn_obstacle, name='obstacle')
+        timers.every(self.next_geprek_interval, self.spawn_geprek, name='geprek')
+        self.quiz_left_ms = 0
+        self.current_question = None
+        for deck in self.decks.values():
+            deck.reset()
+
+    @property
+    def time_ms(self):
+        # running time; quiz pauses are not counted
+        return self.timers.now
+
+    @property
+    def quiz_in_ms(self):
+        return self.timers.time_left('quiz')
+
+    @property
+    def score(self):
+        # same unit as the old display_score(): hundredths of a second of play
+        return int(self.time_ms // 10)
+
+    def next_geprek_interval(self):
+        return self.rng.randint(*GEPREK_SPAWN_MS)
+
+    # -----------------------
+    # stepping
+    # -----------------------
+    def step(self, dt=TICK_MS, inputs=NO_INPUT):
+        """Advance the world by one step. Returns a list of event names.
+
+        ``dt`` drives the clocks (score, spawn and quiz timers); motion is
+        per step, so pass ``TICK_MS`` (see FixedTimestep) to keep the two in sync.
+        """
+        events = []
+        if self.state == RUNNING:
+            self._step_running(dt, inputs, events)
+        elif self.state == QUIZ:
+            self._step_quiz(dt, inputs, events)
+        return events
+
+    def _step_running(self, dt, inputs, events):
+        # spawns and the quiz; a quiz pauses the clock and freezes the world
+        self.timers.advance(dt)
+        if self.state == QUIZ:
+            events.append('quiz')
+            return
+        self.ticks += 1
+
+        self.player.update(inputs.jump)
+        for o in self.obstacles:
+            o.update()
+        if self.wave_batch is not None:
+            self.wave_batch.step(self.gepreks)
+        else:
+            for g in self.gepreks:
+                g.update()
+        self._sweep(self.obstacles, self.obstacle_pool)
+        self._sweep_gepreks()
+        if self.shield is not None:
+            self.shield.update(dt)
+            if not self.shield.alive:
+                self.shield = None
+                events.append('shield_expired')
+
+        self._collide(events)
+
+    def _collide(self, events):
+        # player touches geprek -> +1 nyawa (cap 3) and a shield (refreshed, not stacked)
+        picked = self.collider.collide(self.player, self.gepreks, GEPREK_SIZE[0])
+        if picked:
+            for g in picked:
+                g.alive = False
+            self._sweep_gepreks()
+            self.lives = min(MAX_LIVES, self.lives + 1)
+            if self.shield is None:
+                self.shield = self.new_shield()
+            else:
+                self.shield.refresh()
+            events.append('pickup')
+
+        # obstacle hit: the shield absorbs it, otherwise lose one life per hit event
+        hit = self.collider.collide(self.player, self.obstacles, OBSTACLE_MAX_WIDTH)
+        if hit:
+            for o in hit:
+                o.alive = False
+            self._sweep(self.obstacles, self.obstacle_pool)
+            if self.shield is not None:
+                self.shield = None
+                events.append('shield_break')
+            else:
+                self.lives -= 1
+                events.append('hit')
+                self._check_game_over(events)
+
+    def _check_game_over(self, events):
+        if self.lives <= 0:
+            self.state = OVER
+            self.geprek_pool.release_all(self.gepreks)
+            self._gepreks_changed()
+            self.shield = None
+            events.append('game_over')
+
+    @staticmethod
+    def _sweep(entities, pool):
+        # drop dead entities in place (keeps the x order) and hand them back to the pool
+        j = 0
+        for e in entities:
+            if e.alive:
+                entities[j] = e
+                j += 1
+            else:
+                pool.release(e)
+        removed = len(entities) - j
+        del entities[j:]
+        return removed
+
+    def _sweep_gepreks(self):
+        if self._sweep(self.gepreks, self.geprek_pool):
+            self._gepreks_changed()
+
+    def _gepreks_changed(self):
+        if self.wave_batch is not None:
+            self.wave_batch.invalidate()
+
+    def new_shield(self):
+        if self.batched_motion:
+            return BatchShield(self.player, self.shield_count, SHIELD_RADIUS, SHIELD_DURATION_MS,
+                               SHIELD_ROTATE_SPEED / TICK_RATE, SHIELD_ITEM_SIZE)
+        return Shield(self.player, count=self.shield_count, duration_ms=SHIELD_DURATION_MS)
+
+    # -----------------------
+    # state capture (replay keyframes)
+    # -----------------------
+    def get_state(self):
+        """Everything the next steps depend on, as plain picklable values."""
+        p = self.player
+        return {
+            'state': self.state, 'lives': self.lives, 'correct_answers': self.correct_answers,
+            'ticks': self.ticks, 'timers': self.timers.get_state(), 'quiz_left_ms': self.quiz_left_ms,
+            'current_question': self.current_question,
+            'rng': self.rng.getstate(),
+            'decks': {name: deck.get_state() for name, deck in self.decks.items()},
+            'player': (tuple(p.rect.topleft), tuple(p.prev), p.gravity, p.player_index),
+            'obstacles': [(o.type, tuple(o.rect.topleft), tuple(o.prev), o.animation_index)
+                          for o in self.obstacles],
+            'gepreks': [(tuple(g.rect.topleft), tuple(g.prev), g.start_x, g.speed, g.amplitude,
+                         g.wavelength, g.phase, g.y_center) for g in self.gepreks],
+            'shield': None if self.shield is None else (self.shield.count, self.shield.get_state()),
+        }
+
+    def set_state(self, s):
+        for name in ('state', 'lives', 'correct_answers', 'ticks', 'quiz_left_ms', 'current_question'):
+            setattr(self, name, s[name])
+        self.timers.set_state(s['timers'])
+        self.rng.setstate(s['rng'])
+        for name, deck_state in s['decks'].items():
+            self.decks[name].set_state(deck_state)
+        p = self.player
+        p.rect.topleft, p.prev, p.gravity, p.player_index = s['player']
+
+        self.obstacle_pool.release_all(self.obstacles)
+        for type, topleft, prev, animation_index in s['obstacles']:
+            o = self.obstacle_pool.acquire(type, 0)
+            o.rect.topleft, o.prev, o.animation_index = topleft, prev, animation_index
+            self.obstacles.append(o)
+        self.geprek_pool.release_all(self.gepreks)
+        for topleft, prev, start_x, speed, amplitude, wavelength, phase, y_center in s['gepreks']:
+            g = self.geprek_pool.acquire(y_center, 0, amplitude, wavelength, phase)
+            g.rect.topleft, g.prev, g.start_x, g.speed = topleft, prev, start_x, speed
+            self.gepreks.append(g)
+        self._gepreks_changed()
+
+        self.shield = None
+        if s['shield'] is not None:
+            count, shield_state = s['shield']
+            self.shield_count = count
+            self.shield = self.new_shield()
+            self.shield.set_state(shield_state)
+
+    def pool_stats(self):
+        return {"obstacle": self.obstacle_pool.stats(), "geprek": self.geprek_pool.stats()}
+
+    def spawn_obstacle(self):
+        type = self.rng.choice(OBSTACLE_TYPES)
+        o = self.obstacle_pool.acquire(type, self.rng.randint(800, 900))
+        collision.insert(self.obstacles, o)
+        return o
+
+    def spawn_geprek(self):
+        # y_pos is the midbottom baseline; never start below ground
+        y_pos = min(self.rng.choice(GEPREK_Y_CANDIDATES), GROUND_Y - 6)
+        # phase randomize so wave differs
+        phase = self.rng.randint(0, 360) * math.pi / 180.0
+        g = self.geprek_pool.acquire(y_pos, GEPREK_SPEED, GEPREK_AMPLITUDE, GEPREK_WAVELENGTH, phase)
+        collision.insert(self.gepreks, g)
+        self._gepreks_changed()
+        return g
+
+    # -----------------------
+    # quiz
+    # -----------------------
+    def start_quiz(self):
+        self.state = QUIZ
+        self.timers.pause()
+        pick = self.rng.choice(['easy', 'medium', 'hard'])
+        if pick == 'easy' and self.decks['easy']:
+            name = 'easy'
+        elif pick == 'medium' and self.decks['medium']:
+            name = 'medium'
+        elif self.decks['hard']:
+            name = 'hard'
+        else:
+            name = None
+
+        if name is None:
+            self.current_question = ("No more questions", True)
+            self.quiz_left_ms = self.question_banks['easy'][1]
+        else:
+            self.current_question = self.decks[name].draw()
+            self.quiz_left_ms = self.question_banks[name][1]
+
+    def _step_quiz(self, dt, inputs, events):
+        if inputs.answer is not None:
+            if inputs.answer == self.current_question[1]:
+                self.correct_answers += 1
+                events.append('correct')
+            else:
+                self.lives -= 1
+                events.append('wrong')
+            self._end_quiz()
+            self._check_game_over(events)
+            return
+
+        self.quiz_left_ms -= dt
+        if self.quiz_left_ms <= 0:
+            events.append('quiz_timeout')
+            self._end_quiz()
+
+    def _end_quiz(self):
+        self.state = RUNNING
+        self.current_question = None
+        self.quiz_left_ms = 0
+        # the next quiz is a full interval of running time away
+        self.timers.resume()
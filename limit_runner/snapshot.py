@@ -0,0 +1,263 @@
+"""Compact world snapshots and a rewind ring buffer of them.
+
+``Simulation.get_state()`` is a dict of tuples, made to be pickled into replay
+keyframes. A ``Snapshot`` holds the same state flat, to be taken every step
+and kept by the hundred:
+
+* scalars (lives, clock, player, ...) in ``__slots__``;
+* obstacles and gepreks as fixed-width rows packed with ``struct``, one
+  ``bytes`` per kind (a ``pack`` call per entity, ``iter_unpack`` back);
+* shield orbiters as rows in an int32 and a double array, which NumPy
+  fills in one go for the batched shield;
+* the Mersenne Twister state as 625 packed 32-bit words (2.5 KB of bytes)
+  instead of a tuple of ints (about 25 KB of int objects).
+
+``capture(sim, snap)`` writes into an existing snapshot and reuses its
+objects, so a full ring buffer creates no new snapshots, only refills them.
+``restore(sim, snap)`` puts the world back exactly: the same values of the
+same types, so a restored world keeps playing (and checksumming) like one
+that was never stopped. Values the simulation keeps as int or float
+(animation indices wrap to an int 0, geprek wave constants are ints unless
+given as floats) are packed as doubles next to a flag that says which they
+were.
+
+With only a few entities a capture costs some 10 us more than
+``get_state()``: both copy the random generator state, and the snapshot
+also packs its 625 words (and unpacks them on restore). That is under 0.1%
+of a 60 Hz frame, and it is what keeps a second of snapshots at ~170 KB
+instead of over 1.7 MB.
+"""
+import struct
+from array import array
+
+from limit_runner.motion import BatchShield, np
+from limit_runner.simulation import OBSTACLE_SIZES, TICK_RATE
+
+OBSTACLE_TYPES = tuple(OBSTACLE_SIZES)
+# type, x, y, prev x, prev y, index is int, animation index
+OBSTACLE_ROW = struct.Struct('=6id')
+# x, y, prev x, prev y, start x, speed, y centre, int flags, amplitude, wavelength, phase
+GEPREK_ROW = struct.Struct('=8i3d')
+INT_AMPLITUDE, INT_WAVELENGTH = 1, 2
+ORBITER_INTS = 4      # x, y, prev x, prev y                + float angle
+# scalar values outside the arrays (the player's six fields counted one by one)
+SCALARS = 17
+# random.Random state: 624 words of Mersenne Twister state and the position in them
+RNG_WORDS = struct.Struct('=625I')
+
+
+def _fit(a, n):
+    # resize in place; the array keeps its memory when it shrinks and grows again
+    extra = n - len(a)
+    if extra > 0:
+        a.frombytes(bytes(extra * a.itemsize))
+    elif extra < 0:
+        del a[n:]
+    return a
+
+
+def _fill(a, values):
+    # a list into the array in one call: much faster than setting items one by one
+    del a[:]
+    a.fromlist(values)
+
+
+class Snapshot:
+    __slots__ = ('state', 'lives', 'correct_answers', 'ticks', 'quiz_left_ms', 'current_question',
+                 'timers', 'rng_version', 'rng_words', 'rng_gauss', 'deck_order', 'deck_drawn',
+                 'player', 'obstacles', 'gepreks',
+                 'shield_count', 'shield', 'orbiter_ints', 'orbiter_floats')
+
+    def __init__(self):
+        self.rng_words = b''
+        self.deck_order = array('i')
+        self.deck_drawn = array('i')
+        self.obstacles = b''
+        self.gepreks = b''
+        self.orbiter_ints = array('i')
+        self.orbiter_floats = array('d')
+        self.shield = None   # (count, elapsed ms) while a shield is up
+
+    def nbytes(self):
+        """Approximate size: the arrays and packed rows plus 8 bytes per scalar value."""
+        arrays = (self.deck_order, self.deck_drawn, self.orbiter_ints, self.orbiter_floats)
+        return (sum(len(a) * a.itemsize for a in arrays) + len(self.rng_words) + len(self.obstacles)
+                + len(self.gepreks) + 8 * SCALARS)
+
+
+def capture(sim, snap=None):
+    """The state of ``sim`` written into ``snap`` (a new Snapshot when None); returns it."""
+    if snap is None:
+        snap = Snapshot()
+    snap.state = sim.state
+    snap.lives = sim.lives
+    snap.correct_answers = sim.correct_answers
+    snap.ticks = sim.ticks
+    snap.quiz_left_ms = sim.quiz_left_ms
+    snap.current_question = sim.current_question
+    snap.timers = sim.timers.get_state()
+    snap.rng_version, words, snap.rng_gauss = sim.rng.getstate()
+    snap.rng_words = RNG_WORDS.pack(*words)
+
+    order, drawn = _fit(snap.deck_order, 0), _fit(snap.deck_drawn, 0)
+    for deck in sim.decks.values():
+        order.extend(deck.order)
+        drawn.append(deck.drawn)
+
+    p = sim.player
+    snap.player = (p.rect.x, p.rect.y, p.prev[0], p.prev[1], p.gravity, p.player_index)
+
+    pack, type_index = OBSTACLE_ROW.pack, OBSTACLE_TYPES.index
+    snap.obstacles = b''.join([pack(type_index(o.type), o.rect.x, o.rect.y, o.prev[0], o.prev[1],
+                                    type(o.animation_index) is int, o.animation_index)
+                               for o in sim.obstacles])
+    pack = GEPREK_ROW.pack
+    snap.gepreks = b''.join([pack(g.rect.x, g.rect.y, g.prev[0], g.prev[1], g.start_x, g.speed, g.y_center,
+                                  (type(g.amplitude) is int) * INT_AMPLITUDE
+                                  | (type(g.wavelength) is int) * INT_WAVELENGTH,
+                                  g.amplitude, g.wavelength, g.phase)
+                             for g in sim.gepreks])
+
+    snap.shield_count = sim.shield_count
+    shield = sim.shield
+    if shield is None:
+        snap.shield = None
+        _fit(snap.orbiter_ints, 0)
+        _fit(snap.orbiter_floats, 0)
+        return snap
+    snap.shield = (shield.count, shield.elapsed_ms)
+    ints, floats = _fit(snap.orbiter_ints, ORBITER_INTS * shield.count), _fit(snap.orbiter_floats, shield.count)
+    if isinstance(shield, BatchShield):
+        rows = np.frombuffer(ints, dtype=np.int32).reshape(shield.count, ORBITER_INTS)
+        rows[:, 0:2] = shield.topleft
+        rows[:, 2:4] = shield.prev
+        np.frombuffer(floats, dtype=np.float64)[:] = shield.angles
+        del rows
+    else:
+        items = shield.items
+        _fill(ints, [v for rect, ang, prev in items for v in (rect.x, rect.y, prev[0], prev[1])])
+        _fill(floats, [ang for rect, ang, prev in items])
+    return snap
+
+
+def restore(sim, snap):
+    """Puts ``sim`` back to the state captured in ``snap``."""
+    sim.state = snap.state
+    sim.lives = snap.lives
+    sim.correct_answers = snap.correct_answers
+    sim.ticks = snap.ticks
+    sim.quiz_left_ms = snap.quiz_left_ms
+    sim.current_question = snap.current_question
+    sim.timers.set_state(snap.timers)
+    sim.rng.setstate((snap.rng_version, RNG_WORDS.unpack(snap.rng_words), snap.rng_gauss))
+
+    start = 0
+    for deck, drawn in zip(sim.decks.values(), snap.deck_drawn):
+        end = start + len(deck.order)
+        deck.order[:] = snap.deck_order[start:end]
+        deck.drawn = drawn
+        start = end
+
+    p = sim.player
+    x, y, px, py, p.gravity, p.player_index = snap.player
+    p.rect.topleft = (x, y)
+    p.prev = (px, py)
+
+    sim.obstacle_pool.release_all(sim.obstacles)
+    for type_index, x, y, px, py, int_index, index in OBSTACLE_ROW.iter_unpack(snap.obstacles):
+        o = sim.obstacle_pool.acquire(OBSTACLE_TYPES[type_index], 0)
+        o.rect.topleft = (x, y)
+        o.prev = (px, py)
+        o.animation_index = int(index) if int_index else index
+        sim.obstacles.append(o)
+
+    sim.geprek_pool.release_all(sim.gepreks)
+    for x, y, px, py, start_x, speed, y_center, flags, amplitude, wavelength, phase \
+            in GEPREK_ROW.iter_unpack(snap.gepreks):
+        g = sim.geprek_pool.acquire(y_center, 0, int(amplitude) if flags & INT_AMPLITUDE else amplitude,
+                                    int(wavelength) if flags & INT_WAVELENGTH else wavelength, phase)
+        g.rect.topleft = (x, y)
+        g.prev = (px, py)
+        g.start_x = start_x
+        g.speed = speed
+        sim.gepreks.append(g)
+    sim._gepreks_changed()
+
+    sim.shield_count = snap.shield_count
+    if snap.shield is None:
+        sim.shield = None
+        return
+    count, elapsed_ms = snap.shield
+    shield = sim.shield
+    if shield is None or shield.count != count:
+        shield = sim.shield = sim.new_shield()
+    shield.elapsed_ms = elapsed_ms
+    shield.alive = True
+    ints, floats = snap.orbiter_ints, snap.orbiter_floats
+    if isinstance(shield, BatchShield):
+        rows = np.frombuffer(ints, dtype=np.int32).reshape(count, ORBITER_INTS)
+        shield.topleft[:] = rows[:, 0:2]
+        shield.prev[:] = rows[:, 2:4]
+        shield.angles[:] = np.frombuffer(floats, dtype=np.float64)
+        del rows
+    else:
+        for i, item in enumerate(shield.items):
+            k = i * ORBITER_INTS
+            item[0].topleft = (ints[k], ints[k + 1])
+            item[1] = floats[i]
+            item[2] = (ints[k + 2], ints[k + 3])
+
+
+class RewindBuffer:
+    """The last ``seconds`` of a run, one snapshot every ``every`` steps.
+
+    ``push(sim)`` after a step, ``rewind(sim, n)`` goes ``n`` snapshots back
+    (and forgets the newer ones). The slots are allocated on first use and
+    reused after that.
+    """
+
+    def __init__(self, seconds=10, every=1):
+        self.every = every
+        self.capacity = max(1, int(seconds * TICK_RATE / every))
+        self.slots = []
+        self.head = 0      # next slot to write
+        self.count = 0     # snapshots held
+        self._steps = 0
+
+    def clear(self):
+        self.count = 0
+        self._steps = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def seconds(self):
+        return self.count * self.every / TICK_RATE
+
+    def push(self, sim):
+        self._steps += 1
+        if self._steps < self.every:
+            return
+        self._steps = 0
+        if len(self.slots) < self.capacity:
+            self.slots.append(Snapshot())
+        capture(sim, self.slots[self.head])
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def rewind(self, sim, n=1):
+        """Drops the ``n`` newest snapshots and restores the one before them
+        (the oldest held at most); returns False when there is nothing older."""
+        n = min(n, self.count - 1)
+        if n <= 0:
+            return False
+        self.head = (self.head - n) % self.capacity
+        self.count -= n
+        # the restored snapshot stays the newest: rewinding again goes further back
+        restore(sim, self.slots[(self.head - 1) % self.capacity])
+        self._steps = 0
+        return True
+
+    def nbytes(self):
+        return sum(self.slots[(self.head - 1 - i) % self.capacity].nbytes() for i in range(self.count))
@@ -0,0 +1,141 @@
+"""Surface formats: the cheapest blit for each image, and what each image costs.
+
+    python -m limit_runner.surfaces         # per-asset memory / blit-cost report
+
+Every image used to be ``convert_alpha()``-ed, and SDL's software blitter
+blends every pixel of a per-pixel-alpha surface, transparent or not. Our
+images are almost all binary: each pixel fully transparent or fully opaque.
+``classify(surface)`` looks at the alpha channel:
+
+  'opaque'    every pixel at 255 (menu_bg)       -> convert(), no alpha at all
+  'colorkey'  every pixel at 0 or 255 (sprites)  -> convert(), transparent
+              pixels set to a colour key, RLE encoded
+  'alpha'     some pixels in between (the edges  -> convert_alpha(), RLE encoded
+              of tanah and tiang)
+
+An RLE surface blits by skipping its transparent runs; measured on a
+720x480 screen, tiang (950x635) went from about 400 us to 15 us, a
+cloud layer from 400 us to 2 us and a player frame from 18 us to 3 us.
+SDL encodes a surface on its first blit and then
+frees its plain pixels. Reading it (masks, copies) decodes it again, which
+is fine, but a ``subsurface()`` of it would point into freed pixels. RLE is
+only for images drawn as they are: parallax layers crop their image first
+and optimize the cropped part themselves.
+"""
+import argparse
+import hashlib
+import os
+import time
+
+import pygame
+
+KINDS = ('opaque', 'colorkey', 'alpha')
+# tried in order; a key must not be the colour of any opaque pixel of the image
+COLORKEYS = ((255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253))
+
+
+def classify(surface):
+    """'opaque', 'colorkey' or 'alpha' (see the module docstring)."""
+    if surface.get_colorkey() is not None:
+        return 'colorkey'
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return 'opaque'
+    w, h = surface.get_size()
+    # from_surface sets the pixels with alpha above the threshold
+    solid = pygame.mask.from_surface(surface, 254).count()
+    if solid == w * h:
+        return 'opaque'
+    if pygame.mask.from_surface(surface, 0).count() == solid:
+        return 'colorkey'
+    return 'alpha'
+
+
+def optimize(surface, kind=None, rle=True):
+    """A copy of ``surface`` in the display format that blits fastest for its
+    ``kind`` (classified when None). ``rle=False`` keeps the plain formats:
+    convert() for opaque images, convert_alpha() for the rest."""
+    if kind is None:
+        kind = classify(surface)
+    if kind == 'opaque':
+        return surface.convert()
+    if kind == 'colorkey' and rle:
+        w, h = surface.get_size()
+        transparent = w * h - pygame.mask.from_surface(surface, 254).count()
+        for key in COLORKEYS:
+            out = pygame.Surface((w, h)).convert()
+            out.fill(key)
+            out.blit(surface, (0, 0))
+            if pygame.mask.from_threshold(out, key, (1, 1, 1, 255)).count() == transparent:
+                out.set_colorkey(key, pygame.RLEACCEL)
+                return out
+        # every key is used by the image: per-pixel alpha after all
+    out = surface.convert_alpha()
+    if rle:
+        out.set_alpha(255, pygame.RLEACCEL)
+    return out
+
+
+def fingerprint(surface):
+    """Equal for surfaces with the same size and pixels."""
+    return surface.get_size(), hashlib.blake2b(pygame.image.tobytes(surface, 'RGBA'), digest_size=16).digest()
+
+
+def blit_us(surface, target, repeat=100):
+    """Mean time of one blit of ``surface`` to ``target`` at (0, 0), in microseconds."""
+    target.blit(surface, (0, 0))   # RLE encoding happens on the first blit
+    start = time.perf_counter()
+    for _ in range(repeat):
+        target.blit(surface, (0, 0))
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def describe(surface):
+    if surface.get_colorkey() is not None:
+        fmt = 'colorkey'
+    elif surface.get_flags() & pygame.SRCALPHA:
+        fmt = 'alpha'
+    else:
+        fmt = 'opaque'
+    if surface.get_flags() & pygame.RLEACCEL:
+        fmt += '+RLE'
+    return fmt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pixel format, memory and blit cost of every game image')
+    parser.add_argument('--repeat', type=int, default=100, help='blits timed per image')
+    args = parser.parse_args(argv)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    screen = pygame.display.set_mode((720, 480))
+
+    from limit_runner.assets import AssetRegistry
+    from limit_runner.atlas import MANIFEST, SPRITES
+    # decoded from the PNGs, as convert_alpha()-ed before this pass
+    registry = AssetRegistry()
+    print(f'{"image":<22} {"size":>9} {"kind":<8} {"KB":>5}   {"before":<6} {"us":>6}   {"after":<12} {"us":>6}')
+    seen = {}
+    before_total = after_total = 0.0
+    for path, size in MANIFEST + SPRITES:
+        source = registry.image(path, size)
+        w, h = source.get_size()
+        name = os.path.basename(path) + (f' {w}x{h}' if size else '')
+        digest = fingerprint(source)
+        if digest in seen:
+            print(f'{name:<22} same pixels as {seen[digest]}: shared, no extra memory')
+            continue
+        seen[digest] = name
+        kind = classify(source)
+        out = optimize(source, kind)
+        before = blit_us(source, screen, args.repeat)
+        after = blit_us(out, screen, args.repeat)
+        before_total += before
+        after_total += after
+        print(f'{name:<22} {f"{w}x{h}":>9} {kind:<8} {w * h * source.get_bytesize() // 1024:>5}   '
+              f'{describe(source):<6} {before:>6.1f}   {describe(out):<12} {after:>6.1f}')
+    print(f'every image blitted once: {before_total:.0f} us before, {after_total:.0f} us after')
+    print('RLE surfaces free their plain pixels after the first blit and keep the runs instead')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Memoized ``font.render`` keyed on (font, text, antialias, colour), bounded LRU."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, color)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def report(self):
+        s = self.stats()
+        return (f"text cache: {s['entries']} entries, hit rate {s['hit_rate']:.1%} "
+                f"({s['hits']} hits, {s['misses']} misses, {s['evictions']} evictions)")
+
+
+class CounterText:
+    """A HUD line like 'Quiz in: 4.2s' that only re-renders when its text changes.
+
+    Counters change too often to be worth a slot in the LRU, so each keeps
+    just its current surface.
+    """
+
+    def __init__(self, font, fmt, antialias, color):
+        self.font = font
+        self.fmt = fmt
+        self.antialias = antialias
+        self.color = color
+        self.every = 1   # only look at the values every n-th call (lower quality levels)
+        self.text = None
+        self.surf = None
+        self.renders = 0
+        self.reuses = 0
+        self._held = 0
+
+    def restyle(self, every):
+        self.every = every
+
+    def render(self, *values):
+        if self.every > 1 and self.surf is not None:
+            self._held += 1
+            if self._held < self.every:
+                self.reuses += 1
+                return self.surf
+            self._held = 0
+        text = self.fmt.format(*values)
+        if text != self.text:
+            self.text = text
+            self.surf = self.font.render(text, self.antialias, self.color)
+            self.renders += 1
+        else:
+            self.reuses += 1
+        return self.surf
+
+
+def wrap_text(font, text, width):
+    """Greedy word wrap: lines of ``text`` that each render at most ``width`` px wide.
+
+    A single word wider than ``width`` gets a line of its own.
+    """
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if line and font.size(candidate)[0] > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
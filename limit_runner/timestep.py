@@ -0,0 +1,33 @@
+from limit_runner.simulation import TICK_MS
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps.
+
+    Each frame, ``advance(frame_ms)`` returns how many ``TICK_MS`` steps to run;
+    the remainder carries over to the next frame and ``alpha`` (0..1) says how
+    far the renderer is between the last two steps. A slow frame just runs
+    more steps (up to ``max_frame_ms`` worth, so a long stall cannot snowball).
+    """
+
+    def __init__(self, step_ms=TICK_MS, max_frame_ms=250):
+        self.step_ms = step_ms
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0   # time thrown away by the max_frame_ms clamp
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        if frame_ms > self.max_frame_ms:
+            self.dropped_ms += frame_ms - self.max_frame_ms
+            frame_ms = self.max_frame_ms
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_ms